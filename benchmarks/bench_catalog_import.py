@@ -0,0 +1,42 @@
+# benchmarks.bench_catalog_import.py
+"""
+Measures the cost of importing the product catalog in fresh interpreters.
+
+Run from the repository root:  python -m benchmarks.bench_catalog_import --runs 20
+"""
+import sys
+import json
+import argparse
+import statistics
+import subprocess
+
+PROBE = """
+import time
+start = time.perf_counter()
+import src.models as models
+imported = time.perf_counter()
+models.get_product_by_id('EMIT_L2A_RFL.001')
+first_lookup = time.perf_counter()
+models.PRODUCTS
+full_catalog = time.perf_counter()
+print((imported - start) * 1000, (first_lookup - imported) * 1000, (full_catalog - first_lookup) * 1000)
+"""
+
+def run(runs: int) -> dict:
+    """Runs the probe in `runs` fresh interpreters and returns the median timings in milliseconds."""
+    samples = []
+    for _ in range(runs):
+        output = subprocess.run([sys.executable, '-c', PROBE], capture_output=True, text=True, check=True).stdout
+        samples.append([float(value) for value in output.split()])
+    import_ms, first_lookup_ms, full_catalog_ms = (statistics.median(column) for column in zip(*samples))
+    return {
+        "runs": runs,
+        "import_ms": round(import_ms, 3),
+        "first_product_lookup_ms": round(first_lookup_ms, 3),
+        "full_catalog_ms": round(full_catalog_ms, 3),
+    }
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--runs', type=int, default=10)
+    print(json.dumps(run(parser.parse_args().runs), indent=2))
@@ -0,0 +1,59 @@
+# benchmarks.bench_download.py
+"""
+Measures download throughput of FileManager from the mock server, for several numbers of concurrent downloads.
+
+Run from the repository root:  python -m benchmarks.bench_download --files 16 --raster-size 1024 --bandwidth 20000000
+"""
+import os
+import json
+import time
+import argparse
+import tempfile
+from datetime import datetime, timedelta
+from concurrent.futures import ThreadPoolExecutor
+
+from src.appeears_client.mock_server import MockAppEEARSServer
+from .common import client, quiet, square
+
+def run(files: int = 16, raster_size: int = 1024, concurrency: tuple = (1, 2, 4, 8), bandwidth: float = None, latency: float = 0.0) -> dict:
+    """
+    Downloads the `files` GeoTIFFs of one area task at each concurrency level and returns the MB/s reached.
+
+    :param bandwidth: Per-connection throughput of the server in bytes per second, unlimited if None.
+    """
+    with MockAppEEARSServer(max_raster_size=raster_size, bandwidth=bandwidth, latency=latency) as server:
+        api = client(server)
+        start_date = datetime(2020, 1, 1)
+        with quiet():
+            listing = api.task_orchestrator.execute_and_retrieve_area_task(
+                geo_json=square(-60.0, -20.0, raster_size * 0.01), product_id='MOD11A1.061', band_names=['LST_Day_1km'],
+                start_date=start_date, end_date=start_date + timedelta(days=files - 1)
+            )
+        task_id = next(iter(server.tasks))
+        tifs = [file for file in listing if file['file_name'].endswith('.tif')]
+        # Render the rasters up front, so that only the transfer is measured
+        size = sum(len(server.file_content(task_id, file['file_id'])[1]) for file in tifs)
+
+        results = []
+        for workers in concurrency:
+            with tempfile.TemporaryDirectory() as destination, quiet(), ThreadPoolExecutor(max_workers=workers) as executor:
+                start = time.perf_counter()
+                list(executor.map(
+                    lambda file: api.file_manager.download_and_process_file(task_id, file['file_id'], file['file_name'], destination_dir=destination),
+                    tifs
+                ))
+                seconds = time.perf_counter() - start
+                downloaded = sum(os.path.getsize(os.path.join(destination, file['file_name'])) for file in tifs)
+            results.append({"workers": workers, "seconds": round(seconds, 3), "mb_per_s": round(downloaded / seconds / 1e6, 2)})
+        api.close()
+    return {"files": len(tifs), "total_mb": round(size / 1e6, 2), "bandwidth_bytes_per_s": bandwidth, "results": results}
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--files', type=int, default=16)
+    parser.add_argument('--raster-size', type=int, default=1024)
+    parser.add_argument('--concurrency', type=int, nargs='+', default=[1, 2, 4, 8])
+    parser.add_argument('--bandwidth', type=float, default=None)
+    parser.add_argument('--latency', type=float, default=0.0)
+    arguments = parser.parse_args()
+    print(json.dumps(run(arguments.files, arguments.raster_size, tuple(arguments.concurrency), arguments.bandwidth, arguments.latency), indent=2))
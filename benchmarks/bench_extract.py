@@ -0,0 +1,57 @@
+# benchmarks.bench_extract.py
+"""
+Measures pixel extraction from synthetic GeoTIFFs: pixels per second and peak RSS, for several tile sizes.
+
+Every size runs in a fresh interpreter, so that its peak RSS is not inflated by the previous ones. The default
+sizes are those of real files: 3660 pixels is the side of an HLS tile, whose extraction takes minutes and gigabytes.
+
+Run from the repository root:  python -m benchmarks.bench_extract --sizes 1024 3660
+"""
+import sys
+import json
+import argparse
+import subprocess
+
+PROBE = """
+import os, sys, json, time, tempfile
+import numpy as np
+import rasterio
+from rasterio.transform import from_bounds
+from benchmarks.common import peak_rss_mb
+from src.appeears_client.file_management import FileManager
+
+size = int(sys.argv[1])
+baseline_rss = peak_rss_mb()
+with tempfile.TemporaryDirectory() as directory:
+    file_name = 'HLSL30.020_B04_doy2020001_aid0001.tif'
+    path = os.path.join(directory, file_name)
+    profile = {'driver': 'GTiff', 'width': size, 'height': size, 'count': 1, 'dtype': 'int16', 'crs': 'EPSG:4326',
+               'transform': from_bounds(-60, -20, -60 + size * 0.0003, -20 + size * 0.0003, size, size)}
+    with rasterio.open(path, 'w', **profile) as dataset:
+        dataset.write(np.random.default_rng(size).integers(0, 10000, (size, size), dtype='int16'), 1)
+    start = time.perf_counter()
+    points = FileManager(token='benchmark').extract_info_and_coordinates_from_tif(file_name, path)
+    seconds = time.perf_counter() - start
+print(json.dumps({'pixels': len(points), 'seconds': seconds, 'peak_rss_mb': peak_rss_mb(), 'baseline_rss_mb': baseline_rss}))
+"""
+
+def run(sizes: tuple = (1024, 3660)) -> dict:
+    """Extracts a size x size GeoTIFF for each size and returns the pixels per second and peak RSS."""
+    results = []
+    for size in sizes:
+        output = subprocess.run([sys.executable, '-c', PROBE, str(size)], capture_output=True, text=True, check=True).stdout
+        sample = json.loads(output.strip().splitlines()[-1])
+        results.append({
+            "tile_size": size,
+            "pixels": sample['pixels'],
+            "seconds": round(sample['seconds'], 3),
+            "pixels_per_s": round(sample['pixels'] / sample['seconds']),
+            "peak_rss_mb": round(sample['peak_rss_mb'], 1),
+            "rss_growth_mb": round(sample['peak_rss_mb'] - sample['baseline_rss_mb'], 1),
+        })
+    return {"results": results}
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--sizes', type=int, nargs='+', default=[1024, 3660])
+    print(json.dumps(run(tuple(parser.parse_args().sizes)), indent=2))
@@ -0,0 +1,52 @@
+# benchmarks.bench_poll.py
+"""
+Counts the requests the orchestrator sends to follow tasks from submission to their file listing.
+
+Run from the repository root:  python -m benchmarks.bench_poll --tasks 8 --queue-time 1 --processing-time 1
+"""
+import json
+import time
+import argparse
+from datetime import datetime
+
+from src.appeears_client.mock_server import MockAppEEARSServer
+from .common import client, quiet
+
+def run(tasks: int = 8, queue_time: float = 1.0, processing_time: float = 1.0, poll_interval: float = 0.2) -> dict:
+    """Runs `tasks` point tasks concurrently to completion and returns the requests received by endpoint class."""
+    with MockAppEEARSServer(queue_time=queue_time, processing_time=processing_time) as server:
+        api = client(server, poll_interval=poll_interval)
+        start = time.perf_counter()
+        with quiet():
+            futures = [
+                api.submit_point_task(
+                    latitude=-10 + index * 0.001, longitude=-50.0, product_id='MOD11A1.061', band_names=['LST_Day_1km'],
+                    start_date=datetime(2020, 1, 1), end_date=datetime(2020, 1, 31)
+                )
+                for index in range(tasks)
+            ]
+            completed = sum(1 for future in futures if future.result())
+        seconds = time.perf_counter() - start
+        api.close()
+        counts = dict(server.request_counts)
+    counts.pop('auth', None)
+    return {
+        "tasks": tasks,
+        "completed": completed,
+        "queue_time_s": queue_time,
+        "processing_time_s": processing_time,
+        "poll_interval_s": poll_interval,
+        "seconds": round(seconds, 3),
+        "requests": counts,
+        "requests_per_task": round(sum(counts.values()) / tasks, 2),
+        "status_requests_per_task": round(counts.get('status', 0) / tasks, 2),
+    }
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--tasks', type=int, default=8)
+    parser.add_argument('--queue-time', type=float, default=1.0)
+    parser.add_argument('--processing-time', type=float, default=1.0)
+    parser.add_argument('--poll-interval', type=float, default=0.2)
+    arguments = parser.parse_args()
+    print(json.dumps(run(arguments.tasks, arguments.queue_time, arguments.processing_time, arguments.poll_interval), indent=2))
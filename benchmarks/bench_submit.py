@@ -0,0 +1,49 @@
+# benchmarks.bench_submit.py
+"""
+Measures task submission throughput against the mock server, for several numbers of concurrent submitters.
+
+Run from the repository root:  python -m benchmarks.bench_submit --tasks 200 --latency 0.01
+"""
+import json
+import time
+import argparse
+from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+
+from src.appeears_client.mock_server import MockAppEEARSServer
+from .common import client, quiet
+
+def run(tasks: int = 200, workers: tuple = (1, 4, 16), latency: float = 0.01) -> dict:
+    """Submits `tasks` point tasks with each number of workers and returns the tasks submitted per second."""
+    results = []
+    for worker_count in workers:
+        with MockAppEEARSServer(latency=latency) as server:
+            api = client(server)
+            task_manager = api.task_manager
+            params = [
+                task_manager.build_point_task_params(
+                    latitude=-10 + index * 0.001, longitude=-50.0, product_id='MOD11A1.061', band_names=['LST_Day_1km'],
+                    start_date=datetime(2020, 1, 1), end_date=datetime(2020, 1, 31)
+                )
+                for index in range(tasks)
+            ]
+            start = time.perf_counter()
+            with quiet(), ThreadPoolExecutor(max_workers=worker_count) as executor:
+                responses = list(executor.map(lambda task_params: task_manager.submit_task(task_params, reuse_existing=False), params))
+            seconds = time.perf_counter() - start
+            api.close()
+        results.append({
+            "workers": worker_count,
+            "seconds": round(seconds, 3),
+            "tasks_per_s": round(tasks / seconds, 1),
+            "failed": sum(1 for response in responses if 'task_id' not in response),
+        })
+    return {"tasks": tasks, "latency_s": latency, "results": results}
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--tasks', type=int, default=200)
+    parser.add_argument('--workers', type=int, nargs='+', default=[1, 4, 16])
+    parser.add_argument('--latency', type=float, default=0.01)
+    arguments = parser.parse_args()
+    print(json.dumps(run(arguments.tasks, tuple(arguments.workers), arguments.latency), indent=2))
@@ -0,0 +1,28 @@
+# benchmarks.common.py
+"""Helpers shared by the benchmarks: clients pointed at a mock server, synthetic inputs and resource probes."""
+import os
+import sys
+import resource
+import contextlib
+
+from src.appeears import APIClient
+
+def square(min_lon: float, min_lat: float, size: float) -> dict:
+    """Returns a GeoJSON FeatureCollection holding a square of `size` degrees."""
+    ring = [[min_lon, min_lat], [min_lon + size, min_lat], [min_lon + size, min_lat + size], [min_lon, min_lat + size], [min_lon, min_lat]]
+    return {"type": "FeatureCollection", "features": [{"type": "Feature", "properties": {}, "geometry": {"type": "Polygon", "coordinates": [ring]}}]}
+
+def client(server, **kwargs) -> APIClient:
+    """Returns a client logged in to a running MockAppEEARSServer."""
+    return APIClient(username='bench', password='bench', base_url=server.base_url, **kwargs)
+
+@contextlib.contextmanager
+def quiet():
+    """Silences the progress output of the client while a benchmark runs."""
+    with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull), contextlib.redirect_stderr(devnull):
+        yield
+
+def peak_rss_mb() -> float:
+    """Peak resident set size of the current process, in MiB."""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / (1024 * 1024) if sys.platform == 'darwin' else peak / 1024
@@ -0,0 +1,73 @@
+# benchmarks.compare.py
+"""
+Compares two JSON result files of benchmarks.run_all, metric by metric.
+
+Run from the repository root:  python -m benchmarks.compare baseline.json current.json
+"""
+import json
+import argparse
+
+# Metrics for which a larger value is better, all the others are better when smaller
+HIGHER_IS_BETTER = ('tasks_per_s', 'mb_per_s', 'pixels_per_s')
+
+# Keys identifying the entries of a "results" list, so that the same configuration is compared across runs
+CONFIGURATION_KEYS = ('workers', 'tile_size')
+
+# Numbers describing the workload of a benchmark rather than measuring it, never compared
+SETTINGS = (
+    'runs', 'tasks', 'files', 'pixels', 'completed', 'total_mb',
+    'latency_s', 'queue_time_s', 'processing_time_s', 'poll_interval_s', 'bandwidth_bytes_per_s',
+)
+
+def _flatten(results: dict, prefix: str = '') -> dict:
+    """Flattens nested results into {'download.workers=4.mb_per_s': 52.3, ...}, keeping measured numbers only."""
+    flat = {}
+    for key, value in results.items():
+        path = f"{prefix}{key}"
+        if isinstance(value, dict):
+            flat.update(_flatten(value, f"{path}."))
+        elif isinstance(value, list):
+            for entry in value:
+                if isinstance(entry, dict):
+                    label = ','.join(f"{name}={entry[name]}" for name in CONFIGURATION_KEYS if name in entry)
+                    numbers = {name: number for name, number in entry.items() if name not in CONFIGURATION_KEYS}
+                    flat.update(_flatten(numbers, f"{prefix}{label}." if label else f"{path}."))
+        elif isinstance(value, (int, float)) and not isinstance(value, bool) and key not in SETTINGS:
+            flat[path] = value
+    return flat
+
+def compare(baseline: dict, current: dict) -> list:
+    """
+    Returns (metric, baseline, current, relative change, improved) rows for the metrics both runs measured.
+
+    The relative change is (current - baseline) / baseline, None when the baseline is 0.
+    """
+    before = _flatten({name: value for name, value in baseline.items() if name != 'meta'})
+    after = _flatten({name: value for name, value in current.items() if name != 'meta'})
+    rows = []
+    for metric in sorted(before.keys() & after.keys()):
+        old, new = before[metric], after[metric]
+        change = (new - old) / old if old else None
+        higher_is_better = metric.rsplit('.', 1)[-1] in HIGHER_IS_BETTER
+        improved = None if change is None or change == 0 else (change > 0) == higher_is_better
+        rows.append((metric, old, new, change, improved))
+    return rows
+
+def format_comparison(rows: list) -> str:
+    lines = [f"{'metric':<55} {'baseline':>12} {'current':>12} {'change':>9}"]
+    for metric, old, new, change, improved in rows:
+        change_text = 'n/a' if change is None else f"{change:+.1%}"
+        marker = '' if improved is None else (' better' if improved else ' worse')
+        lines.append(f"{metric:<55} {old:>12g} {new:>12g} {change_text:>9}{marker}")
+    return '\n'.join(lines)
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('baseline')
+    parser.add_argument('current')
+    arguments = parser.parse_args()
+    with open(arguments.baseline, 'r', encoding='utf-8') as f:
+        baseline = json.load(f)
+    with open(arguments.current, 'r', encoding='utf-8') as f:
+        current = json.load(f)
+    print(format_comparison(compare(baseline, current)))
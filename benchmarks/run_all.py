@@ -0,0 +1,74 @@
+# benchmarks.run_all.py
+"""
+Runs every benchmark and saves the results as JSON, optionally comparing them with an earlier run.
+
+Run from the repository root:  python -m benchmarks.run_all --output results.json [--baseline previous.json] [--quick]
+"""
+import sys
+import json
+import time
+import argparse
+import platform
+import subprocess
+
+from . import bench_catalog_import, bench_download, bench_extract, bench_poll, bench_submit
+from .compare import compare, format_comparison
+
+FULL = {
+    'catalog_import': lambda: bench_catalog_import.run(runs=10),
+    'submit': lambda: bench_submit.run(tasks=200, workers=(1, 4, 16)),
+    'poll': lambda: bench_poll.run(tasks=8, queue_time=1.0, processing_time=1.0),
+    'download': lambda: bench_download.run(files=16, raster_size=1024, concurrency=(1, 2, 4, 8)),
+    'extract': lambda: bench_extract.run(sizes=(1024, 3660)),
+}
+
+QUICK = {
+    'catalog_import': lambda: bench_catalog_import.run(runs=3),
+    'submit': lambda: bench_submit.run(tasks=30, workers=(1, 8)),
+    'poll': lambda: bench_poll.run(tasks=4, queue_time=0.3, processing_time=0.3, poll_interval=0.1),
+    'download': lambda: bench_download.run(files=4, raster_size=256, concurrency=(1, 4)),
+    'extract': lambda: bench_extract.run(sizes=(128, 256)),
+}
+
+def _commit() -> str:
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+def run(quick: bool = False, only: list = None) -> dict:
+    """Runs the benchmarks, all of them unless `only` names some, and returns their results with the run's context."""
+    suite = QUICK if quick else FULL
+    results = {
+        "meta": {
+            "commit": _commit(),
+            "started_at": time.strftime('%Y-%m-%dT%H:%M:%S'),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "quick": quick,
+        }
+    }
+    for name, benchmark in suite.items():
+        if only and name not in only:
+            continue
+        print(f"Running {name}...", file=sys.stderr)
+        results[name] = benchmark()
+    return results
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--output', help="Path of the JSON file to write, the results are printed otherwise")
+    parser.add_argument('--baseline', help="JSON file of an earlier run to compare the results with")
+    parser.add_argument('--quick', action='store_true', help="Use small sizes, for a smoke run")
+    parser.add_argument('--only', nargs='+', choices=sorted(FULL), help="Benchmarks to run")
+    arguments = parser.parse_args()
+
+    results = run(quick=arguments.quick, only=arguments.only)
+    if arguments.output:
+        with open(arguments.output, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2)
+    else:
+        print(json.dumps(results, indent=2))
+    if arguments.baseline:
+        with open(arguments.baseline, 'r', encoding='utf-8') as f:
+            print(format_comparison(compare(json.load(f), results)))
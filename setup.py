@@ -5,6 +5,7 @@ setup(
     name='appeears-api-client',
     version='0.1.2',
     packages=find_packages(),
+    package_data={'src': ['data/*.json']},
     license='MIT',
     description='Python client for interacting with NASA Earthdata\'s AppEEARS API',
     long_description=open('README.md').read(),
@@ -4,35 +4,117 @@ from datetime import datetime
 from .appeears_client.auth import AppEEARSClient
 from .appeears_client.file_management import FileManager
 from .appeears_client.task_management import TaskManagement
+from .appeears_client.task_registry import TaskRegistry
+from .appeears_client.task_store import TaskStore
 from .appeears_client.task_orchestrator import TaskOrchestrator
+from .appeears_client.futures import TaskFuture
+from .appeears_client.estimation import TaskEstimate, estimate_area_task, estimate_point_task
 from .appeears_client.product_management import ProductManagement
+from .appeears_client.response_cache import ResponseCache
+from .appeears_client.token_cache import TokenCache
+from .appeears_client.transport import Transport
+from .appeears_client.retry import RetryPolicy
+from .appeears_client.rate_limit import RateLimiter
+from .appeears_client.instrumentation import Instrumentation
+from .appeears_client.progress import ProgressReporter
+from .appeears_client.credential_pool import CredentialPool
 
 class APIClient:
-    def __init__(self, username: str, password: str):
-        self.client = AppEEARSClient(username=username, password=password)
-        self.token = self.client.token
-        self.product_manager = ProductManagement(token=self.token)
-        self.task_manager = TaskManagement(token=self.token)
-        self.file_manager = FileManager(token=self.token)
-        self.task_orchestrator = TaskOrchestrator(token=self.token)
+    """
+    Client of the AppEEARS API, safe to share between threads: one client per process serves all of them.
+
+    The managers are created once and never replaced. They send their requests through one shared transport,
+    which pools connections in a session recreated after os.fork, and swaps the token atomically when it
+    has to log in again.
+    """
+
+    def __init__(
+            self,
+            username: str,
+            password: str,
+            task_registry: TaskRegistry = None,
+            task_store: TaskStore = None,
+            product_cache: ResponseCache = None,
+            max_task_bytes: int = None,
+            oversize: str = "reject",
+            token_cache: TokenCache = None,
+            credential_pool: CredentialPool = None,
+            retry_policy: RetryPolicy = None,
+            rate_limiter: RateLimiter = None,
+            base_url: str = None,
+            poll_interval: float = 10,
+            instrumentation: Instrumentation = None,
+            progress: ProgressReporter = None
+        ):
+        """
+        :param username: NASA Earthdata username.
+        :param password: NASA Earthdata password.
+        :param task_registry: Optional local registry of submitted tasks, used to reuse the tasks of repeated requests.
+        :param task_store: Optional durable store of orchestrated jobs, used to reattach to them after a restart.
+        :param product_cache: Optional on-disk cache of product and layer metadata.
+        :param max_task_bytes: Optional limit on the estimated output size of a single task.
+        :param oversize: 'reject' requests estimated above max_task_bytes, or 'split' them by date.
+        :param token_cache: Optional on-disk token cache shared across processes, to reuse a valid token instead of logging in.
+        :param credential_pool: Optional pool of accounts the orchestrated tasks are spread over.
+        :param retry_policy: Retry policy of the requests, defaults to RetryPolicy(). Its metrics count the retries.
+        :param rate_limiter: Optional client-side rate limits by endpoint class, shared by all threads of the client.
+        :param base_url: Root of the API, defaults to config.base_url. Point it at a MockAppEEARSServer to work offline.
+        :param poll_interval: Seconds between two status checks of a running task.
+        :param instrumentation: Optional receiver of the measurements of every request and pipeline stage,
+            e.g. a HistogramInstrumentation.
+        :param progress: Receiver of the progress of running tasks. Defaults to progress bars when stderr is a
+            terminal, and to silence in non-interactive runs.
+        """
+        self.client = AppEEARSClient(username=username, password=password, token_cache=token_cache, base_url=base_url)
+        # Every manager sends its requests through this transport, which logs in again when the token expires
+        self.transport = Transport(self.client, retry_policy=retry_policy, rate_limiter=rate_limiter, instrumentation=instrumentation)
+        self.task_registry = task_registry
+        self.task_store = task_store
+        self.product_cache = product_cache
+        self.max_task_bytes = max_task_bytes
+        self.oversize = oversize
+        self.credential_pool = credential_pool
+        self.product_manager = ProductManagement(cache=self.product_cache, transport=self.transport)
+        self.task_manager = TaskManagement(
+            registry=self.task_registry, transport=self.transport, poll_interval=poll_interval, progress=progress
+        )
+        self.file_manager = FileManager(transport=self.transport)
+        self.task_orchestrator = TaskOrchestrator(
+            registry=self.task_registry, task_store=self.task_store,
+            max_task_bytes=self.max_task_bytes, oversize=self.oversize, transport=self.transport,
+            credential_pool=self.credential_pool, poll_interval=poll_interval, progress=self.task_manager.progress
+        )
+
+    @property
+    def token(self) -> str:
+        return self.client.token
 
     def login(self):
-        self.token = self.client.login()
-        self.refresh_clients()
+        """Logs in again. The managers share the client's token, so they pick up the new one."""
+        self.client.login()
 
     def logout(self):
         self.client.logout()
 
     def refresh_clients(self):
-        """Refresh internal client instances with new token if it was updated."""
-        self.product_manager = ProductManagement(token=self.token)
-        self.task_manager = TaskManagement(token=self.token)
-        self.file_manager = FileManager(token=self.token)
-        self.task_orchestrator = TaskOrchestrator(token=self.token)
+        """Kept for backwards compatibility: the managers read the shared token, there is nothing to refresh."""
+
+    def close(self):
+        """Stops the background task executor and closes the pooled connections."""
+        self.task_orchestrator.shutdown()
+        self.transport.close()
 
     def get_product_info(self, product_id: str):
         return self.product_manager.get_product(product_id)
 
+    def estimate_point_task(self, **kwargs) -> TaskEstimate:
+        """Estimates the number of files, pixels and bytes of a point task, without any API call."""
+        return estimate_point_task(**kwargs)
+
+    def estimate_area_task(self, **kwargs) -> TaskEstimate:
+        """Estimates the number of files, pixels and bytes of an area task, without any API call."""
+        return estimate_area_task(**kwargs)
+
     def submit_and_retrieve_point_task(
             self, 
             latitude: float, 
@@ -40,7 +122,8 @@ class APIClient:
             product_id: str, 
             band_names: list, 
             start_date: datetime,  
-            end_date: datetime
+            end_date: datetime,
+            num_slices: int = 1
         ):
         
         result = self.task_orchestrator.execute_and_retrieve_point_task(
@@ -49,7 +132,8 @@ class APIClient:
                     product_id=product_id, 
                     band_names=band_names, 
                     start_date=start_date, 
-                    end_date=end_date
+                    end_date=end_date,
+                    num_slices=num_slices
                 )
         return result
     
@@ -59,7 +143,8 @@ class APIClient:
             product_id: str, 
             band_names: list, 
             start_date: datetime,  
-            end_date: datetime
+            end_date: datetime,
+            num_slices: int = 1
         ):
         """
         Submits an area task and retrieves the result.
@@ -69,12 +154,61 @@ class APIClient:
         :param band_names: List of band names to retrieve.
         :param start_date: Start date of the data retrieval period.
         :param end_date: End date of the data retrieval period.
+        :param num_slices: Number of parallel tasks the date range is split into, aligned to the product's compositing period.
         """
         result = self.task_orchestrator.execute_and_retrieve_area_task(
             geo_json=geo_json,
             product_id=product_id,
             band_names=band_names,
             start_date=start_date,
-            end_date=end_date
+            end_date=end_date,
+            num_slices=num_slices
+        )
+        return result
+
+    def submit_and_retrieve_tiled_area_task(
+            self,
+            geo_json: dict,
+            product_id: str,
+            band_names: list,
+            start_date: datetime,
+            end_date: datetime,
+            destination_dir: str,
+            target_pixels: int = 10_000_000,
+            strategy: str = "grid"
+        ):
+        """
+        Splits a large area into tiles submitted as parallel tasks and mosaics the results locally.
+
+        :param geo_json: GeoJSON dictionary defining the area.
+        :param product_id: Product ID for the data retrieval.
+        :param band_names: List of band names to retrieve.
+        :param start_date: Start date of the data retrieval period.
+        :param end_date: End date of the data retrieval period.
+        :param destination_dir: Directory where the mosaicked GeoTIFFs are written.
+        :param target_pixels: Maximum number of pixels per tile, per layer and date.
+        :param strategy: 'grid' to cut a regular grid, 'features' to split along feature boundaries first.
+        """
+        return self.task_orchestrator.execute_and_retrieve_tiled_area_task(
+            geo_json=geo_json,
+            product_id=product_id,
+            band_names=band_names,
+            start_date=start_date,
+            end_date=end_date,
+            destination_dir=destination_dir,
+            target_pixels=target_pixels,
+            strategy=strategy
         )
-        return result
\ No newline at end of file
+
+    def submit_point_task(self, **kwargs) -> TaskFuture:
+        """
+        Non-blocking variant of submit_and_retrieve_point_task, returning a TaskFuture right away.
+
+        Use result(timeout), done() and add_done_callback() on it, or the wait and as_completed
+        helpers of src.appeears_client.futures over many of them.
+        """
+        return self.task_orchestrator.submit_point_task(**kwargs)
+
+    def submit_area_task(self, **kwargs) -> TaskFuture:
+        """Non-blocking variant of submit_and_retrieve_area_task, returning a TaskFuture right away."""
+        return self.task_orchestrator.submit_area_task(**kwargs)
\ No newline at end of file
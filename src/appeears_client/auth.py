@@ -1,24 +1,69 @@
 # src.appeears_client.auth.py
+import time
 import requests
-from .config import base_url
+from datetime import datetime
+from .token_cache import TokenCache
+from .transport import CredentialProvider
 from ..exceptions import LoginError, RequestError
 
-class AppEEARSClient:
-    def __init__(self, username: str, password: str):
-        self.token = self.login(username=username, password=password)
-        self.base_url = base_url
+# AppEEARS tokens are valid for 48 hours, used when a login response does not state the expiration
+DEFAULT_TOKEN_LIFETIME = 48 * 3600
 
-    def login(self, username: str, password: str) -> str:
-        """Log in and return a token."""
-        response = requests.post(f"{base_url}/login", auth=(username, password))
-        if response.status_code == 200:
-            return response.json()['token']
+class AppEEARSClient(CredentialProvider):
+    """Logs in to AppEEARS and provides the token of a session, logging in again when the token is rejected."""
+
+    def __init__(self, username: str, password: str, token_cache: TokenCache = None, base_url: str = None):
+        """
+        :param username: NASA Earthdata username.
+        :param password: NASA Earthdata password.
+        :param token_cache: Optional on-disk token cache, a valid cached token is reused instead of logging in.
+        :param base_url: Root of the API, defaults to config.base_url.
+        """
+        super().__init__(base_url=base_url)
+        self.username = username
+        self._password = password
+        self.token_cache = token_cache
+        self.expires_at = None
+        if token_cache is not None:
+            self.token = token_cache.get_or_login(username, lambda: self._login(username, password), api_url=self.base_url)
         else:
+            self.token = self.login(username=username, password=password)
+
+    def _login(self, username: str, password: str) -> tuple:
+        """Logs in and returns a (token, expires_at) pair, expires_at being in epoch seconds."""
+        response = requests.post(f"{self.base_url}/login", auth=(username, password))
+        if response.status_code != 200:
             raise LoginError("Failed to log in to AppEEARS API")
-    
+        body = response.json()
+        try:
+            expires_at = datetime.fromisoformat(body['expiration'].replace('Z', '+00:00')).timestamp()
+        except (KeyError, AttributeError, ValueError):
+            expires_at = time.time() + DEFAULT_TOKEN_LIFETIME
+        return body['token'], expires_at
+
+    def login(self, username: str = None, password: str = None) -> str:
+        """Log in and return a token. Defaults to the credentials the client was created with."""
+        username = username or self.username
+        password = password or self._password
+        with self._refresh_lock:
+            token, self.expires_at = self._login(username, password)
+            if self.token_cache is not None:
+                self.token_cache.put(username, token, self.expires_at, api_url=self.base_url)
+            self.token = token
+        return token
+
+    def _new_token(self) -> str:
+        """Logs in again after the token was rejected, through the token cache so that other processes share it."""
+        if self.token_cache is not None:
+            self.token_cache.remove(self.username, token=self.token, api_url=self.base_url)
+            return self.token_cache.get_or_login(self.username, lambda: self._login(self.username, self._password), api_url=self.base_url)
+        return self.login()
+
     def logout(self):
-        """Logs out of the API."""
+        """Logs out of the API. The token is revoked, so it is removed from the token cache as well."""
         headers = {'Authorization': f'Bearer {self.token}'}
         response = requests.post(f"{self.base_url}/logout", headers=headers)
+        if self.token_cache is not None:
+            self.token_cache.remove(self.username, token=self.token, api_url=self.base_url)
         if response.status_code != 204:
             raise RequestError("Failed to log out")
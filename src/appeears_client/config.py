@@ -1,2 +1,7 @@
 # src.appeears_client.config.py
-base_url = "https://appeears.earthdatacloud.nasa.gov/api"
\ No newline at end of file
+import os
+
+DEFAULT_BASE_URL = "https://appeears.earthdatacloud.nasa.gov/api"
+
+# Default root of the API, overridable with APPEEARS_BASE_URL, e.g. to point every client at a mock server
+base_url = os.environ.get('APPEEARS_BASE_URL', DEFAULT_BASE_URL).rstrip('/')
@@ -0,0 +1,183 @@
+# src.appeears_client.credential_pool.py
+import time
+import logging
+import threading
+from typing import Dict, List, Optional
+
+import requests
+
+from .auth import AppEEARSClient
+from .token_cache import TokenCache
+from .retry import RetryPolicy
+from .rate_limit import RateLimiter
+from .instrumentation import Instrumentation
+from .transport import CredentialProvider, Transport
+
+logger = logging.getLogger(__name__)
+
+# Task statuses that take up one of the concurrent task slots of an account
+ACTIVE_STATUSES = ('queued', 'pending', 'processing')
+
+class Account:
+    """One set of Earthdata credentials of a pool, with its transport and the tasks it currently runs."""
+
+    def __init__(
+            self,
+            credentials: CredentialProvider,
+            max_tasks: int,
+            name: str = None,
+            retry_policy: RetryPolicy = None,
+            rate_limiter: RateLimiter = None,
+            instrumentation: Instrumentation = None
+        ):
+        """
+        :param credentials: Provider of the account's token.
+        :param max_tasks: Number of tasks the account may have in flight at once.
+        :param name: Name of the account, stored with its tasks. Defaults to the username.
+        :param retry_policy: Retry policy of the account's requests, defaults to RetryPolicy().
+        :param rate_limiter: Optional client-side rate limits of the account's requests.
+        :param instrumentation: Optional receiver of the measurements of the account's requests.
+        """
+        self.credentials = credentials
+        self.transport = Transport(credentials, retry_policy=retry_policy, rate_limiter=rate_limiter, instrumentation=instrumentation)
+        self.max_tasks = max_tasks
+        self.name = name or getattr(credentials, 'username', None) or f"account-{id(self)}"
+        self.in_flight = set()  # task_ids submitted through this pool and not finished yet
+        self.reserved = 0       # slots taken by submissions whose task_id is not known yet
+        self.external = 0       # active tasks of the account submitted by other clients
+
+    @property
+    def free_capacity(self) -> int:
+        return self.max_tasks - len(self.in_flight) - self.reserved - self.external
+
+    def __repr__(self):
+        return f"<Account {self.name} free={self.free_capacity}/{self.max_tasks}>"
+
+class CredentialPool:
+    """
+    Spreads task submissions over several Earthdata accounts, each limited in concurrent tasks by the server.
+
+    A submission goes to the account with the most free capacity, waiting for a slot when all are busy.
+    The pool remembers the owner of every task, so that its polling and downloads use the same account.
+    """
+
+    def __init__(
+            self,
+            credentials: List[CredentialProvider],
+            max_tasks_per_account: int = 10,
+            retry_policy: RetryPolicy = None,
+            rate_limiter: RateLimiter = None,
+            instrumentation: Instrumentation = None
+        ):
+        """
+        :param credentials: Providers of the tokens of the accounts, e.g. logged in AppEEARSClient instances.
+        :param max_tasks_per_account: Number of tasks each account may have in flight at once.
+        :param retry_policy: Retry policy shared by the transports of the accounts, defaults to RetryPolicy().
+        :param rate_limiter: Optional client-side rate limits shared by the accounts, capping their combined traffic.
+        :param instrumentation: Optional receiver of the measurements of the requests of every account.
+        """
+        if not credentials:
+            raise ValueError("A credential pool needs at least one account")
+        retry_policy = retry_policy if retry_policy is not None else RetryPolicy()
+        self.accounts = [
+            Account(provider, max_tasks_per_account, retry_policy=retry_policy, rate_limiter=rate_limiter, instrumentation=instrumentation)
+            for provider in credentials
+        ]
+        self._by_name = {account.name: account for account in self.accounts}
+        if len(self._by_name) != len(self.accounts):
+            raise ValueError("The accounts of a credential pool must have distinct names")
+        self._owners: Dict[str, Account] = {}
+        self._condition = threading.Condition()
+
+    @classmethod
+    def from_credentials(
+            cls,
+            credentials: list,
+            token_cache: TokenCache = None,
+            max_tasks_per_account: int = 10,
+            base_url: str = None
+        ) -> 'CredentialPool':
+        """
+        Logs in to every account of a list of (username, password) pairs and returns their pool.
+
+        :param token_cache: Optional on-disk token cache, reused tokens save a login per account.
+        :param base_url: Root of the API, defaults to config.base_url.
+        """
+        clients = [
+            AppEEARSClient(username=username, password=password, token_cache=token_cache, base_url=base_url)
+            for username, password in credentials
+        ]
+        return cls(clients, max_tasks_per_account=max_tasks_per_account)
+
+    def account(self, name: str) -> Account:
+        """Returns an account by name, raising KeyError if it is not in the pool."""
+        return self._by_name[name]
+
+    def acquire(self, timeout: float = None) -> Account:
+        """
+        Reserves a task slot on the account with the most free capacity, waiting for one if needed.
+
+        The reservation must be followed by assign() once the task is submitted, or cancel() if it is not.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._condition:
+            while True:
+                account = max(self.accounts, key=lambda candidate: candidate.free_capacity)
+                if account.free_capacity > 0:
+                    account.reserved += 1
+                    return account
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    raise TimeoutError("No account of the pool has a free task slot")
+                self._condition.wait(remaining)
+
+    def assign(self, account: Account, task_id: str):
+        """Turns a reservation into a task in flight owned by the account."""
+        with self._condition:
+            account.reserved -= 1
+            account.in_flight.add(task_id)
+            self._owners[task_id] = account
+
+    def cancel(self, account: Account):
+        """Gives back a reservation whose submission failed."""
+        with self._condition:
+            account.reserved -= 1
+            self._condition.notify_all()
+
+    def adopt(self, task_id: str, name: str) -> Optional[Account]:
+        """Records the owner of a task submitted earlier, e.g. one reattached from the task store."""
+        account = self._by_name.get(name)
+        if account is not None:
+            with self._condition:
+                account.in_flight.add(task_id)
+                self._owners[task_id] = account
+        return account
+
+    def release(self, task_id: str):
+        """Frees the slot of a finished task. Its owner is kept, since its files are downloaded afterwards."""
+        with self._condition:
+            account = self._owners.get(task_id)
+            if account is not None and task_id in account.in_flight:
+                account.in_flight.discard(task_id)
+                self._condition.notify_all()
+
+    def owner(self, task_id: str) -> Optional[Account]:
+        """Returns the account owning a task, or None if the task is unknown to the pool."""
+        return self._owners.get(task_id)
+
+    def refresh_capacity(self):
+        """Counts the active tasks each account has that were not submitted through this pool."""
+        for account in self.accounts:
+            try:
+                response = account.transport.get(f"{account.transport.base_url}/task")
+            except requests.RequestException as e:
+                logger.warning("Could not list the tasks of account %s: %s", account.name, e)
+                continue
+            if response.status_code != 200:
+                continue
+            with self._condition:
+                account.external = sum(
+                    1 for task in response.json()
+                    if task.get('status') in ACTIVE_STATUSES and task.get('task_id') not in account.in_flight
+                )
+                self._condition.notify_all()
@@ -0,0 +1,145 @@
+# src.appeears_client.date_splitting.py
+import re
+from datetime import datetime, timedelta
+from typing import List, Optional, Tuple
+
+from ..models import get_temporal_granularity
+
+DOY_PATTERN = re.compile(r'doy(\d{7})')
+
+def _composite_starts(start_date: datetime, end_date: datetime, granularity: str) -> List[datetime]:
+    """
+    Lists the composite period start dates that fall strictly after start_date and up to end_date.
+
+    N-day composites restart on January 1st of every year, like the MODIS and VIIRS products do.
+    Granularities without a regular grid (sub-daily, static, varying) are treated as daily.
+    """
+    match = re.match(r'(\d+) day', granularity)
+    starts = []
+    if granularity == "Monthly":
+        year, month = start_date.year, start_date.month
+        while True:
+            month += 1
+            if month > 12:
+                year, month = year + 1, 1
+            boundary = datetime(year, month, 1)
+            if boundary > end_date:
+                break
+            starts.append(boundary)
+    elif granularity == "Yearly":
+        for year in range(start_date.year + 1, end_date.year + 1):
+            starts.append(datetime(year, 1, 1))
+    elif match:
+        period = int(match.group(1))
+        year = start_date.year
+        while datetime(year, 1, 1) <= end_date:
+            boundary = datetime(year, 1, 1)
+            while boundary.year == year and boundary <= end_date:
+                if boundary > start_date:
+                    starts.append(boundary)
+                boundary += timedelta(days=period)
+            year += 1
+    else:
+        day = start_date + timedelta(days=1)
+        while day <= end_date:
+            starts.append(day)
+            day += timedelta(days=1)
+    return starts
+
+def count_periods(start_date: datetime, end_date: datetime, granularity: str) -> int:
+    """
+    Counts the acquisitions or composites of a granularity that overlap a date range (inclusive).
+
+    Irregular acquisitions ('Varies') are counted as daily, which is an upper bound for them.
+    """
+    if end_date < start_date:
+        raise ValueError("end_date must not be earlier than start_date")
+    start_date = datetime(start_date.year, start_date.month, start_date.day)
+    end_date = datetime(end_date.year, end_date.month, end_date.day)
+    if granularity == "Static":
+        return 1
+    match = re.match(r'(\d+) (hour|year)', granularity)
+    if match and match.group(2) == 'hour':
+        return ((end_date - start_date).days + 1) * 24 // int(match.group(1))
+    if match:
+        period = int(match.group(1))
+        return 1 + sum(1 for year in range(start_date.year + 1, end_date.year + 1) if year % period == 0)
+    return 1 + len(_composite_starts(start_date, end_date, granularity))
+
+def period_starts(start_date: datetime, end_date: datetime, granularity: str) -> List[datetime]:
+    """
+    Lists the dates of the acquisitions or composites of a granularity that overlap a date range (inclusive),
+    the first one being start_date. Sub-daily granularities are listed by day.
+    """
+    if end_date < start_date:
+        raise ValueError("end_date must not be earlier than start_date")
+    start_date = datetime(start_date.year, start_date.month, start_date.day)
+    end_date = datetime(end_date.year, end_date.month, end_date.day)
+    if granularity == "Static":
+        return [start_date]
+    match = re.match(r'(\d+) year', granularity)
+    if match:
+        period = int(match.group(1))
+        return [start_date] + [datetime(year, 1, 1) for year in range(start_date.year + 1, end_date.year + 1) if year % period == 0]
+    return [start_date] + _composite_starts(start_date, end_date, granularity)
+
+def split_date_range(
+        start_date: datetime,
+        end_date: datetime,
+        num_slices: int,
+        product_id: Optional[str] = None,
+        granularity: Optional[str] = None
+    ) -> List[Tuple[datetime, datetime]]:
+    """
+    Splits a date range into at most num_slices contiguous sub-ranges aligned to the product's compositing period.
+
+    :param start_date: Start date of the full range.
+    :param end_date: End date of the full range (inclusive).
+    :param num_slices: Number of sub-ranges wanted.
+    :param product_id: Product whose compositing period is used to align the slice boundaries.
+    :param granularity: Explicit granularity (e.g. '8 day', 'Monthly'), overrides the product's one.
+    """
+    if num_slices < 1:
+        raise ValueError("num_slices must be at least 1")
+    if end_date < start_date:
+        raise ValueError("end_date must not be earlier than start_date")
+    if granularity is None:
+        granularity = get_temporal_granularity(product_id) if product_id else "Daily"
+
+    start_date = datetime(start_date.year, start_date.month, start_date.day)
+    end_date = datetime(end_date.year, end_date.month, end_date.day)
+    candidates = _composite_starts(start_date, end_date, granularity)
+
+    # Pick evenly spaced boundaries among the candidate composite starts
+    num_slices = min(num_slices, len(candidates) + 1)
+    segments = len(candidates) + 1
+    boundaries = [candidates[(i * segments) // num_slices - 1] for i in range(1, num_slices)]
+
+    slices = []
+    slice_start = start_date
+    for boundary in boundaries:
+        slices.append((slice_start, boundary - timedelta(days=1)))
+        slice_start = boundary
+    slices.append((slice_start, end_date))
+    return slices
+
+def file_sort_key(file_info: dict) -> tuple:
+    """Sort key placing dated bundle files in time order, followed by the undated ones (metadata, statistics)."""
+    match = DOY_PATTERN.search(file_info.get('file_name', ''))
+    if match:
+        return (0, match.group(1), file_info.get('file_name', ''))
+    return (1, '', file_info.get('file_name', ''))
+
+def merge_file_listings(listings: List[Tuple[str, list]]) -> list:
+    """
+    Merges the bundle listings of several sub-tasks into one time-ordered listing.
+
+    :param listings: Pairs of (task_id, files) as returned by TaskManagement.list_task_files.
+    Each merged entry carries the task_id of the bundle it belongs to, which is needed to download it.
+    """
+    merged = []
+    for task_id, files in listings:
+        for file_info in files or []:
+            merged.append({**file_info, 'task_id': task_id})
+    merged.sort(key=file_sort_key)
+    return merged
@@ -0,0 +1,84 @@
+# src.appeears_client.estimation.py
+from datetime import datetime
+from typing import NamedTuple
+
+from ..models import get_band_metadata
+from .date_splitting import count_periods
+from .spatial_tiling import estimate_pixel_count
+
+# Bytes per pixel of the GeoTIFF outputs, by AppEEARS data type
+DATA_TYPE_SIZES = {
+    'int8': 1, 'uint8': 1,
+    'int16': 2, 'uint16': 2,
+    'int32': 4, 'uint32': 4, 'float32': 4,
+    'int64': 8, 'uint64': 8, 'float64': 8,
+}
+DEFAULT_PIXEL_BYTES = 4     # Used for layers whose data type the catalog does not know
+POINT_VALUE_BYTES = 32      # Approximate size of one value in the CSV output of a point task
+
+class TaskEstimate(NamedTuple):
+    file_count: int   # Number of data files in the bundle, not counting metadata files
+    pixel_count: int  # Total number of pixels (area) or sampled values (point)
+    bytes: int        # Approximate uncompressed size of the data files
+    periods: int      # Largest number of dates of any layer, i.e. how finely the request can be split in time
+
+def estimate_task(task_params: dict) -> TaskEstimate:
+    """
+    Estimates the output of a task from the request body built by TaskManagement, without any API call.
+
+    Uses the bounding box of the area, the pixel size, temporal granularity and data type of every layer
+    from the catalog, and the date range. Raises ValueError if a layer is not in the catalog.
+    """
+    params = task_params['params']
+    is_area = task_params['task_type'] == 'area'
+    file_count = pixel_count = size = max_periods = 0
+    for layer in params['layers']:
+        metadata = get_band_metadata(layer['product'], layer['layer'])
+        periods = sum(
+            count_periods(
+                datetime.strptime(dates['startDate'], "%m-%d-%Y"),
+                datetime.strptime(dates['endDate'], "%m-%d-%Y"),
+                metadata['temporal_granularity']
+            )
+            for dates in params['dates']
+        )
+        max_periods = max(max_periods, periods)
+        if is_area:
+            pixels = estimate_pixel_count(params['geo'], metadata['pixel_size']) * periods
+            file_count += periods
+            pixel_count += pixels
+            size += pixels * DATA_TYPE_SIZES.get(metadata['data_type'], DEFAULT_PIXEL_BYTES)
+        else:
+            values = len(params['coordinates']) * periods
+            pixel_count += values
+            size += values * POINT_VALUE_BYTES
+    if not is_area:
+        # Point samples of every layer come back in a single CSV file
+        file_count = 1
+    return TaskEstimate(file_count=file_count, pixel_count=pixel_count, bytes=size, periods=max_periods)
+
+def _task_params(task_type: str, where: dict, product_id: str, band_names: list, start_date: datetime, end_date: datetime) -> dict:
+    return {
+        "task_type": task_type,
+        "params": {
+            **where,
+            "dates": [{"startDate": start_date.strftime("%m-%d-%Y"), "endDate": end_date.strftime("%m-%d-%Y")}],
+            "layers": [{"product": product_id, "layer": band_name} for band_name in band_names]
+        }
+    }
+
+def estimate_area_task(geo_json: dict, product_id: str, band_names: list, start_date: datetime, end_date: datetime) -> TaskEstimate:
+    """Estimates the output of an area task with the arguments of TaskOrchestrator.execute_and_retrieve_area_task."""
+    return estimate_task(_task_params("area", {"geo": geo_json}, product_id, band_names, start_date, end_date))
+
+def estimate_point_task(
+        latitude: float,
+        longitude: float,
+        product_id: str,
+        band_names: list,
+        start_date: datetime,
+        end_date: datetime
+    ) -> TaskEstimate:
+    """Estimates the output of a point task with the arguments of TaskOrchestrator.execute_and_retrieve_point_task."""
+    where = {"coordinates": [{"latitude": latitude, "longitude": longitude}]}
+    return estimate_task(_task_params("point", where, product_id, band_names, start_date, end_date))
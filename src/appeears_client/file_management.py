@@ -4,54 +4,138 @@ import os
 import re
 import logging
 import requests
+import numpy as np
 import rasterio
+from rasterio.merge import merge
 from datetime import datetime
 
-from .config import base_url
 from ..exceptions import RequestError
+from ..models import get_band_metadata
+from .transport import Transport, resolve_transport
+
+logger = logging.getLogger(__name__)
 
 class FileManager:
-    def __init__(self, token: str):
-        self.token = token
-        self.base_url = base_url
+    def __init__(self, token: str = None, transport: Transport = None):
+        """
+        :param token: The authorization token used for the API, when no transport is given.
+        :param transport: Transport shared with the other managers, refreshing the token when it expires.
+        """
+        self.transport = resolve_transport(token, transport)
+        self.base_url = self.transport.base_url
 
-    def download_and_process_file(self, task_id: str, file_id: str, file_name: str, token: str, destination_dir: str):
+    @property
+    def token(self) -> str:
+        return self.transport.credentials.token
+
+    def download_and_process_file(self, task_id: str, file_id: str, file_name: str, token: str = None, destination_dir: str = '.'):
         """
         Download and process a GeoTIFF file using AppEEARS API.
         
         :param task_id: The task ID from which to download the file.
         :param file_id: The specific file ID to download.
         :param file_name: The name of the file to check and download.
-        :param token: The authorization token used for the API.
+        :param token: Kept for backwards compatibility, requests use the token of the manager's transport.
         :param destination_dir: Directory to save downloaded files.
         """
         # Verify if the file is a GeoTIFF file
         if not file_name.endswith('.tif'):
-            print(f"Skipping non-TIF file: {file_name}")
+            logger.debug("Skipping non-TIF file: %s", file_name)
             return {"message": "Skipped non-TIF file"}
 
         # Constructing the download URL
-        url = f"https://appeears.earthdatacloud.nasa.gov/api/bundle/{task_id}/{file_id}"
-        headers = {"Authorization": f"Bearer {token}"}
+        url = f"{self.base_url}/bundle/{task_id}/{file_id}"
         file_path = os.path.join(destination_dir, file_name)
 
         # Ensure the directory exists
         os.makedirs(os.path.dirname(file_path), exist_ok=True)
 
-        # Download the file
-        response = requests.get(url, headers=headers, stream=True)
-        if response.status_code == 200:
-            with open(file_path, 'wb') as f:
-                for chunk in response.iter_content(chunk_size=1024):
-                    if chunk:  # filter out keep-alive new chunks
-                        f.write(chunk)
-            print(f"File {file_name} successfully downloaded to {file_path}")
-            return {"message": f"File {file_name} successfully downloaded to {file_path}"}
-        else:
-            error_msg = response.text
-            print(f"Error downloading the file: {error_msg}")
-            return {"error": f"Error downloading file: {error_msg}"}
-        
+        with self.transport.instrumentation.stage('download') as stage:
+            result = self._download(url, file_path)
+            if 'error' in result:
+                stage.fail(result['reason'])
+                logger.error("Error downloading the file %s: %s", file_name, result['error'], extra={'task_id': task_id})
+                return {"error": f"Error downloading file: {result['error']}"}
+            stage.add(bytes=os.path.getsize(file_path))
+        logger.info("File %s successfully downloaded to %s", file_name, file_path, extra={'task_id': task_id})
+        return {"message": f"File {file_name} successfully downloaded to {file_path}"}
+
+    def _download(self, url: str, file_path: str) -> dict:
+        """Downloads a file through a temporary path, retrying connections dropped mid-stream."""
+        # Download the file to a temporary path, so that an interrupted download never leaves a truncated file
+        temp_path = f"{file_path}.part"
+        policy = self.transport.retry_policy
+        attempt = 0
+        while True:
+            attempt += 1
+            response = self.transport.get(url, stream=True)
+            if response.status_code != 200:
+                return {"error": response.text, "reason": f"status_{response.status_code}"}
+            try:
+                with open(temp_path, 'wb') as f:
+                    for chunk in response.iter_content(chunk_size=1024):
+                        if chunk:  # filter out keep-alive new chunks
+                            f.write(chunk)
+                break
+            except requests.RequestException as e:
+                # The connection dropped mid-stream, after the transport handed the response over
+                reason = policy.retry_reason('download', attempt, error=e)
+                if reason is None:
+                    policy.metrics.increment('giveups', 'download', type(e).__name__)
+                    if os.path.exists(temp_path):
+                        os.remove(temp_path)
+                    return {"error": str(e), "reason": type(e).__name__}
+                policy.metrics.increment('retries', 'download', reason)
+                policy.sleep(policy.delay(attempt))
+            finally:
+                response.close()
+        os.replace(temp_path, file_path)
+        return {"message": "Downloaded"}
+
+    def mosaic_files(self, file_paths: list, output_path: str) -> str:
+        """
+        Mosaics GeoTIFF tiles of the same layer and date into a single GeoTIFF.
+
+        :param file_paths: Paths of the tiles to merge, they must share CRS, data type and band count.
+        :param output_path: Path of the mosaic to write.
+        """
+        with self.transport.instrumentation.stage('mosaic') as stage:
+            sources = [rasterio.open(path) for path in file_paths]
+            try:
+                mosaic, transform = merge(sources)
+                profile = sources[0].profile.copy()
+            finally:
+                for src in sources:
+                    src.close()
+
+            profile.update(height=mosaic.shape[1], width=mosaic.shape[2], transform=transform)
+            os.makedirs(os.path.dirname(output_path) or '.', exist_ok=True)
+            with rasterio.open(output_path, 'w', **profile) as dst:
+                dst.write(mosaic)
+            stage.add(files=len(file_paths), pixels=mosaic.shape[1] * mosaic.shape[2])
+        logger.info("Mosaicked %d tiles into %s", len(file_paths), output_path)
+        return output_path
+
+    def decode_band_values(self, values, product_id: str, band_name: str) -> np.ndarray:
+        """
+        Converts raw values of a band to physical values using the catalog metadata, without any API call.
+
+        Fill values become NaN, and the scale factor and offset are applied when the catalog knows them.
+
+        :param values: Raw values, e.g. read from a downloaded GeoTIFF.
+        :param product_id: The product the band belongs to.
+        :param band_name: The band the values were read from.
+        """
+        metadata = get_band_metadata(product_id, band_name)
+        decoded = np.array(values, dtype=np.float64)
+        if metadata['fill_value'] is not None:
+            decoded = np.where(decoded == metadata['fill_value'], np.nan, decoded)
+        if metadata['scale_factor'] is not None:
+            decoded *= metadata['scale_factor']
+        if metadata['add_offset'] is not None:
+            decoded += metadata['add_offset']
+        return decoded
+
     def extract_info_and_coordinates_from_tif(self, filename: str, file_path: str):
         """
         Extracts the band, date, and coordinates of each pixel from a GeoTIFF file.
@@ -59,12 +143,12 @@ class FileManager:
         :param filename: The name of the file being processed.
         :param file_path: The full path to the GeoTIFF file.
         """
-        logging.info(f"Extracting band and date information from the file {filename}")
+        logger.debug("Extracting band and date information from the file %s", filename)
 
         # Extracts band and date information from the filename
         match = re.search(r'B(\d+)_doy(\d{7})_', filename)
         if not match:
-            logging.warning(f"Could not extract information from the file {filename}")
+            logger.warning("Could not extract information from the file %s", filename)
             return None
 
         band = match
@@ -75,7 +159,7 @@ class FileManager:
         data_points = []
 
         # Open the GeoTIFF file to read data and coordinates
-        with rasterio.open(file_path) as src:
+        with self.transport.instrumentation.stage('extract') as stage, rasterio.open(file_path) as src:
             # Gets the values of the first band
             band_data = src.read(1)
 
@@ -93,6 +177,7 @@ class FileManager:
                         'longitude': longitude,
                         'value': value
                     })
+            stage.add(pixels=len(data_points))
 
-        logging.info(f"Extracted information and coordinates for the file {filename}")
+        logger.debug("Extracted information and coordinates for the file %s", filename)
         return data_points
\ No newline at end of file
@@ -0,0 +1,54 @@
+# src.appeears_client.futures.py
+import threading
+from contextlib import contextmanager
+from concurrent.futures import Future, wait, as_completed, FIRST_COMPLETED, FIRST_EXCEPTION, ALL_COMPLETED
+
+__all__ = ['TaskFuture', 'wait', 'as_completed', 'FIRST_COMPLETED', 'FIRST_EXCEPTION', 'ALL_COMPLETED']
+
+_current = threading.local()
+
+class TaskFuture(Future):
+    """
+    Handle of an orchestrated AppEEARS request running in the background.
+
+    It is a regular concurrent.futures.Future, so result(timeout), done(), add_done_callback() and the
+    module-level wait() and as_completed() helpers all work on it. The result is what the matching
+    execute_and_retrieve_* call would have returned, but a failed request raises its error from result()
+    and exception() reports it, where execute_and_retrieve_* logs it and returns None.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.task_ids = []
+
+    @property
+    def task_id(self):
+        """The first task_id submitted for the request, or None while it is not submitted yet."""
+        return self.task_ids[0] if self.task_ids else None
+
+    def __repr__(self):
+        return f"<TaskFuture task_id={self.task_id} done={self.done()}>"
+
+def current_future():
+    """Returns the TaskFuture whose request runs in the calling thread, if any."""
+    return getattr(_current, 'future', None)
+
+@contextmanager
+def bound_future(future):
+    """Makes future the current TaskFuture of the calling thread for the duration of the block."""
+    previous = current_future()
+    _current.future = future
+    try:
+        yield future
+    finally:
+        _current.future = previous
+
+def bind_current_future(fn):
+    """Wraps fn so that it sees the caller's current TaskFuture when run in another thread, e.g. in a pool."""
+    future = current_future()
+
+    def bound(*args, **kwargs):
+        with bound_future(future):
+            return fn(*args, **kwargs)
+
+    return bound
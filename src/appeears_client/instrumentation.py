@@ -0,0 +1,227 @@
+# src.appeears_client.instrumentation.py
+import math
+import time
+import threading
+from typing import Optional
+
+# Upper bounds in seconds of the duration buckets of HistogramInstrumentation
+DURATION_BUCKETS = (
+    0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5,
+    1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0, 300.0, 600.0, math.inf
+)
+
+class Instrumentation:
+    """
+    Receiver of the measurements of the client: every API request, and every pipeline stage of the orchestrator.
+
+    This base class is disabled and does nothing, so instrumenting costs one attribute check per request.
+    To feed a metrics backend, subclass it, set enabled to True and override record_request and record_stage.
+    Both are called from many threads at once.
+    """
+
+    enabled = False
+
+    def record_request(
+            self,
+            endpoint: str,
+            method: str,
+            status: Optional[int],
+            duration: float,
+            bytes_sent: int = 0,
+            bytes_received: int = 0,
+            retries: int = 0,
+            queue_wait: float = 0.0,
+            error: str = None
+        ):
+        """
+        Records one API request, retries included.
+
+        :param endpoint: Endpoint class of the request, see transport.endpoint_class.
+        :param status: Status of the final response, None if no response was received.
+        :param duration: Seconds from the first attempt to the final response headers, waits included.
+        :param bytes_received: Content-Length of the final response, 0 when the server does not send one.
+        :param retries: Number of attempts after the first one.
+        :param queue_wait: Seconds spent waiting for the rate limiter.
+        :param error: Name of the exception raised instead of a response, if any.
+        """
+
+    def record_stage(self, stage: str, duration: float, error: str = None, **values):
+        """
+        Records one run of a pipeline stage ('submit', 'wait', 'download', 'mosaic', 'extract', ...).
+
+        :param duration: Seconds the stage took.
+        :param error: Name of the exception the stage raised, if any.
+        :param values: Quantities the stage processed, e.g. bytes=... or pixels=...
+        """
+
+    def stage(self, name: str) -> 'Stage':
+        """
+        Returns a context manager timing a pipeline stage and recording it on exit. Quantities are added with
+        its add() method. When disabled, a shared no-op stage is returned.
+        """
+        return Stage(self, name) if self.enabled else NULL_STAGE
+
+class Stage:
+    """A running pipeline stage, see Instrumentation.stage."""
+
+    __slots__ = ('instrumentation', 'name', 'values', 'start', 'error')
+
+    def __init__(self, instrumentation: Instrumentation, name: str):
+        self.instrumentation = instrumentation
+        self.name = name
+        self.values = {}
+        self.start = None
+        self.error = None
+
+    def add(self, **values):
+        """Adds quantities processed by the stage, summed with those added before."""
+        for key, value in values.items():
+            self.values[key] = self.values.get(key, 0) + value
+
+    def fail(self, error: str):
+        """Records the stage as failed with an error label, for failures returned rather than raised."""
+        self.error = error
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        error = exc_type.__name__ if exc_type is not None else self.error
+        self.instrumentation.record_stage(self.name, time.perf_counter() - self.start, error=error, **self.values)
+
+class _NullStage:
+    __slots__ = ()
+
+    def add(self, **values):
+        pass
+
+    def fail(self, error: str):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        pass
+
+NULL_STAGE = _NullStage()
+NULL_INSTRUMENTATION = Instrumentation()
+
+class _Series:
+    """Counters and duration histogram of one endpoint class or stage."""
+
+    def __init__(self):
+        self.count = 0
+        self.errors = 0
+        self.duration_sum = 0.0
+        self.duration_min = math.inf
+        self.duration_max = 0.0
+        self.buckets = [0] * len(DURATION_BUCKETS)
+        self.totals = {}
+        self.statuses = {}
+
+    def observe(self, duration: float, error: bool, totals: dict):
+        self.count += 1
+        self.errors += bool(error)
+        self.duration_sum += duration
+        self.duration_min = min(self.duration_min, duration)
+        self.duration_max = max(self.duration_max, duration)
+        for index, bound in enumerate(DURATION_BUCKETS):
+            if duration <= bound:
+                self.buckets[index] += 1
+                break
+        for key, value in totals.items():
+            self.totals[key] = self.totals.get(key, 0) + value
+
+    def percentile(self, q: float) -> float:
+        """Estimates a duration percentile as the upper bound of its bucket, capped by the largest duration."""
+        rank = q * self.count
+        cumulative = 0
+        for bound, count in zip(DURATION_BUCKETS, self.buckets):
+            cumulative += count
+            if count and cumulative >= rank:
+                return min(bound, self.duration_max)
+        return self.duration_max
+
+    def summary(self) -> dict:
+        summary = {
+            'count': self.count,
+            'errors': self.errors,
+            'duration': {
+                'total': self.duration_sum,
+                'mean': self.duration_sum / self.count if self.count else 0.0,
+                'min': self.duration_min if self.count else 0.0,
+                'max': self.duration_max,
+                'p50': self.percentile(0.5),
+                'p90': self.percentile(0.9),
+                'p99': self.percentile(0.99),
+            },
+            **self.totals,
+        }
+        if self.statuses:
+            summary['statuses'] = dict(self.statuses)
+        if self.totals.get('bytes') and self.duration_sum > 0:
+            # Stages report the bytes they processed, requests only their headers' Content-Length
+            summary['bytes_per_s'] = self.totals['bytes'] / self.duration_sum
+        return summary
+
+class HistogramInstrumentation(Instrumentation):
+    """
+    In-memory instrumentation keeping, per endpoint class and per stage, request counts, statuses, errors,
+    bytes, retries, rate-limiter waits and a histogram of the durations to estimate percentiles.
+    """
+
+    enabled = True
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._requests = {}
+        self._stages = {}
+
+    def record_request(self, endpoint, method, status, duration, bytes_sent=0, bytes_received=0, retries=0, queue_wait=0.0, error=None):
+        totals = {'bytes_sent': bytes_sent, 'bytes_received': bytes_received, 'retries': retries, 'queue_wait': queue_wait}
+        failed = error is not None or (status is not None and status >= 400)
+        with self._lock:
+            series = self._requests.get(endpoint)
+            if series is None:
+                series = self._requests[endpoint] = _Series()
+            series.observe(duration, failed, totals)
+            key = str(status) if status is not None else error
+            series.statuses[key] = series.statuses.get(key, 0) + 1
+
+    def record_stage(self, stage, duration, error=None, **values):
+        with self._lock:
+            series = self._stages.get(stage)
+            if series is None:
+                series = self._stages[stage] = _Series()
+            series.observe(duration, error is not None, values)
+
+    def snapshot(self) -> dict:
+        """Returns {'requests': {endpoint: summary}, 'stages': {stage: summary}}, durations being in seconds."""
+        with self._lock:
+            return {
+                'requests': {endpoint: series.summary() for endpoint, series in self._requests.items()},
+                'stages': {stage: series.summary() for stage, series in self._stages.items()},
+            }
+
+    def reset(self):
+        with self._lock:
+            self._requests.clear()
+            self._stages.clear()
+
+    def report(self) -> str:
+        """Formats the snapshot as a table, slowest total time first."""
+        snapshot = self.snapshot()
+        lines = [f"{'kind':<8} {'name':<12} {'count':>7} {'errors':>6} {'total s':>9} {'p50 ms':>8} {'p90 ms':>8} {'p99 ms':>8} {'MB/s':>8}"]
+        rows = [('request', name, summary) for name, summary in snapshot['requests'].items()]
+        rows += [('stage', name, summary) for name, summary in snapshot['stages'].items()]
+        rows.sort(key=lambda row: row[2]['duration']['total'], reverse=True)
+        for kind, name, summary in rows:
+            duration = summary['duration']
+            throughput = f"{summary['bytes_per_s'] / 1e6:.2f}" if 'bytes_per_s' in summary else ''
+            lines.append(
+                f"{kind:<8} {name:<12} {summary['count']:>7} {summary['errors']:>6} {duration['total']:>9.2f} "
+                f"{duration['p50'] * 1000:>8.1f} {duration['p90'] * 1000:>8.1f} {duration['p99'] * 1000:>8.1f} {throughput:>8}"
+            )
+        return '\n'.join(lines)
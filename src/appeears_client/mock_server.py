@@ -0,0 +1,418 @@
+# src.appeears_client.mock_server.py
+import io
+import csv
+import json
+import math
+import time
+import uuid
+import zlib
+import base64
+import secrets
+import threading
+from collections import Counter
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse
+
+import numpy as np
+import rasterio
+from rasterio.transform import from_bounds
+
+from ..models import get_catalog_records, get_band_metadata
+from .date_splitting import period_starts
+from .spatial_tiling import geojson_bounds
+from .transport import endpoint_class
+
+METERS_PER_DEGREE = 111320.0
+DOWNLOAD_CHUNK_SIZE = 64 * 1024
+
+# numpy types of the synthetic GeoTIFFs, by AppEEARS data type
+NUMPY_TYPES = {
+    'int8': 'int8', 'uint8': 'uint8',
+    'int16': 'int16', 'uint16': 'uint16',
+    'int32': 'int32', 'uint32': 'uint32',
+    'float32': 'float32', 'float64': 'float64',
+}
+
+# Catalog band metadata fields reported by /product/{id}, under their API names
+LAYER_KEYS = {
+    'data_type': 'DataType',
+    'fill_value': 'FillValue',
+    'scale_factor': 'ScaleFactor',
+    'add_offset': 'AddOffset',
+    'units': 'Units',
+    'valid_min': 'ValidMin',
+    'valid_max': 'ValidMax',
+    'is_qa': 'IsQA',
+}
+
+class MockAppEEARSServer:
+    """
+    In-process stand-in for the AppEEARS API, serving the endpoints the client uses from the local catalog.
+
+    Tasks go through 'queued' and 'processing' before being 'done', after configurable delays, and their
+    bundles hold synthetic outputs: one GeoTIFF per layer and date for area tasks, one CSV per product for
+    point tasks. Latency and download bandwidth are configurable, so that the client can be benchmarked
+    deterministically on one machine. Requests are counted by endpoint class in request_counts.
+
+        with MockAppEEARSServer(queue_time=0.5) as server:
+            client = APIClient('user', 'password', base_url=server.base_url, poll_interval=0.1)
+    """
+
+    def __init__(
+            self,
+            host: str = '127.0.0.1',
+            port: int = 0,
+            latency: float = 0.0,
+            queue_time: float = 0.0,
+            processing_time: float = 0.0,
+            bandwidth: float = None,
+            max_raster_size: int = 256,
+            users: dict = None,
+            token_lifetime: float = 48 * 3600
+        ):
+        """
+        :param host: Interface to listen on.
+        :param port: Port to listen on, 0 picks a free one.
+        :param latency: Seconds added to the handling of every request.
+        :param queue_time: Seconds a submitted task stays 'queued'.
+        :param processing_time: Seconds a task then stays 'processing' before being 'done'.
+        :param bandwidth: Download throughput in bytes per second, unlimited if None.
+        :param max_raster_size: Largest width and height of the synthetic GeoTIFFs, in pixels.
+        :param users: Optional {username: password} accepted by /login, any credentials are accepted if None.
+        :param token_lifetime: Seconds before the tokens handed out expire.
+        """
+        self.host = host
+        self.port = port
+        self.latency = latency
+        self.queue_time = queue_time
+        self.processing_time = processing_time
+        self.bandwidth = bandwidth
+        self.max_raster_size = max_raster_size
+        self.users = users
+        self.token_lifetime = token_lifetime
+        self.tasks = {}
+        self.tokens = {}
+        self.request_counts = Counter()
+        self._files = {}  # (task_id, file_id) -> file description, with the function rendering its content
+        self._lock = threading.Lock()
+        self._httpd = None
+        self._thread = None
+
+    @property
+    def base_url(self) -> str:
+        """Root of the mock API, to give to the client as its base_url."""
+        if self._httpd is None:
+            raise RuntimeError("The mock server is not running")
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}/api"
+
+    def start(self) -> 'MockAppEEARSServer':
+        """Starts serving on a background thread."""
+        server = self
+
+        class Handler(_MockHandler):
+            app = server
+
+        self._httpd = ThreadingHTTPServer((self.host, self.port), Handler)
+        self._httpd.daemon_threads = True
+        self._thread = threading.Thread(target=self._httpd.serve_forever, name="appeears-mock-server", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        """Stops serving and closes the listening socket."""
+        if self._httpd is not None:
+            self._httpd.shutdown()
+            self._httpd.server_close()
+            self._thread.join()
+            self._httpd = None
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+    # Task life cycle
+
+    def task_status(self, task: dict) -> tuple:
+        """Returns the (status, progress percentage) of a task at the current time."""
+        elapsed = time.monotonic() - task['_submitted']
+        if elapsed < self.queue_time:
+            return 'queued', 0
+        if elapsed < self.queue_time + self.processing_time:
+            return 'processing', int(100 * (elapsed - self.queue_time) / self.processing_time)
+        return 'done', 100
+
+    def _public_task(self, task: dict) -> dict:
+        status, _ = self.task_status(task)
+        return {**{key: value for key, value in task.items() if not key.startswith('_')}, 'status': status}
+
+    def submit(self, body: dict) -> dict:
+        """Records a task request and lists the files of its future bundle, raising ValueError if it is invalid."""
+        task_type = body.get('task_type')
+        params = body.get('params')
+        if task_type not in ('area', 'point') or not isinstance(params, dict):
+            raise ValueError("A task needs a task_type of 'area' or 'point' and params")
+        for key in ('dates', 'layers'):
+            if not params.get(key):
+                raise ValueError(f"A task needs params.{key}")
+        if task_type == 'area' and 'geo' not in params:
+            raise ValueError("An area task needs params.geo")
+        if task_type == 'point' and not params.get('coordinates'):
+            raise ValueError("A point task needs params.coordinates")
+
+        task_id = str(uuid.uuid4())
+        task = {
+            'task_id': task_id,
+            'task_name': body.get('task_name') or task_id,
+            'task_type': task_type,
+            'params': params,
+            'created': datetime.now(timezone.utc).isoformat(),
+            '_submitted': time.monotonic(),
+        }
+        files = self._area_files(task) if task_type == 'area' else self._point_files(task)
+        files.append(self._file(f"{task['task_name']}-request.json", 'json', lambda: json.dumps(body).encode('utf-8')))
+        task['_files'] = files
+        with self._lock:
+            for file in files:
+                self._files[(task_id, file['file_id'])] = file
+            self.tasks[task_id] = task
+        return task
+
+    def _file(self, file_name: str, file_type: str, render) -> dict:
+        return {'file_id': str(uuid.uuid4()), 'file_name': file_name, 'file_type': file_type, '_render': render, '_content': None}
+
+    @staticmethod
+    def _dates(task: dict, granularity: str) -> list:
+        dates = []
+        for date_range in task['params']['dates']:
+            start = datetime.strptime(date_range['startDate'], "%m-%d-%Y")
+            end = datetime.strptime(date_range['endDate'], "%m-%d-%Y")
+            dates.extend(period_starts(start, end, granularity))
+        return dates
+
+    def _area_files(self, task: dict) -> list:
+        bounds = geojson_bounds(task['params']['geo'])
+        files = []
+        for layer in task['params']['layers']:
+            metadata = get_band_metadata(layer['product'], layer['layer'])
+            for day in self._dates(task, metadata['temporal_granularity']):
+                file_name = f"{layer['product']}_{layer['layer']}_doy{day.strftime('%Y%j')}_aid0001.tif"
+                render = lambda metadata=metadata, seed=file_name: self._render_geotiff(bounds, metadata, seed)
+                files.append(self._file(file_name, 'tif', render))
+        return files
+
+    def _point_files(self, task: dict) -> list:
+        layers_by_product = {}
+        for layer in task['params']['layers']:
+            layers_by_product.setdefault(layer['product'], []).append(layer['layer'])
+        return [
+            self._file(
+                f"{task['task_name']}-{product_id.split('.')[0]}-results.csv", 'csv',
+                lambda product_id=product_id, bands=bands: self._render_csv(task, product_id, bands)
+            )
+            for product_id, bands in layers_by_product.items()
+        ]
+
+    def _render_geotiff(self, bounds: tuple, metadata: dict, seed: str) -> bytes:
+        min_lon, min_lat, max_lon, max_lat = bounds
+        resolution = (metadata['pixel_size'] or 1000) / METERS_PER_DEGREE
+        width = min(self.max_raster_size, max(1, math.ceil((max_lon - min_lon) / resolution)))
+        height = min(self.max_raster_size, max(1, math.ceil((max_lat - min_lat) / resolution)))
+        dtype = NUMPY_TYPES.get(metadata['data_type'], 'int16')
+        rng = np.random.default_rng(zlib.crc32(seed.encode('utf-8')))
+        if np.issubdtype(np.dtype(dtype), np.integer):
+            info = np.iinfo(dtype)
+            values = rng.integers(max(info.min, 0), min(info.max, 10000), size=(height, width), endpoint=True).astype(dtype)
+        else:
+            values = rng.random((height, width)).astype(dtype)
+
+        profile = {
+            'driver': 'GTiff', 'width': width, 'height': height, 'count': 1, 'dtype': dtype, 'crs': 'EPSG:4326',
+            'transform': from_bounds(min_lon, min_lat, max_lon, max_lat, width, height),
+        }
+        if metadata['fill_value'] is not None:
+            profile['nodata'] = metadata['fill_value']
+        with rasterio.MemoryFile() as memory_file:
+            with memory_file.open(**profile) as dataset:
+                dataset.write(values, 1)
+            return memory_file.read()
+
+    def _render_csv(self, task: dict, product_id: str, bands: list) -> bytes:
+        granularity = get_catalog_records()[product_id]['temporal_granularity']
+        rng = np.random.default_rng(zlib.crc32(f"{task['task_id']}{product_id}".encode('utf-8')))
+        columns = [f"{product_id.split('.')[0]}_{product_id.split('.')[-1]}_{band}" for band in bands]
+        output = io.StringIO()
+        writer = csv.writer(output)
+        writer.writerow(['ID', 'Latitude', 'Longitude', 'Date'] + columns)
+        for index, point in enumerate(task['params']['coordinates']):
+            for day in self._dates(task, granularity):
+                values = [int(value) for value in rng.integers(0, 10000, size=len(columns))]
+                writer.writerow([point.get('id', index), point['latitude'], point['longitude'], day.strftime('%Y-%m-%d')] + values)
+        return output.getvalue().encode('utf-8')
+
+    def file_content(self, task_id: str, file_id: str) -> tuple:
+        """Returns the (file description, content) of a bundle file, rendering it on first download."""
+        with self._lock:
+            file = self._files.get((task_id, file_id))
+        if file is None:
+            raise KeyError(file_id)
+        if file['_content'] is None:
+            file['_content'] = file['_render']()
+        return file, file['_content']
+
+    # Catalog
+
+    @staticmethod
+    def product_listing() -> list:
+        """The /product listing of the local catalog."""
+        return [
+            {
+                'ProductAndVersion': record['product_id'],
+                'Product': record['product_id'].split('.')[0],
+                'Version': record['product_id'].split('.')[-1],
+                'Description': record['description'],
+                'TemporalGranularity': record['temporal_granularity'],
+                'Resolution': f"{record['pixel_size']}m",
+                'TemporalExtentStart': record.get('start_date'),
+                'TemporalExtentEnd': record.get('end_date', 'Present'),
+            }
+            for record in get_catalog_records().values()
+        ]
+
+    @staticmethod
+    def product_layers(product_id: str) -> dict:
+        """The /product/{id} layers of a product of the local catalog, raising KeyError if it is unknown."""
+        record = get_catalog_records()[product_id]
+        layers = {}
+        for entry in record['bands']:
+            metadata = entry[2] if len(entry) > 2 else {}
+            layer = {'Description': entry[1]}
+            layer.update({LAYER_KEYS[field]: value for field, value in metadata.items() if field in LAYER_KEYS})
+            layers[entry[0]] = layer
+        return layers
+
+class _MockHandler(BaseHTTPRequestHandler):
+    app: MockAppEEARSServer = None
+    protocol_version = 'HTTP/1.1'
+    disable_nagle_algorithm = True  # Headers and body are written separately, avoid delayed ACK stalls
+
+    def log_message(self, format, *args):
+        pass  # Keep test and benchmark output clean
+
+    def _send_json(self, status: int, body=None):
+        payload = b'' if body is None else json.dumps(body).encode('utf-8')
+        self.send_response(status)
+        if body is not None:
+            self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def _read_body(self) -> bytes:
+        length = int(self.headers.get('Content-Length') or 0)
+        return self.rfile.read(length) if length else b''
+
+    def _authorized(self) -> bool:
+        header = self.headers.get('Authorization', '')
+        token = header[len('Bearer '):] if header.startswith('Bearer ') else None
+        expires_at = self.app.tokens.get(token)
+        return expires_at is not None and expires_at > time.time()
+
+    def _route(self, method: str):
+        app = self.app
+        path = urlparse(self.path).path
+        with app._lock:
+            app.request_counts[endpoint_class(method, path)] += 1
+        if app.latency:
+            time.sleep(app.latency)
+        body = self._read_body()
+
+        parts = [part for part in path.split('/') if part]
+        if parts[:1] == ['api']:
+            parts = parts[1:]
+        if not parts:
+            return self._send_json(404, {'message': 'Not found'})
+        resource, args = parts[0], parts[1:]
+
+        if resource == 'login' and method == 'POST':
+            return self._login()
+        if not self._authorized():
+            return self._send_json(401, {'message': 'You are not authorized'})
+        if resource == 'logout' and method == 'POST':
+            app.tokens.pop(self.headers['Authorization'][len('Bearer '):], None)
+            return self._send_json(204)
+        if resource == 'product' and method == 'GET':
+            if not args:
+                return self._send_json(200, app.product_listing())
+            try:
+                return self._send_json(200, app.product_layers(args[0]))
+            except KeyError:
+                return self._send_json(404, {'message': f"Product {args[0]} not found"})
+        if resource == 'task':
+            if method == 'POST' and not args:
+                try:
+                    task = app.submit(json.loads(body or b'{}'))
+                except (ValueError, KeyError) as e:
+                    return self._send_json(400, {'message': str(e)})
+                return self._send_json(202, {'task_id': task['task_id'], 'status': 'pending'})
+            if method == 'GET' and not args:
+                return self._send_json(200, [app._public_task(task) for task in list(app.tasks.values())])
+            if method == 'GET' and len(args) == 1 and args[0] in app.tasks:
+                return self._send_json(200, app._public_task(app.tasks[args[0]]))
+            return self._send_json(404, {'message': 'Task not found'})
+        if resource == 'status' and method == 'GET' and len(args) == 1:
+            task = app.tasks.get(args[0])
+            if task is None:
+                return self._send_json(404, {'message': 'Task not found'})
+            status, progress = app.task_status(task)
+            return self._send_json(200, {'task_id': task['task_id'], 'status': status, 'progress': {'summary': progress}})
+        if resource == 'bundle' and method == 'GET' and args:
+            task = app.tasks.get(args[0])
+            if task is None or app.task_status(task)[0] != 'done':
+                return self._send_json(404, {'message': 'Bundle not found'})
+            if len(args) == 1:
+                files = [{key: value for key, value in file.items() if not key.startswith('_')} for file in task['_files']]
+                return self._send_json(200, {'task_id': task['task_id'], 'bundle_type': task['task_type'], 'files': files})
+            return self._download(task, args[1])
+        return self._send_json(404, {'message': 'Not found'})
+
+    def _login(self):
+        header = self.headers.get('Authorization', '')
+        try:
+            username, password = base64.b64decode(header[len('Basic '):]).decode('utf-8').split(':', 1)
+        except (ValueError, UnicodeDecodeError):
+            return self._send_json(401, {'message': 'Missing credentials'})
+        if self.app.users is not None and self.app.users.get(username) != password:
+            return self._send_json(401, {'message': 'Invalid credentials'})
+        token = secrets.token_urlsafe(32)
+        expires_at = time.time() + self.app.token_lifetime
+        self.app.tokens[token] = expires_at
+        expiration = datetime.fromtimestamp(expires_at, timezone.utc).strftime('%Y-%m-%dT%H:%M:%SZ')
+        return self._send_json(200, {'token_type': 'Bearer', 'token': token, 'expiration': expiration})
+
+    def _download(self, task: dict, file_id: str):
+        try:
+            file, content = self.app.file_content(task['task_id'], file_id)
+        except KeyError:
+            return self._send_json(404, {'message': 'File not found'})
+        content_type = {'tif': 'image/tiff', 'csv': 'text/csv', 'json': 'application/json'}.get(file['file_type'], 'application/octet-stream')
+        self.send_response(200)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(content)))
+        self.send_header('Content-Disposition', f"attachment; filename={file['file_name']}")
+        self.end_headers()
+        bandwidth = self.app.bandwidth
+        for offset in range(0, len(content), DOWNLOAD_CHUNK_SIZE):
+            chunk = content[offset:offset + DOWNLOAD_CHUNK_SIZE]
+            self.wfile.write(chunk)
+            if bandwidth:
+                time.sleep(len(chunk) / bandwidth)
+
+    def do_GET(self):
+        self._route('GET')
+
+    def do_POST(self):
+        self._route('POST')
@@ -1,57 +1,129 @@
 # src.appeears_client.product_management.py
+import logging
 import requests
-from .config import base_url
+from requests.adapters import HTTPAdapter
+from concurrent.futures import ThreadPoolExecutor
 from ..exceptions import RequestError
-from ..models import get_product_by_id
+from ..models import validate_product
+from .response_cache import ResponseCache
+from .transport import Transport, resolve_transport
+
+logger = logging.getLogger(__name__)
 
 class ProductManagement:
-    def __init__(self, token: str):
-        self.token = token
-        self.base_url = base_url
+    def __init__(self, token: str = None, cache: ResponseCache = None, transport: Transport = None):
+        """
+        :param token: The authorization token used for the API, when no transport is given.
+        :param cache: Optional cache of /product responses, revalidated with conditional requests once stale.
+        :param transport: Transport shared with the other managers, refreshing the token when it expires.
+        """
+        self.transport = resolve_transport(token, transport)
+        self.base_url = self.transport.base_url
+        self.cache = cache
+
+    @property
+    def token(self) -> str:
+        return self.transport.credentials.token
+
+    def _get_json(self, url: str, session: requests.Session = None):
+        """
+        GETs a JSON document, going through the cache when there is one.
+
+        :return: A (status_code, body) pair, body being None unless the status is 200.
+        """
+        headers = {}
+        entry = None
+        if self.cache is not None:
+            entry = self.cache.get(url)
+            if entry is not None and self.cache.is_fresh(entry):
+                return 200, entry['body']
+            headers.update(self.cache.conditional_headers(entry))
+
+        response = self.transport.get(url, headers=headers, session=session)
+        if response.status_code == 304 and entry is not None:
+            return 200, self.cache.revalidated(entry)['body']
+        if response.status_code == 200:
+            body = response.json()
+            if self.cache is not None:
+                self.cache.put(url, body, etag=response.headers.get('ETag'), last_modified=response.headers.get('Last-Modified'))
+            return 200, body
+        return response.status_code, None
 
     def get_product(self, product_id: str) -> dict:
         """Retrieves product information only if the product_id is valid."""
         try:
             # This will raise a ValueError if the product_id is not valid
-            valid_product = get_product_by_id(product_id=product_id)
-            headers = {'Authorization': f'Bearer {self.token}'}
-            response = requests.get(f"{self.base_url}/product/{product_id}", headers=headers)
-            if response.status_code == 200:
-                return response.json()
+            validate_product(product_id=product_id)
+            status_code, product = self._get_json(f"{self.base_url}/product/{product_id}")
+            if status_code == 200:
+                return product
             else:
                 raise RequestError("Failed to retrieve product")
         except ValueError as e:
             # Handle the error by re-raising it or converting it to a different type of error
             raise RequestError(f"Invalid product ID: {str(e)}")
 
-    def get_all_products_and_layers(self) -> dict:
-        """Retrieves all products and their layers using the authenticated session."""
-        headers = {'Authorization': f'Bearer {self.token}'}
-        response = requests.get(f"{self.base_url}/product", headers=headers)
-        if response.status_code == 200:
-            products = response.json()
-            all_products = {}
-            for product in products:
+    def list_products(self) -> list:
+        """Retrieves the /product listing of every product available in AppEEARS."""
+        status_code, products = self._get_json(f"{self.base_url}/product")
+        if status_code != 200:
+            raise RequestError("Failed to retrieve all products")
+        return products
+
+    def get_all_products_and_layers(self, max_workers: int = 16) -> dict:
+        """
+        Retrieves all products and their layers using the authenticated session.
+
+        Layer requests run concurrently over a shared connection pool. A product whose layers cannot be
+        retrieved does not abort the crawl: its entry gets 'layers' set to None and an 'error' message.
+
+        :param max_workers: Maximum number of concurrent layer requests.
+        """
+        with requests.Session() as session:
+            adapter = HTTPAdapter(pool_connections=1, pool_maxsize=max_workers)
+            session.mount('https://', adapter)
+            session.mount('http://', adapter)
+
+            status_code, products = self._get_json(f"{self.base_url}/product", session=session)
+            if status_code != 200:
+                raise RequestError("Failed to retrieve all products")
+
+            def fetch_layers(product: dict):
                 product_id = product['ProductAndVersion']
-                layers = self.get_product_layers(product_id=product_id)
-                all_products[product_id] = {
-                    'product_details': product,
-                    'layers': layers
-                }
+                try:
+                    status_code, layers = self._get_json(f"{self.base_url}/product/{product_id}", session=session)
+                    if status_code == 200:
+                        return product_id, layers, None
+                    return product_id, None, f"Failed to retrieve layers for product {product_id}: HTTP {status_code}"
+                except requests.RequestException as e:
+                    return product_id, None, f"Failed to retrieve layers for product {product_id}: {e}"
+
+            all_products = {}
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                for product, (product_id, layers, error) in zip(products, executor.map(fetch_layers, products)):
+                    all_products[product_id] = {
+                        'product_details': product,
+                        'layers': layers
+                    }
+                    if error is not None:
+                        logger.warning(error)
+                        all_products[product_id]['error'] = error
             return all_products
-        else:
-            raise RequestError("Failed to retrieve all products")
 
-    def get_product_layers(self, product_id: str) -> dict:
-        """Retrieves layers for a given product using the authenticated session."""
+    def get_product_layers(self, product_id: str, validate: bool = True) -> dict:
+        """
+        Retrieves layers for a given product using the authenticated session.
+
+        :param validate: Whether to refuse products missing from the local catalog, disabled when syncing it.
+        """
         try:
             # Validate product_id by checking if it exists in the predefined PRODUCTS list
-            valid_product = get_product_by_id(product_id=product_id)
-            headers = {'Authorization': f'Bearer {self.token}'}
+            if validate:
+                validate_product(product_id=product_id)
             layer_url = f"{self.base_url}/product/{product_id}"
-            response = requests.get(layer_url, headers=headers)
-            if response.status_code == 200:
-                return response.json()
+            status_code, layers = self._get_json(layer_url)
+            if status_code == 200:
+                return layers
             else:
                 raise RequestError(f"Failed to retrieve layers for product {product_id}")
         except ValueError as e:
@@ -0,0 +1,54 @@
+# src.appeears_client.progress.py
+import sys
+import threading
+
+try:
+    from tqdm import tqdm
+except ImportError:  # Progress bars are optional, the reporter falls back to silence
+    tqdm = None
+
+class ProgressReporter:
+    """
+    Receiver of the progress of running tasks, as polled from /status. This base class shows nothing.
+
+    Subclass it to show progress elsewhere, e.g. in a dashboard. Methods are called from many threads at once.
+    """
+
+    def update(self, task_id: str, status: str, percent: float):
+        """Reports the status and overall progress (0-100) of a task."""
+
+    def close(self, task_id: str):
+        """Reports that a task is no longer followed, whether it completed or not."""
+
+NULL_PROGRESS = ProgressReporter()
+
+class TqdmProgress(ProgressReporter):
+    """Draws one tqdm bar per running task on stderr."""
+
+    def __init__(self):
+        if tqdm is None:
+            raise ImportError("TqdmProgress requires the tqdm package")
+        self._bars = {}
+        self._lock = threading.Lock()
+
+    def update(self, task_id, status, percent):
+        if not percent:
+            return  # Draw the bar once there is actual progress
+        with self._lock:
+            bar = self._bars.get(task_id)
+            if bar is None:
+                bar = self._bars[task_id] = tqdm(total=100, desc=f"Task {task_id[:8]}", bar_format="{l_bar}{bar} {n_fmt}/{total_fmt}")
+            bar.n = percent
+            bar.refresh()
+
+    def close(self, task_id):
+        with self._lock:
+            bar = self._bars.pop(task_id, None)
+        if bar is not None:
+            bar.close()
+
+def default_progress() -> ProgressReporter:
+    """Returns progress bars when stderr is a terminal and tqdm is installed, and silence otherwise."""
+    if tqdm is not None and sys.stderr is not None and sys.stderr.isatty():
+        return TqdmProgress()
+    return NULL_PROGRESS
@@ -0,0 +1,78 @@
+# src.appeears_client.rate_limit.py
+import time
+import threading
+from typing import Dict, Optional, Tuple
+
+# Requests per second and burst size of each endpoint class, see transport.endpoint_class
+DEFAULT_LIMITS = {
+    'status': (5.0, 10),
+    'submit': (1.0, 2),
+    'bundle': (2.0, 5),
+    'download': (4.0, 8),
+}
+
+class TokenBucket:
+    """
+    Thread-safe token bucket, refilled continuously at a fixed rate up to its capacity.
+
+    Callers reserve a token and wait outside the lock for the time the reservation tells them. The bucket
+    may go into debt, so waiting callers are spaced 1/rate apart in arrival order instead of all retrying
+    when a token comes back, which keeps the throughput steady at the rate.
+    """
+
+    def __init__(self, rate: float, capacity: float, clock=time.monotonic):
+        """
+        :param rate: Tokens added per second.
+        :param capacity: Maximum number of tokens, i.e. the largest burst sent without waiting.
+        :param clock: Monotonic clock in seconds, replaceable in tests.
+        """
+        if rate <= 0 or capacity < 1:
+            raise ValueError("A token bucket needs a positive rate and a capacity of at least 1")
+        self.rate = rate
+        self.capacity = capacity
+        self._clock = clock
+        self._tokens = float(capacity)
+        self._updated = clock()
+        self._lock = threading.Lock()
+
+    def reserve(self, tokens: float = 1) -> float:
+        """Takes tokens from the bucket and returns the seconds to wait before using them."""
+        with self._lock:
+            now = self._clock()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= tokens
+            return max(0.0, -self._tokens / self.rate)
+
+class RateLimiter:
+    """
+    Client-side rate limits of a transport, with one token bucket per endpoint class.
+
+    Endpoint classes without a limit are not throttled. A limiter can be shared by several transports,
+    e.g. those of the accounts of a credential pool, to cap their combined traffic.
+    """
+
+    def __init__(self, limits: Dict[str, Tuple[float, float]] = None, sleep=time.sleep):
+        """
+        :param limits: (requests per second, burst size) by endpoint class, defaults to DEFAULT_LIMITS.
+        :param sleep: Function used to wait, replaceable in tests.
+        """
+        limits = DEFAULT_LIMITS if limits is None else limits
+        self.buckets = {endpoint: TokenBucket(rate, burst) for endpoint, (rate, burst) in limits.items()}
+        self.sleep = sleep
+
+    def reserve(self, endpoint: str) -> float:
+        """
+        Reserves a request of an endpoint class and returns the seconds to wait before sending it.
+
+        Callers that cannot block a thread, such as coroutines, wait the returned time themselves.
+        """
+        bucket: Optional[TokenBucket] = self.buckets.get(endpoint)
+        return bucket.reserve() if bucket is not None else 0.0
+
+    def acquire(self, endpoint: str) -> float:
+        """Waits until a request of an endpoint class may be sent, and returns the time waited."""
+        delay = self.reserve(endpoint)
+        if delay > 0:
+            self.sleep(delay)
+        return delay
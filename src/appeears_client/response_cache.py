@@ -0,0 +1,81 @@
+# src.appeears_client.response_cache.py
+import os
+import json
+import time
+import hashlib
+import threading
+from typing import Optional
+
+class ResponseCache:
+    """
+    Disk-backed cache of JSON API responses with a TTL, shared across processes.
+
+    Each URL is stored in its own file, written atomically, along with the ETag and Last-Modified headers
+    of the response so that stale entries can be revalidated with a conditional request. Entries are also
+    kept in memory, so repeated lookups within a process do not touch the disk.
+    """
+
+    def __init__(self, cache_dir: str = os.path.join(os.path.expanduser('~'), '.appeears', 'cache'), ttl: float = 7 * 24 * 3600):
+        """
+        :param cache_dir: Directory holding the cache files.
+        :param ttl: Seconds during which an entry is served without contacting the server.
+        """
+        self.cache_dir = cache_dir
+        self.ttl = ttl
+        self._memory = {}
+        self._lock = threading.Lock()
+
+    def _path(self, url: str) -> str:
+        return os.path.join(self.cache_dir, hashlib.sha256(url.encode('utf-8')).hexdigest() + '.json')
+
+    def get(self, url: str) -> Optional[dict]:
+        """Returns the cached entry of a URL, fresh or not, or None."""
+        entry = self._memory.get(url)
+        if entry is not None and self.is_fresh(entry):
+            return entry
+        try:
+            with open(self._path(url), 'r', encoding='utf-8') as f:
+                entry = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return entry
+        self._memory[url] = entry
+        return entry
+
+    def is_fresh(self, entry: dict) -> bool:
+        return time.time() - entry['stored_at'] < self.ttl
+
+    def put(self, url: str, body, etag: str = None, last_modified: str = None) -> dict:
+        """Stores a response body with its validators."""
+        entry = {"url": url, "body": body, "etag": etag, "last_modified": last_modified, "stored_at": time.time()}
+        path = self._path(url)
+        with self._lock:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            temp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                json.dump(entry, f)
+            os.replace(temp_path, path)
+            self._memory[url] = entry
+        return entry
+
+    def revalidated(self, entry: dict) -> dict:
+        """Marks an entry as fresh again after the server answered 304 Not Modified."""
+        return self.put(entry['url'], entry['body'], etag=entry.get('etag'), last_modified=entry.get('last_modified'))
+
+    def conditional_headers(self, entry: Optional[dict]) -> dict:
+        """Returns the If-None-Match / If-Modified-Since headers to revalidate an entry."""
+        headers = {}
+        if entry is not None:
+            if entry.get('etag'):
+                headers['If-None-Match'] = entry['etag']
+            if entry.get('last_modified'):
+                headers['If-Modified-Since'] = entry['last_modified']
+        return headers
+
+    def clear(self):
+        """Removes every cached entry."""
+        with self._lock:
+            self._memory.clear()
+            if os.path.isdir(self.cache_dir):
+                for name in os.listdir(self.cache_dir):
+                    if name.endswith('.json'):
+                        os.remove(os.path.join(self.cache_dir, name))
@@ -0,0 +1,125 @@
+# src.appeears_client.retry.py
+import time
+import random
+import threading
+from email.utils import parsedate_to_datetime
+from typing import Optional
+
+import requests
+
+# Statuses worth retrying: throttling and transient server or gateway failures
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+# Statuses telling that the server refused a request without processing it, which makes even a
+# non-idempotent request (a task submission) safe to send again
+REFUSED_STATUSES = frozenset({429, 503})
+
+# Endpoint classes whose requests are not idempotent, see transport.endpoint_class
+NON_IDEMPOTENT_CLASSES = frozenset({'submit'})
+
+class RetryMetrics:
+    """Thread-safe counters of the requests sent, retried and given up, by endpoint class and reason."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._counts = {}
+
+    def increment(self, name: str, endpoint: str, reason: str = None):
+        key = (name, endpoint, reason)
+        with self._lock:
+            self._counts[key] = self._counts.get(key, 0) + 1
+
+    def snapshot(self) -> dict:
+        """
+        Returns the counters as {'attempts': {...}, 'retries': {...}, 'giveups': {...}}, each mapping
+        '<endpoint>' or '<endpoint>:<reason>' to a count.
+        """
+        result = {'attempts': {}, 'retries': {}, 'giveups': {}}
+        with self._lock:
+            for (name, endpoint, reason), count in self._counts.items():
+                label = endpoint if reason is None else f"{endpoint}:{reason}"
+                result[name][label] = result[name].get(label, 0) + count
+        return result
+
+    def reset(self):
+        with self._lock:
+            self._counts.clear()
+
+class RetryPolicy:
+    """
+    Decides whether a failed request is sent again, and after how long.
+
+    Retries use exponential backoff with full jitter, unless the server sent a Retry-After header. Idempotent
+    requests are retried on connection errors and on the statuses of RETRY_STATUSES. Task submissions are
+    only retried when the server refused them (REFUSED_STATUSES) or the connection could not be opened, so
+    that a task is never queued twice.
+    """
+
+    def __init__(
+            self,
+            max_attempts: int = 5,
+            backoff_factor: float = 1.0,
+            max_backoff: float = 60.0,
+            max_retry_after: float = 300.0,
+            jitter: bool = True,
+            sleep=time.sleep
+        ):
+        """
+        :param max_attempts: Maximum number of times a request is sent, 1 disables retries.
+        :param backoff_factor: Delay before the first retry, doubled for each following one.
+        :param max_backoff: Upper bound of the computed delays.
+        :param max_retry_after: Upper bound of the delays requested by the server through Retry-After.
+        :param jitter: Whether to draw each delay uniformly between 0 and its computed value.
+        :param sleep: Function used to wait, replaceable in tests.
+        """
+        self.max_attempts = max_attempts
+        self.backoff_factor = backoff_factor
+        self.max_backoff = max_backoff
+        self.max_retry_after = max_retry_after
+        self.jitter = jitter
+        self.sleep = sleep
+        self.metrics = RetryMetrics()
+
+    def retry_reason(self, endpoint: str, attempt: int, response: requests.Response = None, error: Exception = None) -> Optional[str]:
+        """
+        Returns why a request should be retried ('status_503', 'ConnectionError', ...), or None if it should not.
+
+        :param endpoint: Endpoint class of the request.
+        :param attempt: Number of times the request was sent so far.
+        :param response: The response received, if any.
+        :param error: The exception raised instead of a response, if any.
+        """
+        if attempt >= self.max_attempts:
+            return None
+        idempotent = endpoint not in NON_IDEMPOTENT_CLASSES
+        if error is not None:
+            if isinstance(error, (requests.ConnectTimeout, requests.exceptions.SSLError)) or (
+                    idempotent and isinstance(error, (requests.ConnectionError, requests.Timeout, requests.exceptions.ChunkedEncodingError))):
+                return type(error).__name__
+            return None
+        statuses = RETRY_STATUSES if idempotent else REFUSED_STATUSES
+        if response is not None and response.status_code in statuses:
+            return f"status_{response.status_code}"
+        return None
+
+    def delay(self, attempt: int, response: requests.Response = None) -> float:
+        """Returns the seconds to wait before sending a request again after its attempt-th failure."""
+        retry_after = self._retry_after(response)
+        if retry_after is not None:
+            return min(retry_after, self.max_retry_after)
+        delay = min(self.max_backoff, self.backoff_factor * (2 ** (attempt - 1)))
+        return random.uniform(0, delay) if self.jitter else delay
+
+    @staticmethod
+    def _retry_after(response: requests.Response = None) -> Optional[float]:
+        value = response.headers.get('Retry-After') if response is not None else None
+        if not value:
+            return None
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            pass
+        try:
+            return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+        except (TypeError, ValueError):
+            return None
@@ -0,0 +1,175 @@
+# src.appeears_client.spatial_tiling.py
+import math
+from typing import Iterator, List, Tuple
+
+from ..models import get_pixel_size
+
+METERS_PER_DEGREE = 111320.0  # Length of one degree of latitude, and of longitude at the equator
+
+def _iter_geometries(geo_json: dict) -> Iterator[dict]:
+    """Yields the geometries of a GeoJSON FeatureCollection, Feature or bare geometry."""
+    if geo_json.get('type') == 'FeatureCollection':
+        for feature in geo_json.get('features', []):
+            yield from _iter_geometries(feature)
+    elif geo_json.get('type') == 'Feature':
+        if geo_json.get('geometry'):
+            yield geo_json['geometry']
+    elif geo_json.get('type') == 'GeometryCollection':
+        for geometry in geo_json.get('geometries', []):
+            yield geometry
+    else:
+        yield geo_json
+
+def _iter_polygons(geometry: dict) -> Iterator[list]:
+    """Yields the ring lists of the polygons in a Polygon or MultiPolygon geometry."""
+    if geometry.get('type') == 'Polygon':
+        yield geometry['coordinates']
+    elif geometry.get('type') == 'MultiPolygon':
+        yield from geometry['coordinates']
+    else:
+        raise ValueError(f"Unsupported geometry type for area tasks: {geometry.get('type')}")
+
+def geojson_bounds(geo_json: dict) -> Tuple[float, float, float, float]:
+    """Returns the (min_lon, min_lat, max_lon, max_lat) bounding box of a GeoJSON object."""
+    lons, lats = [], []
+    for geometry in _iter_geometries(geo_json):
+        for polygon in _iter_polygons(geometry):
+            for ring in polygon:
+                for lon, lat in (point[:2] for point in ring):
+                    lons.append(lon)
+                    lats.append(lat)
+    if not lons:
+        raise ValueError("The GeoJSON does not contain any polygon")
+    return min(lons), min(lats), max(lons), max(lats)
+
+def bounds_size_meters(bounds: Tuple[float, float, float, float]) -> Tuple[float, float]:
+    """Approximates the (width, height) in meters of a geographic bounding box."""
+    min_lon, min_lat, max_lon, max_lat = bounds
+    mean_lat = math.radians((min_lat + max_lat) / 2)
+    width = (max_lon - min_lon) * METERS_PER_DEGREE * math.cos(mean_lat)
+    height = (max_lat - min_lat) * METERS_PER_DEGREE
+    return width, height
+
+def estimate_pixel_count(geo_json: dict, pixel_size: float) -> int:
+    """Estimates the number of pixels covered by the bounding box of a GeoJSON at the given pixel size (meters)."""
+    width, height = bounds_size_meters(geojson_bounds(geo_json))
+    return max(1, math.ceil(width / pixel_size)) * max(1, math.ceil(height / pixel_size))
+
+def _clip_ring(ring: list, bounds: Tuple[float, float, float, float]) -> list:
+    """Clips a ring to an axis-aligned rectangle (Sutherland-Hodgman) and returns the closed result, or [] if empty."""
+    min_lon, min_lat, max_lon, max_lat = bounds
+    edges = [
+        (lambda p: p[0] >= min_lon, lambda a, b: _intersect_x(a, b, min_lon)),
+        (lambda p: p[0] <= max_lon, lambda a, b: _intersect_x(a, b, max_lon)),
+        (lambda p: p[1] >= min_lat, lambda a, b: _intersect_y(a, b, min_lat)),
+        (lambda p: p[1] <= max_lat, lambda a, b: _intersect_y(a, b, max_lat)),
+    ]
+    points = [tuple(point[:2]) for point in ring]
+    if len(points) > 1 and points[0] == points[-1]:
+        points = points[:-1]
+    for inside, intersect in edges:
+        if not points:
+            break
+        clipped = []
+        previous = points[-1]
+        for current in points:
+            if inside(current):
+                if not inside(previous):
+                    clipped.append(intersect(previous, current))
+                clipped.append(current)
+            elif inside(previous):
+                clipped.append(intersect(previous, current))
+            previous = current
+        points = clipped
+    if len(set(points)) < 3:
+        return []
+    return [list(point) for point in points + [points[0]]]
+
+def _intersect_x(a: tuple, b: tuple, x: float) -> tuple:
+    t = (x - a[0]) / (b[0] - a[0])
+    return (x, a[1] + t * (b[1] - a[1]))
+
+def _intersect_y(a: tuple, b: tuple, y: float) -> tuple:
+    t = (y - a[1]) / (b[1] - a[1])
+    return (a[0] + t * (b[0] - a[0]), y)
+
+def _clip_geojson(geo_json: dict, bounds: Tuple[float, float, float, float]) -> dict:
+    """Clips every polygon of a GeoJSON to a rectangle, returning a FeatureCollection or None if nothing is left."""
+    features = []
+    for geometry in _iter_geometries(geo_json):
+        for polygon in _iter_polygons(geometry):
+            outer = _clip_ring(polygon[0], bounds)
+            if not outer:
+                continue
+            holes = [hole for hole in (_clip_ring(ring, bounds) for ring in polygon[1:]) if hole]
+            features.append({
+                "type": "Feature",
+                "properties": {},
+                "geometry": {"type": "Polygon", "coordinates": [outer] + holes}
+            })
+    if not features:
+        return None
+    return {"type": "FeatureCollection", "features": features}
+
+def tile_geojson(geo_json: dict, product_id: str, target_pixels: int = 10_000_000) -> List[dict]:
+    """
+    Cuts an area of interest into a grid of tiles holding at most about target_pixels pixels each.
+
+    The tile size is derived from the product's pixel size. Each tile is returned as a FeatureCollection
+    with the polygons clipped to the tile, and tiles not intersecting the area are dropped.
+
+    :param geo_json: A GeoJSON dictionary defining the area of interest.
+    :param product_id: Product whose pixel size drives the tile size.
+    :param target_pixels: Maximum number of pixels per tile, per layer and date.
+    """
+    bounds = geojson_bounds(geo_json)
+    min_lon, min_lat, max_lon, max_lat = bounds
+    width, height = bounds_size_meters(bounds)
+    pixel_size = get_pixel_size(product_id)
+    total_pixels = max(1, math.ceil(width / pixel_size)) * max(1, math.ceil(height / pixel_size))
+
+    num_tiles = math.ceil(total_pixels / target_pixels)
+    if num_tiles <= 1:
+        return [geo_json]
+
+    # Keep tiles roughly square in ground distance
+    aspect = width / height if height > 0 else float(num_tiles)
+    cols = max(1, min(num_tiles, math.ceil(math.sqrt(num_tiles * aspect))))
+    rows = math.ceil(num_tiles / cols)
+    lon_step = (max_lon - min_lon) / cols
+    lat_step = (max_lat - min_lat) / rows
+
+    tiles = []
+    for row in range(rows):
+        for col in range(cols):
+            tile_bounds = (
+                min_lon + col * lon_step,
+                min_lat + row * lat_step,
+                max_lon if col == cols - 1 else min_lon + (col + 1) * lon_step,
+                max_lat if row == rows - 1 else min_lat + (row + 1) * lat_step,
+            )
+            tile = _clip_geojson(geo_json, tile_bounds)
+            if tile is not None:
+                tiles.append(tile)
+    return tiles
+
+def split_by_features(geo_json: dict) -> List[dict]:
+    """Splits a FeatureCollection along its feature boundaries, one FeatureCollection per feature."""
+    if geo_json.get('type') != 'FeatureCollection':
+        return [geo_json]
+    return [{"type": "FeatureCollection", "features": [feature]} for feature in geo_json.get('features', [])]
+
+def split_area(geo_json: dict, product_id: str, target_pixels: int = 10_000_000, strategy: str = "grid") -> List[dict]:
+    """
+    Splits an area of interest into tiles sized to target_pixels for the given product.
+
+    :param strategy: 'grid' cuts the whole area into a regular grid, 'features' splits it along its
+                     feature boundaries first and only grids the features that are still too large.
+    """
+    if strategy == "grid":
+        return tile_geojson(geo_json, product_id=product_id, target_pixels=target_pixels)
+    elif strategy == "features":
+        return [tile for feature in split_by_features(geo_json)
+                for tile in tile_geojson(feature, product_id=product_id, target_pixels=target_pixels)]
+    else:
+        raise ValueError(f"Unknown tiling strategy: {strategy}")
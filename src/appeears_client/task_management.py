@@ -2,82 +2,279 @@
 import os
 import re
 import time
-import pprint
 import logging
 import requests
 import rasterio
-from tqdm import tqdm
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 
-from .config import base_url
-from ..exceptions import RequestError
-from ..models import get_product_by_id
+from ..exceptions import RequestError, TaskFailedError
+from ..models import validate_bands, validate_layers, check_coverage
+from .spatial_tiling import geojson_bounds
+from .task_registry import TaskRegistry, fingerprint_task
+from .transport import Transport, resolve_transport
+from .retry import RETRY_STATUSES
+from .progress import ProgressReporter, default_progress
+
+logger = logging.getLogger(__name__)
+
+# Task statuses for which a task can serve a repeated request
+REUSABLE_STATUSES = ('done', 'queued', 'pending', 'processing')
 
 class TaskManagement:
-    def __init__(self, token: str):
-        self.token = token
-        self.base_url = base_url
+    def __init__(
+            self,
+            token: str = None,
+            registry: TaskRegistry = None,
+            transport: Transport = None,
+            poll_interval: float = 10,
+            progress: ProgressReporter = None,
+            owner: str = None
+        ):
+        """
+        :param token: The authorization token used for the API, when no transport is given.
+        :param registry: Optional local registry used to reuse the tasks of repeated requests.
+        :param transport: Transport shared with the other managers, refreshing the token when it expires.
+        :param poll_interval: Seconds between two status checks of a running task.
+        :param progress: Receiver of the progress of running tasks. Defaults to progress bars in a terminal,
+            and to silence otherwise.
+        :param owner: Name of the account the transport sends requests with, when several accounts share the
+            registry. Only the registered tasks of that account are reused, the others cannot be polled with it.
+        """
+        self.transport = resolve_transport(token, transport)
+        self.base_url = self.transport.base_url
+        self.registry = registry
+        self.owner = owner
+        self.poll_interval = poll_interval
+        self.progress = progress if progress is not None else default_progress()
+
+    @property
+    def token(self) -> str:
+        return self.transport.credentials.token
 
-    def check_task_status(self, task_id: str) -> bool:
-        """Checks the status of the task and returns True if it is complete."""
-        status_url = f"{self.base_url}/status/{task_id}"
-        headers = {"Authorization": f"Bearer {self.token}"}
+    def get_task_status(self, task_id: str) -> str:
+        """
+        Reads the status of a task once ('queued', 'processing', 'done', ...) and reports its progress.
+
+        Raises TaskFailedError if the server reports that the task failed or refuses to report its status, and
+        RequestError if the status could not be read for a transient reason the transport gave up on (throttling,
+        server errors). Connection errors the transport gave up on propagate as requests exceptions.
+        """
+        response = self.transport.get(f"{self.base_url}/status/{task_id}")
+        if response.status_code in RETRY_STATUSES:
+            raise RequestError(f"Could not check the status of the task {task_id}: HTTP {response.status_code}")
+        if response.status_code != 200:
+            raise TaskFailedError(f"Could not check the status of the task {task_id}: HTTP {response.status_code}")
+        status_details = response.json()
+        status = status_details.get('status')
+        if status == 'error':
+            raise TaskFailedError(f"Task {task_id} failed on the AppEEARS server")
+        self.progress.update(task_id, status, 100 if status == 'done' else status_details.get('progress', {}).get('summary', 0))
+        return status
 
-        pbar = None  # Start progress bar as None
-        queued_message_displayed = False  # Variable to control the printout of the 'queued' message
+    def check_task_status(self, task_id: str, on_status=None) -> bool:
+        """
+        Waits for a task to complete and returns True once it is done.
+
+        Raises TaskFailedError if the task failed, so that a failed task is never mistaken for a running one.
+        Failures to read the status are transient: the task keeps running on the server, so polling resumes.
 
+        :param on_status: Optional callable receiving every status read, e.g. to persist the task's progress.
+        """
+        queued_logged = False  # Log the 'queued' state once, not at every poll
         try:
             while True:
-                response = requests.get(status_url, headers=headers)
-                if response.status_code == 200:
-                    status_details = response.json()
-
-                    # Manage progress bar initialization and update
-                    if 'progress' in status_details and status_details['progress']['summary'] > 0:
-                        if pbar is None:  # Initialize the progress bar only when there is actual progress
-                            pbar = tqdm(total=100, desc="Overall Task Progress", bar_format="{l_bar}{bar} {n_fmt}/{total_fmt}")
-                        summary_progress = status_details['progress'].get('summary', 0)
-                        pbar.n = summary_progress
-                        pbar.refresh()
-
-                    if status_details.get('status') == 'queued' and not queued_message_displayed:
-                        tqdm.write("Task in Queued, waiting for AppEEARS server...")
-                        queued_message_displayed = True  # Mark that the message has been displayed
-
-                    if status_details.get('status') == 'done':
-                        if pbar is not None:
-                            pbar.n = 100
-                            pbar.refresh()
-                        break
-                    elif status_details.get('status') == 'error':
-                        tqdm.write("Error occurred in task processing.")
-                        break
-
-                    time.sleep(10)  # Wait before checking again to avoid too many requests
-                else:
-                    tqdm.write(f"Error checking task status for {task_id}: HTTP {response.status_code}")
-                    break
+                try:
+                    status = self.get_task_status(task_id)
+                except (RequestError, requests.RequestException) as e:
+                    logger.warning("Could not check the status of the task %s, polling again: %s", task_id, e, extra={'task_id': task_id})
+                    time.sleep(self.poll_interval)
+                    continue
+                if on_status is not None:
+                    on_status(status)
+                if status == 'done':
+                    return True
+                if status == 'queued' and not queued_logged:
+                    logger.info("Task %s queued, waiting for the AppEEARS server", task_id, extra={'task_id': task_id})
+                    queued_logged = True
+                time.sleep(self.poll_interval)  # Wait before checking again to avoid too many requests
         finally:
-            if pbar is not None:
-                pbar.close()  # Ensure the progress bar is closed if it was initialized
-
-        return status_details.get('status') == 'done'
+            self.progress.close(task_id)
 
     def list_task_files(self, task_id: str) -> list:
         """ Lists the available files of a completed task. """
         url = f"{self.base_url}/bundle/{task_id}"
-        headers = {"Authorization": f"Bearer {self.token}"}
 
-        response = requests.get(url, headers=headers)
+        response = self.transport.get(url)
         if response.status_code == 200:
             files = response.json().get('files', [])
-            print(f"Files found for the task {task_id}: {len(files)} listed files")
-            pprint.pprint(files)
+            logger.info("Files found for the task %s: %d listed files", task_id, len(files), extra={'task_id': task_id})
+            logger.debug("Files of the task %s: %s", task_id, files)
             return files
         else:
-            print(f"Could not list the files for the task {task_id}: HTTP {response.status_code}")
+            logger.error("Could not list the files for the task %s: HTTP %s", task_id, response.status_code, extra={'task_id': task_id})
             return []
         
+    def is_task_available(self, task_id: str) -> bool:
+        """
+        Tells whether an existing task can still serve its request: the server knows it, it is done or in
+        flight, and its bundle has not expired. A task whose details cannot be read for a transient reason
+        is assumed available, its status polling will tell.
+        """
+        response = self.transport.get(f"{self.base_url}/task/{task_id}")
+        if response.status_code in RETRY_STATUSES:
+            return True
+        if response.status_code != 200:
+            return False
+        task = response.json()
+        if task.get('status') not in REUSABLE_STATUSES:
+            return False
+        expires_on = task.get('expires_on')
+        if expires_on:
+            try:
+                expiry = datetime.fromisoformat(expires_on.replace('Z', '+00:00'))
+            except ValueError:
+                return True
+            if expiry.tzinfo is None:
+                expiry = expiry.replace(tzinfo=timezone.utc)  # The API reports times in UTC
+            return expiry > datetime.now(timezone.utc)
+        return True
+
+    def find_reusable_task(self, task_params: dict, search_listing: bool = False):
+        """
+        Looks for an existing task matching the fingerprint of task_params.
+
+        The local registry is checked, and optionally the user's /task listing. A task is reusable when it
+        is done or still in flight, so the same request is never queued twice, and when this manager's account
+        owns it.
+
+        :param task_params: The task request body, as sent to POST /task.
+        :param search_listing: Whether to also scan the /task listing, one request whose size grows with the
+            user's task history.
+        :return: The matching task_id, or None.
+        """
+        fingerprint = fingerprint_task(task_params)
+        try:
+            if self.registry is not None:
+                entry = self.registry.lookup(fingerprint)
+                if entry and entry['owner'] == self.owner:
+                    if self.is_task_available(entry['task_id']):
+                        return entry['task_id']
+                    self.registry.forget(fingerprint)
+
+            if not search_listing:
+                return None
+            response = self.transport.get(f"{self.base_url}/task")
+            if response.status_code != 200:
+                return None
+            for task in response.json():
+                if task.get('status') in REUSABLE_STATUSES and fingerprint_task(task) == fingerprint:
+                    if self.registry is not None:
+                        self.registry.record(fingerprint, task['task_id'], owner=self.owner)
+                    return task['task_id']
+        except requests.RequestException as e:
+            logger.warning("Could not look up existing tasks: %s", e)
+        return None
+
+    def submit_task(self, task_params: dict, reuse_existing: bool = True, search_listing: bool = False) -> dict:
+        """
+        Submits a task request, reusing a matching existing task when possible.
+
+        :param task_params: The task request body, as sent to POST /task.
+        :param reuse_existing: Whether to look for a matching done or in-flight task in the registry before submitting.
+        :param search_listing: Whether to also look for it in the user's /task listing, see find_reusable_task.
+        """
+        if reuse_existing:
+            task_id = self.find_reusable_task(task_params, search_listing=search_listing)
+            if task_id:
+                return {"message": "Reusing existing task", "task_id": task_id, "reused": True}
+
+        response = self.transport.post(f"{self.base_url}/task", json=task_params)
+
+        if response.status_code == 202:
+            task_id = response.json().get('task_id', None)
+            if task_id and self.registry is not None:
+                self.registry.record(fingerprint_task(task_params), task_id, owner=self.owner)
+            return {"message": "Task submitted successfully", "task_id": task_id}
+        else:
+            return {"error": "Failed to submit task", "status_code": response.status_code, "response": response.text}
+
+    def build_point_task_params(
+            self,
+            latitude: float,
+            longitude: float,
+            product_id: str,
+            band_names: list,
+            start_date: datetime,
+            end_date: datetime
+            ) -> dict:
+        """
+        Builds the request body of a point task, raising ValueError if the product or bands are not valid, or if
+        the product has no data at that place and time.
+        """
+        # Validate product_id and bands
+        valid_bands = validate_bands(product_id=product_id, band_names=band_names)
+        check_coverage(product_id, start_date, end_date, bounds=(longitude, latitude, longitude, latitude))
+
+        # Set up dates
+        today = datetime.now() # Just for task name reference.
+        formatted_start_date = start_date.strftime("%m-%d-%Y")
+        formatted_end_date = end_date.strftime("%m-%d-%Y")
+
+        task_name = f"{product_id} {today.strftime('%Y-%m-%d %H:%M:%S')}"
+
+        return {
+            "task_type": "point",
+            "task_name": task_name,
+            "params": {
+                "coordinates": [{"latitude": latitude, "longitude": longitude}],
+                "dates": [{"startDate": formatted_start_date, "endDate": formatted_end_date}],
+                "layers": [{"product": product_id, "layer": band_name} for band_name in valid_bands],
+                "output": {
+                    "format": {"type": "geotiff"},
+                    "projection": "geographic"
+                }
+            }
+        }
+
+    def build_area_task_params(
+            self,
+            geo_json: dict,
+            start_date: str,
+            end_date: str,
+            layers: list,
+            projection: str = "geographic",
+            format_type: str = "geotiff"
+        ) -> dict:
+        """
+        Builds the request body of an area task, raising ValueError if any layer is not in the catalog, or if a
+        product has no data over the area and dates.
+        """
+        validate_layers(layers)
+        try:
+            bounds = geojson_bounds(geo_json)
+        except ValueError:
+            bounds = None  # Let the API judge geometries the local check does not understand
+        start, end = datetime.strptime(start_date, "%m-%d-%Y"), datetime.strptime(end_date, "%m-%d-%Y")
+        for product_id in dict.fromkeys(layer['product'] for layer in layers):
+            check_coverage(product_id, start, end, bounds=bounds)
+        return {
+            "task_type": "area",
+            "task_name": f"Area_Task {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
+            "params": {
+                "geo": geo_json,
+                "dates": [{
+                    "startDate": start_date,
+                    "endDate": end_date,
+                    "recurring": False
+                }],
+                "layers": layers,
+                "output": {
+                    "format": {"type": format_type},
+                    "projection": projection
+                }
+            }
+        }
+
     def submit_point_task(
             self, 
             latitude: float, 
@@ -85,49 +282,21 @@ class TaskManagement:
             product_id: str, 
             band_names: list, 
             start_date: datetime,
-            end_date: datetime
+            end_date: datetime,
+            reuse_existing: bool = True,
+            search_listing: bool = False
             ) -> dict:
         """Submits a task for a specific geographic point and retrieves specified bands of a product."""
         try:
-            # Validate product_id and bands
-            product = get_product_by_id(product_id=product_id)
-            valid_bands = [band for band in product.bands if band.name in band_names]
-            if not valid_bands:
-                raise ValueError("One or more bands are not valid for the specified product.")
-
-            # Set up dates
-            today = datetime.now() # Just for task name reference.
-            formatted_start_date = start_date.strftime("%m-%d-%Y")
-            formatted_end_date = end_date.strftime("%m-%d-%Y")
-
-            task_name = f"{product_id} {today.strftime('%Y-%m-%d %H:%M:%S')}"
-
-            task_params = {
-                "task_type": "point",
-                "task_name": task_name,
-                "params": {
-                    "coordinates": [{"latitude": latitude, "longitude": longitude}],
-                    "dates": [{"startDate": formatted_start_date, "endDate": formatted_end_date}],
-                    "layers": [{"product": product_id, "layer": band.name} for band in valid_bands],
-                    "output": {
-                        "format": {"type": "geotiff"},
-                        "projection": "geographic"
-                    }
-                }
-            }
-
-            response = requests.post(
-                f"{self.base_url}/task",
-                headers={"Authorization": f"Bearer {self.token}"},
-                json=task_params
+            task_params = self.build_point_task_params(
+                latitude=latitude,
+                longitude=longitude,
+                product_id=product_id,
+                band_names=band_names,
+                start_date=start_date,
+                end_date=end_date
             )
-
-            if response.status_code == 202:
-                task_response = response.json()
-                task_id = task_response.get('task_id', None)
-                return {"message": "Task submitted successfully", "task_id": task_id}
-            else:
-                return {"error": "Failed to submit task", "status_code": response.status_code, "response": response.json()}
+            return self.submit_task(task_params, reuse_existing=reuse_existing, search_listing=search_listing)
         except ValueError as e:
             return {"error": str(e)}
     
@@ -138,7 +307,9 @@ class TaskManagement:
             end_date: str, 
             layers: list, 
             projection: str = "geographic", 
-            format_type: str = "geotiff"
+            format_type: str = "geotiff",
+            reuse_existing: bool = True,
+            search_listing: bool = False
         ):
         """
         Submits an area-based task to the AppEEARS API.
@@ -149,33 +320,18 @@ class TaskManagement:
         :param layers: A list of dictionaries specifying layers and their corresponding products.
         :param projection: The projection type for the output, default is 'geographic'.
         :param format_type: The format of the output file, default is 'geotiff'.
+        :param reuse_existing: Whether to reuse a done or in-flight task with the same params instead of submitting.
+        :param search_listing: Whether to also look for such a task in the user's /task listing, not only the registry.
         """
-        task_params = {
-            "task_type": "area",
-            "task_name": f"Area_Task {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
-            "params": {
-                "geo": geo_json,
-                "dates": [{
-                    "startDate": start_date,
-                    "endDate": end_date,
-                    "recurring": False
-                }],
-                "layers": layers,
-                "output": {
-                    "format": {"type": format_type},
-                    "projection": projection
-                }
-            }
-        }
-
-        response = requests.post(
-            f"{self.base_url}/task",
-            headers={"Authorization": f"Bearer {self.token}"},
-            json=task_params
-        )
-
-        if response.status_code == 202:
-            task_response = response.json()
-            return {"message": "Area task submitted successfully", "task_id": task_response.get('task_id', None)}
-        else:
-            return {"error": "Failed to submit area task", "status_code": response.status_code, "response": response.text}
\ No newline at end of file
+        try:
+            task_params = self.build_area_task_params(
+                geo_json=geo_json,
+                start_date=start_date,
+                end_date=end_date,
+                layers=layers,
+                projection=projection,
+                format_type=format_type
+            )
+            return self.submit_task(task_params, reuse_existing=reuse_existing, search_listing=search_listing)
+        except ValueError as e:
+            return {"error": str(e)}
@@ -1,112 +1,833 @@
 # src.appeears_client.task_orchestrator.py
+import os
+import math
 import time
+import logging
+import threading
+import requests
 from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor, InvalidStateError
 
+from ..exceptions import RequestError, TaskFailedError
 from .file_management import FileManager
 from .task_management import TaskManagement
+from .date_splitting import split_date_range, merge_file_listings
+from .spatial_tiling import split_area
+from .estimation import TaskEstimate, estimate_area_task, estimate_point_task
+from .task_store import TaskStore
+from .task_registry import TaskRegistry, fingerprint_task
+from .futures import TaskFuture, bind_current_future, bound_future, current_future, wait as futures_wait
+from .task_poller import TaskPoller
+from .transport import Transport, resolve_transport
+from .instrumentation import Instrumentation
+from .progress import ProgressReporter
+from .credential_pool import Account, CredentialPool
+
+logger = logging.getLogger(__name__)
 
 class TaskOrchestrator:
-    def __init__(self, token: str):
-        self.task_manager = TaskManagement(token=token)
-        self.file_manager = FileManager(token=token)
+    def __init__(
+            self,
+            token: str = None,
+            registry: TaskRegistry = None,
+            task_store: TaskStore = None,
+            max_workers: int = 32,
+            max_task_bytes: int = None,
+            oversize: str = "reject",
+            transport: Transport = None,
+            credential_pool: CredentialPool = None,
+            poll_interval: float = 10,
+            progress: ProgressReporter = None
+        ):
+        """
+        :param token: The authorization token used for the API, when no transport is given.
+        :param registry: Optional local registry used to reuse the tasks of repeated requests.
+        :param task_store: Optional durable store of submitted jobs, used to reattach to them after a restart.
+        :param max_workers: Maximum number of threads running the steps of requests at the same time: submitting,
+            listing and downloading. Waiting for tasks takes no thread, a single poller thread polls them all.
+        :param max_task_bytes: Optional limit on the estimated output size of a single task.
+        :param oversize: What to do with a request estimated above max_task_bytes: 'reject' it, or 'split' its
+            date range into as many tasks as needed to fit.
+        :param transport: Transport shared with the other managers, refreshing the token when it expires.
+        :param credential_pool: Optional pool of accounts the tasks are spread over. Each task is then polled
+            and downloaded with the account that submitted it.
+        :param poll_interval: Seconds between two status checks of a running task.
+        :param progress: Receiver of the progress of running tasks, defaults to progress bars in a terminal only.
+        """
+        if oversize not in ("reject", "split"):
+            raise ValueError(f"Unknown oversize policy: {oversize}")
+        if token is None and transport is None and credential_pool is not None:
+            transport = credential_pool.accounts[0].transport
+        transport = resolve_transport(token, transport)
+        self.registry = registry
+        self.poll_interval = poll_interval
+        self.task_manager = TaskManagement(registry=registry, transport=transport, poll_interval=poll_interval, progress=progress)
+        self.progress = self.task_manager.progress
+        self.file_manager = FileManager(transport=transport)
+        self.credential_pool = credential_pool
+        self._account_managers = {}
+        self._account_managers_lock = threading.Lock()
+        self.task_store = task_store
+        self.max_workers = max_workers
+        self.max_task_bytes = max_task_bytes
+        self.oversize = oversize
+        self._executor = None
+        self._executor_pid = None
+        self._executor_lock = threading.Lock()
+        self._task_poller = None
+        self._outstanding = set()
+        self._outstanding_lock = threading.Lock()
 
-    def execute_and_retrieve_area_task(
-        self, 
-        geo_json: dict, 
-        product_id: str,
-        band_names: list,
-        start_date: datetime, 
-        end_date: datetime
-    ):
-        """Orchestrates the area task submission, status checking, and file retrieval."""
+    @property
+    def instrumentation(self) -> Instrumentation:
+        """Receiver of the stage measurements, the one of the default transport."""
+        return self.task_manager.transport.instrumentation
+
+    def _submit(self, task_params: dict) -> dict:
+        """Submits a task and records its task_id on the TaskFuture of the request, if any."""
+        with self.instrumentation.stage('submit'):
+            response = self._submit_or_reattach(task_params)
+        future = current_future()
+        if future is not None and response.get('task_id'):
+            future.task_ids.append(response['task_id'])
+        return response
+
+    def _managers(self, account: Account = None) -> tuple:
+        """Returns the (TaskManagement, FileManager) pair sending requests with an account of the pool, or the default one."""
+        if account is None:
+            return self.task_manager, self.file_manager
+        with self._account_managers_lock:
+            managers = self._account_managers.get(account.name)
+            if managers is None:
+                managers = (
+                    TaskManagement(
+                        registry=self.registry, transport=account.transport,
+                        poll_interval=self.poll_interval, progress=self.progress, owner=account.name
+                    ),
+                    FileManager(transport=account.transport)
+                )
+                self._account_managers[account.name] = managers
+        return managers
+
+    def _managers_for_task(self, task_id: str) -> tuple:
+        """Returns the managers of the account owning a task."""
+        owner = self.credential_pool.owner(task_id) if self.credential_pool is not None else None
+        return self._managers(owner)
+
+    def _find_pool_task(self, task_params: dict, account: Account):
+        """
+        Looks up the registry for a reusable task of the request submitted by another account of the pool.
+
+        The registry is shared by the accounts, so such a task is checked, polled and downloaded with its owner.
+
+        :return: The (owner, task_id) pair, or None.
+        """
+        if self.registry is None:
+            return None
+        entry = self.registry.lookup(fingerprint_task(task_params))
+        if entry is None or entry['owner'] is None or entry['owner'] == account.name:
+            return None
         try:
-            # Convert datetime objects to strings in the required format
-            formatted_start_date = start_date.strftime("%m-%d-%Y")
-            formatted_end_date = end_date.strftime("%m-%d-%Y")
+            owner = self.credential_pool.account(entry['owner'])
+        except KeyError:
+            return None  # The task belongs to an account outside the pool
+        task_id = self._managers(owner)[0].find_reusable_task(task_params)
+        return (owner, task_id) if task_id else None
 
-            # Prepare layers list based on product_id and band_names, assuming all bands belong to the same product
-            layers = [{"product": product_id, "layer": band_name} for band_name in band_names]
+    def _submit_or_reattach(self, task_params: dict) -> dict:
+        """
+        Submits a task, or reattaches to the task already recorded for the same job in the task store.
 
-            # Submit the task and get task_id
-            response = self.task_manager.submit_area_task(
-                geo_json=geo_json,
-                start_date=formatted_start_date,
-                end_date=formatted_end_date,
-                layers=layers
+        Concurrent workers sharing the store submit each job once: the others wait for its task_id.
+        With a credential pool, the task is submitted with the account that has the most free capacity, and
+        a registered task is reused with the account that submitted it.
+        """
+        pool = self.credential_pool
+        account = None
+        if pool is not None:
+            with self.instrumentation.stage('account_wait'):
+                account = pool.acquire()
+        try:
+            job_key = None
+            if self.task_store is not None:
+                job_key = fingerprint_task(task_params)
+                while True:
+                    job = self.task_store.claim(job_key, task_params['params'])
+                    if job['claimed']:
+                        break
+                    task_id = job['task_id']
+                    owner = pool.adopt(task_id, job['owner']) if pool is not None and job.get('owner') else None
+                    if self._managers(owner)[0].is_task_available(task_id):
+                        if account is not None:
+                            pool.cancel(account)
+                            account = None
+                        logger.info("Reattaching to stored task %s", task_id, extra={'task_id': task_id})
+                        return {"message": "Reattached to stored task", "task_id": task_id, "reattached": True}
+                    # The server purged the task or its bundle expired, the job has to be submitted again
+                    logger.info("Stored task %s is gone or expired, submitting its job again", task_id, extra={'task_id': task_id})
+                    if owner is not None:
+                        pool.release(task_id)
+                    self.task_store.expire(job_key, task_id)
+
+            owner = account
+            try:
+                reused = self._find_pool_task(task_params, account) if account is not None else None
+                if reused is not None:
+                    owner, task_id = reused
+                    response = {"message": "Reusing existing task", "task_id": task_id, "reused": True}
+                else:
+                    response = self._managers(account)[0].submit_task(task_params)
+            except Exception:
+                if job_key is not None:
+                    self.task_store.release(job_key)
+                raise
+            task_id = response.get('task_id')
+            if job_key is not None:
+                if task_id:
+                    self.task_store.set_task_id(job_key, task_id, owner=owner.name if owner is not None else None)
+                else:
+                    self.task_store.release(job_key)
+            if account is not None and task_id:
+                if owner is account:
+                    pool.assign(account, task_id)
+                else:
+                    pool.cancel(account)
+                    pool.adopt(task_id, owner.name)
+                account = None
+            return response
+        finally:
+            if account is not None:
+                pool.cancel(account)
+
+    def _status_recorder(self, task_id: str):
+        """Returns a callable persisting the polled statuses of a running task in the task store, if any."""
+        if self.task_store is None:
+            return None
+        last_status = [None]
+
+        def record(status: str):
+            # 'done' is recorded with the bundle listing, so that a task is only done in the store once listed
+            if status != last_status[0] and status != 'done':
+                self.task_store.update_task(task_id, status=status)
+                last_status[0] = status
+
+        return record
+
+    def _list_files(self, task_manager: TaskManagement, task_id: str) -> list:
+        """Lists the files of a completed task, trying again while the listing cannot be reached."""
+        while True:
+            try:
+                return task_manager.list_task_files(task_id=task_id)
+            except requests.RequestException as e:
+                logger.warning("Could not list the files of the task %s, trying again: %s", task_id, e, extra={'task_id': task_id})
+                time.sleep(task_manager.poll_interval)
+
+    def _collect(self, task_id: str, error: Exception, started: float):
+        """
+        Lists the files of a task the poller saw complete, and records the outcome in the task store.
+
+        :param error: The error the task failed with, None if it is done.
+        :param started: perf_counter() value of when the wait for the task started.
+        :return: The files of the task, or the error it failed with.
+        """
+        files = []
+        if error is None:
+            logger.info("Task %s completed successfully", task_id, extra={'task_id': task_id})
+            files = self._list_files(self._managers_for_task(task_id)[0], task_id)
+            if not files:
+                error = TaskFailedError(f"No files available for the task {task_id}")
+        else:
+            logger.error("%s", error, extra={'task_id': task_id})
+        if self.task_store is not None:
+            self.task_store.update_task(task_id, status='done' if files else 'error', bundle=files)
+        if self.instrumentation.enabled:
+            self.instrumentation.record_stage(
+                'wait', time.perf_counter() - started, error=type(error).__name__ if error is not None else None
             )
+        return files if error is None else error
 
-            if 'task_id' not in response:
-                print("Failed to submit task:", response.get('error', 'Unknown Error'))
-                return None
+    # Requests run as generators of steps: they submit tasks, then yield the task_ids they wait for and receive
+    # a {task_id: files or error} mapping as soon as any of them completes or fails. The steps run on the
+    # executor while the waiting is done by the single poller thread, so a request only holds a thread while it
+    # submits, lists or downloads.
 
-            task_id = response['task_id']
-            print(f"Task submitted successfully, task ID: {task_id}")
+    def _steps_executor(self) -> ThreadPoolExecutor:
+        with self._executor_lock:
+            # The worker threads of an executor created before a fork do not exist in the child
+            if self._executor is None or self._executor_pid != os.getpid():
+                self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="appeears-task")
+                self._executor_pid = os.getpid()
+            return self._executor
 
-            # Check task status until done or failed
-            while True:
-                task_complete = self.task_manager.check_task_status(task_id=task_id)
-                if task_complete:
-                    print("Task completed successfully.")
-                    break
-                else:
-                    print("Task not completed yet. Waiting...")
-                    time.sleep(10)  # Wait before checking again to avoid too many requests
+    def _poller(self) -> TaskPoller:
+        with self._executor_lock:
+            if self._task_poller is None:
+                self._task_poller = TaskPoller(poll_interval=self.poll_interval)
+            return self._task_poller
 
-            # List files of the completed task
-            files = self.task_manager.list_task_files(task_id=task_id)
-            if files:
-                return files
-            else:
-                print("No files available or task failed.")
-                return None
+    def _start(self, steps, **kwargs) -> TaskFuture:
+        """Starts the steps of a request in the background and returns its TaskFuture right away."""
+        request = _Request(TaskFuture(), steps(**kwargs))
+        with self._outstanding_lock:
+            self._outstanding.add(request.future)
+        request.future.add_done_callback(self._forget)
+        self._schedule(request, self._begin, request)
+        return request.future
+
+    def _forget(self, future: TaskFuture):
+        with self._outstanding_lock:
+            self._outstanding.discard(future)
+
+    def _outstanding_futures(self) -> list:
+        """Snapshot of the futures of the requests not completed yet."""
+        with self._outstanding_lock:
+            return list(self._outstanding)
+
+    def _run(self, steps, **kwargs):
+        """Runs the steps of a request to completion, logging its error and returning None if it fails."""
+        try:
+            return self._start(steps, **kwargs).result()
         except Exception as e:
-            print(f"An error occurred: {str(e)}")
+            logger.error("An error occurred: %s", e)
             return None
 
-    def execute_and_retrieve_point_task(
-            self, 
-            latitude: float, 
-            longitude: float, 
-            product_id: str, 
-            band_names: list, 
-            start_date: datetime, 
-            end_date: datetime
-        ):
-        """Orchestrates the task submission, status checking, and file retrieval."""
+    def _schedule(self, request: '_Request', fn, *args):
+        try:
+            self._steps_executor().submit(fn, *args)
+        except RuntimeError as e:  # The executor was shut down meanwhile
+            if not request.future.done():
+                _complete(request.future, error=e)
+
+    def _begin(self, request: '_Request'):
+        try:
+            started = request.future.set_running_or_notify_cancel()
+        except RuntimeError:  # A shutdown cancelled the request meanwhile
+            return
+        if started:
+            self._advance(request, None)
+
+    def _advance(self, request: '_Request', results):
+        """Runs the steps of a request until they wait for tasks, which are handed to the poller."""
+        try:
+            with bound_future(request.future):
+                task_ids = request.steps.send(results)
+            for task_id in task_ids:
+                self._watch(request, task_id)
+        except StopIteration as stop:
+            _complete(request.future, stop.value)
+            return
+        except BaseException as e:
+            _complete(request.future, error=e)
+            return
+        with request.lock:
+            if not request.watching:
+                error = RuntimeError("A request waits for no task")
+            elif request.settled:
+                error = None  # Tasks settled while the steps ran, resume right away
+            else:
+                request.running = False
+                return
+        if error is not None:
+            _complete(request.future, error=error)
+        else:
+            self._schedule(request, self._resume, request)
+
+    def _watch(self, request: '_Request', task_id: str):
+        with request.lock:
+            if request.future.done() or task_id in request.watching or task_id in request.settled:
+                return  # Already watched, or the request was failed by a shutdown
+            request.watching[task_id] = time.perf_counter()
+        watch = self._poller().watch(
+            self._managers_for_task(task_id)[0], task_id, on_status=self._status_recorder(task_id)
+        )
+        watch.add_done_callback(lambda done: self._settled(request, task_id, done.exception()))
+
+    def _settled(self, request: '_Request', task_id: str, error: Exception):
+        """Called from the poller thread when a task a request waits for is done or failed."""
+        if self.credential_pool is not None:
+            self.credential_pool.release(task_id)
+        with request.lock:
+            request.settled[task_id] = error
+            if request.running:
+                return
+            request.running = True
+        self._schedule(request, self._resume, request)
+
+    def _resume(self, request: '_Request'):
+        if request.future.done():
+            return
+        with request.lock:
+            settled, request.settled = request.settled, {}
+            started = {task_id: request.watching.pop(task_id) for task_id in settled}
         try:
-            # Submit the task and get task_id
-            response = self.task_manager.submit_point_task(
+            with bound_future(request.future):
+                results = {task_id: self._collect(task_id, error, started[task_id]) for task_id, error in settled.items()}
+        except BaseException as e:
+            _complete(request.future, error=e)
+            return
+        self._advance(request, results)
+
+    def _resume_steps(self):
+        """Steps of resume_in_flight_tasks."""
+        jobs = self.task_store.in_flight_jobs() if self.task_store is not None else []
+        for job in jobs:
+            logger.info("Resuming task %s", job['task_id'], extra={'task_id': job['task_id']})
+            if self.credential_pool is not None and job.get('owner'):
+                self.credential_pool.adopt(job['task_id'], job['owner'])
+        results = {}
+        pending = [job['task_id'] for job in jobs]
+        while pending:
+            completed = yield pending
+            for task_id, files in completed.items():
+                results[task_id] = [] if isinstance(files, Exception) else files
+            pending = [task_id for task_id in pending if task_id not in results]
+        return results
+
+    def resume_in_flight_tasks(self) -> dict:
+        """
+        Waits for the tasks the task store recorded as in flight, e.g. after a restart, and lists their files.
+
+        :return: A {task_id: files} mapping, a failed task having no files.
+        """
+        return self._start(self._resume_steps).result()
+
+    def _fit_size_limit(self, estimate, num_slices: int) -> int:
+        """
+        Checks the estimated output of a request against max_task_bytes before anything is submitted.
+
+        Raises ValueError if the request is rejected.
+
+        :param estimate: Callable without arguments returning the TaskEstimate of the whole request.
+        :param num_slices: Number of date slices requested.
+        :return: The number of date slices to run.
+        """
+        if self.max_task_bytes is None:
+            return num_slices
+        result: TaskEstimate = estimate()
+        if result.bytes <= self.max_task_bytes * num_slices:
+            return num_slices
+
+        needed = math.ceil(result.bytes / self.max_task_bytes)
+        if self.oversize == "split" and needed <= result.periods:
+            logger.info("Request estimated at %d bytes, splitting it into %d tasks", result.bytes, needed)
+            return needed
+        raise ValueError(
+            f"Request rejected: estimated at {result.bytes} bytes in {result.file_count} files, "
+            f"above the limit of {self.max_task_bytes} bytes per task"
+        )
+
+    def _run_subtasks(self, subtasks: dict, retries: int, max_in_flight: int = None, on_complete=None):
+        """
+        Steps submitting sub-tasks, waiting for them and resubmitting the failed ones.
+
+        :param subtasks: {key: (submit, label)}, submit being a callable without arguments returning the
+            submission response, and label a human readable description of the sub-task used in messages.
+        :param retries: Number of times a failed sub-task is resubmitted.
+        :param max_in_flight: Optional maximum number of sub-tasks submitted and not completed at a time.
+        :param on_complete: Optional callable receiving (key, task_id, files) as soon as a sub-task completes.
+        :return: {key: (task_id, files)} for the sub-tasks that completed, and {key: error} for the others.
+        """
+        attempts = dict.fromkeys(subtasks, 0)
+        outcomes = {}
+        pending = {}  # task_id -> keys of the sub-tasks it serves
+        queue = list(subtasks)
+        limit = max_in_flight or len(queue)
+
+        def submit(key, error=None):
+            """Submits a sub-task until it gets a task_id, returning the task_id or the last error."""
+            send, label = subtasks[key]
+            while attempts[key] <= retries:
+                attempts[key] += 1
+                try:
+                    response = send()
+                except ValueError as e:
+                    return e  # An invalid request fails the same way every time
+                except Exception as e:
+                    logger.error("An error occurred in %s: %s", label, e)
+                    error = e
+                    continue
+                if 'task_id' not in response:
+                    error = RequestError(f"Failed to submit {label}: {response.get('error', 'Unknown Error')}")
+                    logger.error("%s", error)
+                    continue
+                logger.info("%s submitted, task ID: %s", label, response['task_id'], extra={'task_id': response['task_id']})
+                return response['task_id']
+            return error
+
+        def record(key, outcome):
+            if isinstance(outcome, Exception):
+                outcomes[key] = outcome
+            else:
+                pending.setdefault(outcome, []).append(key)
+
+        def in_flight():
+            return sum(len(keys) for keys in pending.values())
+
+        def fill():
+            """Submits queued sub-tasks while there is room, the first ones in parallel."""
+            batch = []
+            while queue and in_flight() + len(batch) < limit:
+                batch.append(queue.pop(0))
+            if len(batch) > 1:
+                with ThreadPoolExecutor(max_workers=min(len(batch), self.max_workers)) as executor:
+                    for key, outcome in zip(batch, executor.map(bind_current_future(submit), batch)):
+                        record(key, outcome)
+            elif batch:
+                record(batch[0], submit(batch[0]))
+
+        fill()
+        while pending or queue:
+            if not pending:
+                fill()
+                continue
+            completed = yield list(pending)
+            for task_id, files in completed.items():
+                for key in pending.pop(task_id, []):
+                    if isinstance(files, Exception):
+                        record(key, submit(key, files))
+                    else:
+                        outcomes[key] = (task_id, files)
+                        if on_complete is not None:
+                            on_complete(key, task_id, files)
+            fill()
+        return outcomes
+
+    def _sliced_steps(self, submit, product_id: str, start_date: datetime, end_date: datetime, num_slices: int, slice_retries: int):
+        """
+        Steps running a request as one task, or as parallel date slices whose files are merged into one
+        time-ordered listing. A failed slice only leaves its own files out.
+        """
+        if num_slices == 1:
+            outcome = (yield from self._run_subtasks({0: (lambda: submit(start_date, end_date), "task")}, retries=0))[0]
+            if isinstance(outcome, Exception):
+                raise outcome
+            return outcome[1]
+
+        slices = split_date_range(start_date, end_date, num_slices, product_id=product_id)
+        outcomes = yield from self._run_subtasks(
+            {
+                (slice_start, slice_end): (
+                    lambda slice_start=slice_start, slice_end=slice_end: submit(slice_start, slice_end),
+                    f"slice {slice_start:%Y-%m-%d} - {slice_end:%Y-%m-%d}"
+                )
+                for slice_start, slice_end in slices
+            },
+            retries=slice_retries
+        )
+        for (slice_start, slice_end), outcome in outcomes.items():
+            if isinstance(outcome, Exception):
+                logger.error("Slice %s - %s failed, its files are missing from the result", f"{slice_start:%Y-%m-%d}", f"{slice_end:%Y-%m-%d}")
+
+        files = merge_file_listings([outcome for outcome in outcomes.values() if not isinstance(outcome, Exception)])
+        if not files:
+            raise TaskFailedError("No files available or task failed")
+        return files
+
+    def _area_steps(
+        self,
+        geo_json: dict,
+        product_id: str,
+        band_names: list,
+        start_date: datetime,
+        end_date: datetime,
+        num_slices: int = 1,
+        slice_retries: int = 1
+    ):
+        """Steps of execute_and_retrieve_area_task."""
+        # Prepare layers list based on product_id and band_names, assuming all bands belong to the same product
+        layers = [{"product": product_id, "layer": band_name} for band_name in band_names]
+
+        def submit(slice_start: datetime, slice_end: datetime) -> dict:
+            # Convert datetime objects to strings in the required format
+            return self._submit(self.task_manager.build_area_task_params(
+                geo_json=geo_json,
+                start_date=slice_start.strftime("%m-%d-%Y"),
+                end_date=slice_end.strftime("%m-%d-%Y"),
+                layers=layers
+            ))
+
+        num_slices = self._fit_size_limit(
+            lambda: estimate_area_task(geo_json, product_id, band_names, start_date, end_date), num_slices
+        )
+        return (yield from self._sliced_steps(submit, product_id, start_date, end_date, num_slices, slice_retries))
+
+    def _point_steps(
+            self,
+            latitude: float,
+            longitude: float,
+            product_id: str,
+            band_names: list,
+            start_date: datetime,
+            end_date: datetime,
+            num_slices: int = 1,
+            slice_retries: int = 1
+        ):
+        """Steps of execute_and_retrieve_point_task."""
+        def submit(slice_start: datetime, slice_end: datetime) -> dict:
+            return self._submit(self.task_manager.build_point_task_params(
                 latitude=latitude,
                 longitude=longitude,
                 product_id=product_id,
                 band_names=band_names,
-                start_date=start_date,
-                end_date=end_date
+                start_date=slice_start,
+                end_date=slice_end
+            ))
+
+        num_slices = self._fit_size_limit(
+            lambda: estimate_point_task(latitude, longitude, product_id, band_names, start_date, end_date), num_slices
+        )
+        return (yield from self._sliced_steps(submit, product_id, start_date, end_date, num_slices, slice_retries))
+
+    def execute_and_retrieve_area_task(
+        self,
+        geo_json: dict,
+        product_id: str,
+        band_names: list,
+        start_date: datetime,
+        end_date: datetime,
+        num_slices: int = 1,
+        slice_retries: int = 1
+    ):
+        """
+        Orchestrates the area task submission, status checking, and file retrieval.
+
+        With num_slices > 1 the date range is split into sub-ranges aligned to the product's compositing
+        period, submitted as parallel tasks, and their files merged into one time-ordered listing in which
+        each entry carries its own task_id. Returns None if the request failed, after logging why.
+        """
+        return self._run(
+            self._area_steps, geo_json=geo_json, product_id=product_id, band_names=band_names,
+            start_date=start_date, end_date=end_date, num_slices=num_slices, slice_retries=slice_retries
+        )
+
+    def execute_and_retrieve_point_task(
+            self,
+            latitude: float,
+            longitude: float,
+            product_id: str,
+            band_names: list,
+            start_date: datetime,
+            end_date: datetime,
+            num_slices: int = 1,
+            slice_retries: int = 1
+        ):
+        """
+        Orchestrates the task submission, status checking, and file retrieval.
+
+        num_slices and slice_retries behave as in execute_and_retrieve_area_task.
+        """
+        return self._run(
+            self._point_steps, latitude=latitude, longitude=longitude, product_id=product_id, band_names=band_names,
+            start_date=start_date, end_date=end_date, num_slices=num_slices, slice_retries=slice_retries
+        )
+
+    def _tiled_area_steps(
+        self,
+        geo_json: dict,
+        product_id: str,
+        band_names: list,
+        start_date: datetime,
+        end_date: datetime,
+        destination_dir: str,
+        target_pixels: int = 10_000_000,
+        strategy: str = "grid",
+        max_workers: int = 8,
+        tile_retries: int = 1
+    ):
+        """Steps of execute_and_retrieve_tiled_area_task."""
+        tiles = split_area(geo_json, product_id=product_id, target_pixels=target_pixels, strategy=strategy)
+        logger.info("Area split into %d tiles", len(tiles))
+
+        # Tiles are about the same size, so the largest one decides whether all of them fit max_task_bytes
+        num_slices = self._fit_size_limit(
+            lambda: max(
+                (estimate_area_task(tile, product_id, band_names, start_date, end_date) for tile in tiles),
+                key=lambda estimate: estimate.bytes
+            ),
+            1
+        )
+        slices = split_date_range(start_date, end_date, num_slices, product_id=product_id) if num_slices > 1 else [(start_date, end_date)]
+
+        layers = [{"product": product_id, "layer": band_name} for band_name in band_names]
+
+        def submit(tile: dict, slice_start: datetime, slice_end: datetime) -> dict:
+            return self._submit(self.task_manager.build_area_task_params(
+                geo_json=tile,
+                start_date=slice_start.strftime("%m-%d-%Y"),
+                end_date=slice_end.strftime("%m-%d-%Y"),
+                layers=layers
+            ))
+
+        def label(index: int, slice_start: datetime, slice_end: datetime) -> str:
+            if len(slices) == 1:
+                return f"tile {index}"
+            return f"tile {index} ({slice_start:%Y-%m-%d} to {slice_end:%Y-%m-%d})"
+
+        def download(index: int, task_id: str, files: list):
+            tile_dir = os.path.join(destination_dir, 'tiles', str(index))
+            already_downloaded = self.task_store.downloaded_files(task_id) if self.task_store is not None else {}
+            downloaded = []
+            for file_info in files:
+                if not file_info['file_name'].endswith('.tif'):
+                    continue
+                file_path = os.path.join(tile_dir, file_info['file_name'])
+                if file_info['file_id'] in already_downloaded and os.path.exists(file_path):
+                    downloaded.append(file_info['file_name'])
+                    continue
+                response = self._managers_for_task(task_id)[1].download_and_process_file(
+                    task_id=task_id,
+                    file_id=file_info['file_id'],
+                    file_name=file_info['file_name'],
+                    destination_dir=tile_dir
+                )
+                if 'error' not in response:
+                    downloaded.append(file_info['file_name'])
+                    if self.task_store is not None:
+                        self.task_store.mark_downloaded(task_id, file_info['file_id'], file_info['file_name'], file_path)
+            return tile_dir, downloaded
+
+        # A tile split into date slices runs one task per slice, all downloading into the tile's directory.
+        # Tiles are downloaded as soon as their task completes, while the other tiles are still running
+        subtasks = {
+            (index, slice_index): (
+                lambda tile=tile, dates=dates: submit(tile, *dates), label(index, *dates)
+            )
+            for index, tile in enumerate(tiles)
+            for slice_index, dates in enumerate(slices)
+        }
+        with ThreadPoolExecutor(max_workers=max_workers) as downloader:
+            downloads = {}
+            outcomes = yield from self._run_subtasks(
+                subtasks,
+                retries=tile_retries,
+                max_in_flight=max_workers,
+                on_complete=lambda key, task_id, files: downloads.__setitem__(key, downloader.submit(download, key[0], task_id, files))
             )
+            results = {key: future.result() for key, future in downloads.items()}
 
-            if 'task_id' not in response:
-                print("Failed to submit task:", response.get('error', 'Unknown Error'))
-                return None
+        failed = sorted({index for (index, _), outcome in outcomes.items() if isinstance(outcome, Exception)})
+        if failed:
+            logger.error("Tiles %s failed, the mosaics will have gaps over them", failed)
+
+        # Tiles share file names for the same layer and date, which is how they are grouped for the mosaic
+        tiles_by_file = {}
+        for key in sorted(results):
+            tile_dir, file_names = results[key]
+            for file_name in file_names:
+                tiles_by_file.setdefault(file_name, []).append(os.path.join(tile_dir, file_name))
+
+        if not tiles_by_file:
+            raise TaskFailedError("No files available or task failed")
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            mosaics = list(executor.map(
+                lambda item: self.file_manager.mosaic_files(item[1], os.path.join(destination_dir, item[0])),
+                tiles_by_file.items()
+            ))
+        return sorted(mosaics)
+
+    def execute_and_retrieve_tiled_area_task(
+        self,
+        geo_json: dict,
+        product_id: str,
+        band_names: list,
+        start_date: datetime,
+        end_date: datetime,
+        destination_dir: str,
+        target_pixels: int = 10_000_000,
+        strategy: str = "grid",
+        max_workers: int = 8,
+        tile_retries: int = 1
+    ):
+        """
+        Splits a large area into tiles, runs them as parallel area tasks and mosaics their GeoTIFFs locally.
 
-            task_id = response['task_id']
-            print(f"Task submitted successfully, task ID: {task_id}")
+        :param geo_json: GeoJSON dictionary defining the area.
+        :param destination_dir: Directory where the tiles are downloaded (under 'tiles/') and the mosaics written.
+        :param target_pixels: Maximum number of pixels per tile, per layer and date, for the product's pixel size.
+        :param strategy: 'grid' or 'features', see spatial_tiling.split_area.
+        :param max_workers: Maximum number of tiles running and files downloaded concurrently.
+        :param tile_retries: Number of times a failed tile is resubmitted.
+        :return: Sorted list of the mosaic paths, or None if no tile succeeded.
 
-            # Check task status until done or failed
-            while True:
-                if self.task_manager.check_task_status(task_id=task_id):
-                    print("Task completed successfully.")
-                    break
+        Each tile is checked against max_task_bytes before anything is submitted: with oversize="split" the
+        tiles too large for one task run as several date slices, otherwise the request is rejected.
+        """
+        return self._run(
+            self._tiled_area_steps, geo_json=geo_json, product_id=product_id, band_names=band_names,
+            start_date=start_date, end_date=end_date, destination_dir=destination_dir, target_pixels=target_pixels,
+            strategy=strategy, max_workers=max_workers, tile_retries=tile_retries
+        )
+
+    def submit_point_task(self, **kwargs) -> TaskFuture:
+        """
+        Submits a point request in the background and returns its TaskFuture right away.
+
+        Takes the same keyword arguments as execute_and_retrieve_point_task. The future raises the request's
+        error instead of resolving to None.
+        """
+        return self._start(self._point_steps, **kwargs)
+
+    def submit_area_task(self, **kwargs) -> TaskFuture:
+        """
+        Submits an area request in the background and returns its TaskFuture right away.
+
+        Takes the same keyword arguments as execute_and_retrieve_area_task. The future raises the request's
+        error instead of resolving to None.
+        """
+        return self._start(self._area_steps, **kwargs)
+
+    def submit_tiled_area_task(self, **kwargs) -> TaskFuture:
+        """
+        Submits a tiled area request in the background and returns its TaskFuture right away.
+
+        Takes the same keyword arguments as execute_and_retrieve_tiled_area_task. The future raises the
+        request's error instead of resolving to None.
+        """
+        return self._start(self._tiled_area_steps, **kwargs)
+
+    def shutdown(self, wait: bool = True):
+        """
+        Stops the background requests, optionally waiting for the running ones to complete first.
+
+        Without waiting, the requests not completed yet are cancelled, or fail with a RuntimeError if they
+        already started, so that nothing blocks on their futures. Their tasks keep running on the server.
+        """
+        if wait:
+            futures_wait(self._outstanding_futures())
+        else:
+            for future in self._outstanding_futures():
+                if future.cancel():
+                    future.set_running_or_notify_cancel()  # Wakes up wait() and as_completed() callers
                 else:
-                    print("Task not completed yet. Waiting...")
-                    time.sleep(10)  # Wait before checking again to avoid too many requests
+                    _complete(future, error=RuntimeError("The orchestrator was shut down before the request completed"))
+        with self._executor_lock:
+            executor, self._executor = self._executor, None
+            poller, self._task_poller = self._task_poller, None
+        if executor is not None:
+            executor.shutdown(wait=wait, cancel_futures=not wait)
+        if poller is not None:
+            poller.close()
 
-            # List files of the completed task
-            files = self.task_manager.list_task_files(task_id=task_id)
-            if files:
-                return files
-            else:
-                print("No files available or task failed.")
-                return None
-        except Exception as e:
-            print(f"An error occurred: {str(e)}")
-            return None
+def _complete(future: TaskFuture, result=None, error: BaseException = None):
+    """Sets the outcome of a request's future, unless a shutdown already failed or cancelled it."""
+    try:
+        if error is not None:
+            future.set_exception(error)
+        else:
+            future.set_result(result)
+    except InvalidStateError:
+        pass
+
+class _Request:
+    """A request run by an orchestrator: its future, its steps, and the tasks it waits for."""
+
+    __slots__ = ('future', 'steps', 'watching', 'settled', 'running', 'lock')
+
+    def __init__(self, future: TaskFuture, steps):
+        self.future = future
+        self.steps = steps
+        self.watching = {}  # task_id -> perf_counter() value of when the wait started
+        self.settled = {}   # task_id -> error of the tasks settled since the steps last ran, None when done
+        self.running = True  # Whether the steps are running or scheduled to
+        self.lock = threading.Lock()
@@ -0,0 +1,136 @@
+# src.appeears_client.task_poller.py
+import os
+import time
+import logging
+import threading
+import requests
+from concurrent.futures import Future
+
+from ..exceptions import RequestError
+from .task_management import TaskManagement
+
+logger = logging.getLogger(__name__)
+
+class _Watch:
+    """A task followed by the poller, with the futures of everyone waiting for it."""
+
+    __slots__ = ('task_manager', 'task_id', 'waiters', 'on_status', 'next_poll', 'queued_logged')
+
+    def __init__(self, task_manager: TaskManagement, task_id: str):
+        self.task_manager = task_manager
+        self.task_id = task_id
+        self.waiters = []
+        self.on_status = []
+        self.next_poll = 0.0
+        self.queued_logged = False
+
+class TaskPoller:
+    """
+    Polls the status of every running task of an orchestrator from a single background thread.
+
+    Each watched task is checked once per poll_interval, however many requests wait for it. A status the
+    transport could not read is checked again at the next round, since the task keeps running on the server.
+    """
+
+    def __init__(self, poll_interval: float = 10):
+        """
+        :param poll_interval: Seconds between two status checks of a running task.
+        """
+        self.poll_interval = poll_interval
+        self._watches = {}
+        self._condition = threading.Condition()
+        self._thread = None
+        self._pid = None
+        self._closed = False
+
+    def watch(self, task_manager: TaskManagement, task_id: str, on_status=None) -> Future:
+        """
+        Follows a task until it is done or failed.
+
+        :param task_manager: Manager sending the status requests, with the account owning the task.
+        :param on_status: Optional callable receiving every status read.
+        :return: A future resolving to None once the task is done, or to the TaskFailedError it failed with.
+        """
+        future = Future()
+        future.set_running_or_notify_cancel()
+        with self._condition:
+            if self._closed:
+                raise RuntimeError("The task poller is closed")
+            watch = self._watches.get(task_id)
+            if watch is None:
+                watch = self._watches[task_id] = _Watch(task_manager, task_id)
+            watch.waiters.append(future)
+            if on_status is not None:
+                watch.on_status.append(on_status)
+            # The thread of a poller created before a fork does not exist in the child
+            if self._thread is None or self._pid != os.getpid():
+                self._thread = threading.Thread(target=self._run, name="appeears-poller", daemon=True)
+                self._pid = os.getpid()
+                self._thread.start()
+            self._condition.notify()
+        return future
+
+    def close(self):
+        """
+        Stops the poller thread. Tasks still watched are no longer polled: their futures fail with a
+        RuntimeError, so that nobody waits for them forever.
+        """
+        with self._condition:
+            self._closed = True
+            watches = list(self._watches.values())
+            self._condition.notify()
+        for watch in watches:
+            self._settle(watch, RuntimeError(f"The task poller was closed before the task {watch.task_id} completed"))
+
+    def _run(self):
+        while True:
+            with self._condition:
+                while True:
+                    if self._closed:
+                        return
+                    now = time.monotonic()
+                    due = [watch for watch in self._watches.values() if watch.next_poll <= now]
+                    if due:
+                        break
+                    next_poll = min((watch.next_poll for watch in self._watches.values()), default=None)
+                    self._condition.wait(None if next_poll is None else next_poll - now)
+            for watch in due:
+                self._poll(watch)
+
+    def _poll(self, watch: _Watch):
+        task_id = watch.task_id
+        try:
+            status = watch.task_manager.get_task_status(task_id)
+        except (RequestError, requests.RequestException) as e:
+            logger.warning("Could not check the status of the task %s, polling again: %s", task_id, e, extra={'task_id': task_id})
+            watch.next_poll = time.monotonic() + self.poll_interval
+            return
+        except Exception as e:
+            self._settle(watch, e)
+            return
+        for on_status in list(watch.on_status):
+            try:
+                on_status(status)
+            except Exception:
+                logger.exception("Could not record the status of the task %s", task_id, extra={'task_id': task_id})
+        if status == 'done':
+            self._settle(watch)
+            return
+        if status == 'queued' and not watch.queued_logged:
+            logger.info("Task %s queued, waiting for the AppEEARS server", task_id, extra={'task_id': task_id})
+            watch.queued_logged = True
+        watch.next_poll = time.monotonic() + self.poll_interval
+
+    def _settle(self, watch: _Watch, error: Exception = None):
+        with self._condition:
+            # close() and the poller thread may both settle a watch, its waiters are only notified once
+            if self._watches.get(watch.task_id) is not watch:
+                return
+            del self._watches[watch.task_id]
+            waiters = list(watch.waiters)
+        watch.task_manager.progress.close(watch.task_id)
+        for future in waiters:
+            if error is None:
+                future.set_result(None)
+            else:
+                future.set_exception(error)
@@ -0,0 +1,103 @@
+# src.appeears_client.task_registry.py
+import os
+import json
+import hashlib
+import threading
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Optional
+
+try:
+    import fcntl
+except ImportError:  # Windows: the registry still works, without cross-process locking
+    fcntl = None
+
+def _canonical_params(task_type: str, params: dict) -> dict:
+    """Normalizes task params so that requests differing only in layer order hash the same."""
+    canonical = dict(params)
+    if 'layers' in canonical:
+        canonical['layers'] = sorted(canonical['layers'], key=lambda layer: (layer.get('product', ''), layer.get('layer', '')))
+    return {"task_type": task_type, "params": canonical}
+
+def fingerprint_task(task_params: dict) -> str:
+    """
+    Returns a canonical SHA-256 fingerprint of a task request.
+
+    Only the task type and its params are hashed, so the task name (which carries a timestamp) does not matter.
+
+    :param task_params: The task request body, as sent to POST /task.
+    """
+    canonical = _canonical_params(task_params.get('task_type', ''), task_params.get('params', {}))
+    encoded = json.dumps(canonical, sort_keys=True, separators=(',', ':'), ensure_ascii=True)
+    return hashlib.sha256(encoded.encode('utf-8')).hexdigest()
+
+class TaskRegistry:
+    """
+    Local JSON registry mapping request fingerprints to the AppEEARS tasks that served them, and the accounts
+    owning those tasks.
+
+    Updates read, change and write the file under an exclusive file lock, so that processes sharing the
+    registry never lose each other's entries.
+    """
+
+    def __init__(self, path: str = os.path.join(os.path.expanduser('~'), '.appeears', 'task_registry.json')):
+        self.path = path
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def _locked(self):
+        """Holds the registry lock of this process and, where available, an exclusive lock on the lock file."""
+        with self._lock:
+            os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+            fd = os.open(f"{self.path}.lock", os.O_RDWR | os.O_CREAT, 0o600)
+            try:
+                if fcntl is not None:
+                    fcntl.flock(fd, fcntl.LOCK_EX)
+                yield
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(fd, fcntl.LOCK_UN)
+                os.close(fd)
+
+    def _load(self) -> dict:
+        try:
+            with open(self.path, 'r') as f:
+                return json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return {}
+
+    def _save(self, entries: dict):
+        """Writes the registry through a temporary file so readers never see a partial file."""
+        temp_path = f"{self.path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(temp_path, 'w') as f:
+            json.dump(entries, f)
+        os.replace(temp_path, self.path)
+
+    def lookup(self, fingerprint: str) -> Optional[dict]:
+        """Returns the entry recorded for a fingerprint, {'task_id', 'owner', 'recorded'}, if any."""
+        entry = self._load().get(fingerprint)
+        return {"owner": None, **entry} if entry else None
+
+    def get(self, fingerprint: str) -> Optional[str]:
+        """Returns the task_id recorded for a fingerprint, if any."""
+        entry = self.lookup(fingerprint)
+        return entry['task_id'] if entry else None
+
+    def record(self, fingerprint: str, task_id: str, owner: str = None):
+        """
+        Records the task serving a fingerprint.
+
+        :param owner: Name of the account that submitted the task, the only one able to poll and download it.
+        """
+        with self._locked():
+            entries = self._load()
+            entries[fingerprint] = {"task_id": task_id, "owner": owner, "recorded": datetime.now().isoformat()}
+            self._save(entries)
+
+    def forget(self, fingerprint: str):
+        """Removes a fingerprint, e.g. when its task failed or its bundle expired."""
+        with self._locked():
+            entries = self._load()
+            if entries.pop(fingerprint, None) is None:
+                return
+            self._save(entries)
@@ -0,0 +1,206 @@
+# src.appeears_client.task_store.py
+import os
+import json
+import time
+import socket
+import sqlite3
+import threading
+from contextlib import contextmanager
+from typing import Optional
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    job_key TEXT PRIMARY KEY,
+    spec TEXT NOT NULL,
+    task_id TEXT,
+    owner TEXT,
+    status TEXT NOT NULL,
+    bundle TEXT,
+    claimed_by TEXT,
+    claimed_at REAL,
+    updated_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS jobs_task_id ON jobs (task_id);
+CREATE TABLE IF NOT EXISTS downloads (
+    job_key TEXT NOT NULL,
+    file_id TEXT NOT NULL,
+    file_name TEXT NOT NULL,
+    path TEXT NOT NULL,
+    completed_at REAL NOT NULL,
+    PRIMARY KEY (job_key, file_id)
+);
+"""
+
+# Statuses of jobs whose task can still be polled
+IN_FLIGHT_STATUSES = ('submitted', 'queued', 'pending', 'processing')
+
+# Statuses of jobs whose task can no longer serve them, so that they are submitted again
+RESUBMIT_STATUSES = ('error', 'expired')
+
+class TaskStore:
+    """
+    Durable SQLite record of orchestrated jobs: spec, task_id, status, bundle listing and download progress.
+
+    Jobs are keyed by the fingerprint of their task params. The database runs in WAL mode and every write
+    happens in an immediate transaction, so several threads and worker processes on one host can share it.
+    """
+
+    def __init__(self, path: str = os.path.join(os.path.expanduser('~'), '.appeears', 'tasks.sqlite3'), lease_seconds: float = 300):
+        """
+        :param path: Path of the SQLite database file.
+        :param lease_seconds: How long a worker may hold a submission claim before others take it over.
+        """
+        self.path = path
+        self.lease_seconds = lease_seconds
+        self._local = threading.local()
+        os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+        connection = self._connection()
+        connection.executescript(SCHEMA)
+        # Stores created before tasks had owners lack the column
+        if 'owner' not in {row['name'] for row in connection.execute("PRAGMA table_info(jobs)")}:
+            try:
+                connection.execute("ALTER TABLE jobs ADD COLUMN owner TEXT")
+            except sqlite3.OperationalError:
+                pass  # Added by another worker in the meantime
+
+    def _connection(self) -> sqlite3.Connection:
+        """Returns the connection of the current thread, opening a new one after a fork."""
+        connection = getattr(self._local, 'connection', None)
+        if connection is None or self._local.pid != os.getpid():
+            connection = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+            connection.row_factory = sqlite3.Row
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA busy_timeout=30000")
+            self._local.connection = connection
+            self._local.pid = os.getpid()
+        return connection
+
+    @contextmanager
+    def _transaction(self):
+        """Runs a block in an immediate transaction, taking the write lock up front to avoid upgrade deadlocks."""
+        connection = self._connection()
+        connection.execute("BEGIN IMMEDIATE")
+        try:
+            yield connection
+        except BaseException:
+            connection.execute("ROLLBACK")
+            raise
+        connection.execute("COMMIT")
+
+    @staticmethod
+    def _worker_id() -> str:
+        return f"{socket.gethostname()}:{os.getpid()}:{threading.get_ident()}"
+
+    @staticmethod
+    def _row_to_job(row: sqlite3.Row) -> Optional[dict]:
+        if row is None:
+            return None
+        job = dict(row)
+        job['spec'] = json.loads(job['spec'])
+        job['bundle'] = json.loads(job['bundle']) if job['bundle'] else None
+        return job
+
+    def get_job(self, job_key: str) -> Optional[dict]:
+        """Returns the stored job, or None."""
+        row = self._connection().execute("SELECT * FROM jobs WHERE job_key = ?", (job_key,)).fetchone()
+        return self._row_to_job(row)
+
+    def claim(self, job_key: str, spec: dict, wait_seconds: float = 600, poll_interval: float = 1.0) -> dict:
+        """
+        Claims the right to submit a job, or returns the job if it already has a task that did not fail or expire.
+
+        When another worker holds an unexpired claim, waits for it to record its task_id.
+
+        :param job_key: Fingerprint of the job's task params.
+        :param spec: The task params, stored for later inspection.
+        :return: The job, with a 'claimed' flag telling whether the caller must submit it.
+        """
+        deadline = time.monotonic() + wait_seconds
+        while True:
+            now = time.time()
+            with self._transaction() as connection:
+                row = connection.execute("SELECT * FROM jobs WHERE job_key = ?", (job_key,)).fetchone()
+                if row is not None and row['task_id'] and row['status'] not in RESUBMIT_STATUSES:
+                    return {**self._row_to_job(row), 'claimed': False}
+                claim_free = (
+                    row is None or row['claimed_by'] is None
+                    or row['claimed_at'] is None or now - row['claimed_at'] > self.lease_seconds
+                )
+                if claim_free:
+                    connection.execute(
+                        "INSERT INTO jobs (job_key, spec, task_id, status, bundle, claimed_by, claimed_at, updated_at) "
+                        "VALUES (?, ?, NULL, 'claimed', NULL, ?, ?, ?) "
+                        "ON CONFLICT (job_key) DO UPDATE SET task_id = NULL, owner = NULL, status = 'claimed', bundle = NULL, "
+                        "claimed_by = excluded.claimed_by, claimed_at = excluded.claimed_at, updated_at = excluded.updated_at",
+                        (job_key, json.dumps(spec), self._worker_id(), now, now)
+                    )
+                    return {**self.get_job(job_key), 'claimed': True}
+            if time.monotonic() > deadline:
+                raise TimeoutError(f"Job {job_key} is still being submitted by another worker")
+            time.sleep(poll_interval)
+
+    def release(self, job_key: str):
+        """Releases a submission claim without a task, e.g. after a failed submission."""
+        with self._transaction() as connection:
+            connection.execute(
+                "UPDATE jobs SET status = 'error', claimed_by = NULL, claimed_at = NULL, updated_at = ? WHERE job_key = ?",
+                (time.time(), job_key)
+            )
+
+    def set_task_id(self, job_key: str, task_id: str, owner: str = None):
+        """
+        Records the task_id a claimed job was submitted as.
+
+        :param owner: Name of the account the task was submitted with, when a credential pool is used.
+        """
+        with self._transaction() as connection:
+            connection.execute(
+                "UPDATE jobs SET task_id = ?, owner = ?, status = 'submitted', claimed_by = NULL, claimed_at = NULL, "
+                "updated_at = ? WHERE job_key = ?",
+                (task_id, owner, time.time(), job_key)
+            )
+
+    def expire(self, job_key: str, task_id: str):
+        """Marks the task of a job as gone from the server, unless the job was resubmitted as another task meanwhile."""
+        with self._transaction() as connection:
+            connection.execute(
+                "UPDATE jobs SET status = 'expired', updated_at = ? WHERE job_key = ? AND task_id = ?",
+                (time.time(), job_key, task_id)
+            )
+
+    def update_task(self, task_id: str, status: str = None, bundle: list = None):
+        """Updates the status and/or bundle listing of the jobs served by a task."""
+        with self._transaction() as connection:
+            if status is not None:
+                connection.execute(
+                    "UPDATE jobs SET status = ?, updated_at = ? WHERE task_id = ?", (status, time.time(), task_id)
+                )
+            if bundle is not None:
+                connection.execute(
+                    "UPDATE jobs SET bundle = ?, updated_at = ? WHERE task_id = ?", (json.dumps(bundle), time.time(), task_id)
+                )
+
+    def in_flight_jobs(self) -> list:
+        """Returns the jobs whose task was submitted but not yet seen done or failed."""
+        placeholders = ', '.join('?' for _ in IN_FLIGHT_STATUSES)
+        rows = self._connection().execute(
+            f"SELECT * FROM jobs WHERE task_id IS NOT NULL AND status IN ({placeholders})", IN_FLIGHT_STATUSES
+        ).fetchall()
+        return [self._row_to_job(row) for row in rows]
+
+    def mark_downloaded(self, task_id: str, file_id: str, file_name: str, path: str):
+        """Records a completed download for every job served by the task."""
+        with self._transaction() as connection:
+            connection.execute(
+                "INSERT OR REPLACE INTO downloads (job_key, file_id, file_name, path, completed_at) "
+                "SELECT job_key, ?, ?, ?, ? FROM jobs WHERE task_id = ?",
+                (file_id, file_name, path, time.time(), task_id)
+            )
+
+    def downloaded_files(self, task_id: str) -> dict:
+        """Returns a {file_id: path} mapping of the files of a task already downloaded."""
+        rows = self._connection().execute(
+            "SELECT d.file_id, d.path FROM downloads d JOIN jobs j ON d.job_key = j.job_key WHERE j.task_id = ?",
+            (task_id,)
+        ).fetchall()
+        return {row['file_id']: row['path'] for row in rows}
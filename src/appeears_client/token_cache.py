@@ -0,0 +1,110 @@
+# src.appeears_client.token_cache.py
+import os
+import json
+import time
+import threading
+from contextlib import contextmanager
+from typing import Callable, Optional, Tuple
+
+try:
+    import fcntl
+except ImportError:  # Windows: the cache still works, without cross-process locking
+    fcntl = None
+
+from .config import base_url
+
+class TokenCache:
+    """
+    Disk-persisted cache of AppEEARS tokens and their expiry, shared by every process of a user.
+
+    Reads and writes happen under an exclusive file lock, and so does the login of a missing or expiring token,
+    so that many workers starting at once log in a single time and all reuse that token.
+    """
+
+    def __init__(self, path: str = os.path.join(os.path.expanduser('~'), '.appeears', 'tokens.json'), refresh_margin: float = 3600):
+        """
+        :param path: Path of the cache file, created with owner-only permissions.
+        :param refresh_margin: Seconds before expiry from which a cached token is no longer handed out.
+        """
+        self.path = path
+        self.refresh_margin = refresh_margin
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _key(username: str, api_url: str = None) -> str:
+        return f"{api_url or base_url}|{username}"
+
+    @contextmanager
+    def _locked(self):
+        """Holds the cache lock of this process and, where available, an exclusive lock on the lock file."""
+        with self._lock:
+            os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+            fd = os.open(f"{self.path}.lock", os.O_RDWR | os.O_CREAT, 0o600)
+            try:
+                if fcntl is not None:
+                    fcntl.flock(fd, fcntl.LOCK_EX)
+                yield
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(fd, fcntl.LOCK_UN)
+                os.close(fd)
+
+    def _read(self) -> dict:
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return {}
+
+    def _write(self, entries: dict):
+        temp_path = f"{self.path}.{os.getpid()}.tmp"
+        fd = os.open(temp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump(entries, f)
+        os.replace(temp_path, self.path)
+
+    def _valid_token(self, entries: dict, username: str, api_url: str = None) -> Optional[str]:
+        entry = entries.get(self._key(username, api_url))
+        if entry is not None and entry['expires_at'] - time.time() > self.refresh_margin:
+            return entry['token']
+        return None
+
+    def get(self, username: str, api_url: str = None) -> Optional[str]:
+        """
+        Returns the cached token of a user if it is not close to expiring, or None.
+
+        :param api_url: Root of the API the token is for, defaults to config.base_url. Every method takes it.
+        """
+        with self._locked():
+            return self._valid_token(self._read(), username, api_url)
+
+    def put(self, username: str, token: str, expires_at: float, api_url: str = None):
+        """Stores the token of a user with its expiry (epoch seconds)."""
+        with self._locked():
+            entries = self._read()
+            entries[self._key(username, api_url)] = {"token": token, "expires_at": expires_at}
+            self._write(entries)
+
+    def remove(self, username: str, token: str = None, api_url: str = None):
+        """Forgets the token of a user, only if it is still the given token when one is given."""
+        with self._locked():
+            entries = self._read()
+            entry = entries.get(self._key(username, api_url))
+            if entry is not None and (token is None or entry['token'] == token):
+                del entries[self._key(username, api_url)]
+                self._write(entries)
+
+    def get_or_login(self, username: str, login: Callable[[], Tuple[str, float]], api_url: str = None) -> str:
+        """
+        Returns the cached token of a user, logging in while holding the lock when there is none.
+
+        :param login: Callable without arguments returning a (token, expires_at) pair.
+        """
+        with self._locked():
+            entries = self._read()
+            token = self._valid_token(entries, username, api_url)
+            if token is None:
+                token, expires_at = login()
+                entries[self._key(username, api_url)] = {"token": token, "expires_at": expires_at}
+                self._write(entries)
+            return token
@@ -0,0 +1,242 @@
+# src.appeears_client.transport.py
+import os
+import re
+import time
+import weakref
+import logging
+import threading
+import requests
+from typing import Optional
+from urllib.parse import urlparse
+from requests.adapters import HTTPAdapter
+
+from . import config
+from .retry import RETRY_STATUSES, RetryPolicy
+from .rate_limit import RateLimiter
+from .instrumentation import NULL_INSTRUMENTATION, Instrumentation
+
+logger = logging.getLogger(__name__)
+
+ENDPOINT_PATTERN = re.compile(r'/(task|status|bundle|product|login|logout)(?:/([^/]+))?(?:/([^/]+))?/?$')
+
+def endpoint_class(method: str, url: str) -> str:
+    """
+    Classifies a request by the kind of traffic it is: 'submit', 'status', 'task', 'bundle' (file listings),
+    'download', 'product', 'auth' or 'other'.
+    """
+    match = ENDPOINT_PATTERN.search(urlparse(url).path)
+    if match is None:
+        return 'other'
+    resource = match.group(1)
+    if resource == 'task':
+        return 'submit' if method.upper() == 'POST' else 'task'
+    if resource == 'bundle':
+        return 'download' if match.group(3) else 'bundle'
+    if resource in ('login', 'logout'):
+        return 'auth'
+    return resource
+
+class CredentialProvider:
+    """
+    Source of the bearer token shared by every manager of a client.
+
+    Subclasses that can obtain a new token override _new_token(). Refreshes are single-flight: when several
+    threads see the same expired token, one of them refreshes it and the others reuse the result. The token
+    is swapped with a single attribute assignment, so readers always see either the old or the new token.
+    """
+
+    def __init__(self, token: str = None, base_url: str = None):
+        """
+        :param token: The bearer token, if already known.
+        :param base_url: Root of the API the token is valid for, defaults to config.base_url.
+        """
+        self.token = token
+        self.base_url = (base_url or config.base_url).rstrip('/')
+        # Reentrant, so that subclasses can take it in login methods also called while refreshing
+        self._refresh_lock = threading.RLock()
+
+    def refresh(self, stale_token: str) -> Optional[str]:
+        """
+        Replaces a token the server rejected and returns the new one, or None if no new token can be had.
+
+        :param stale_token: The token the failed request was sent with.
+        """
+        with self._refresh_lock:
+            if self.token != stale_token:
+                # Another caller already refreshed it
+                return self.token
+            token = self._new_token()
+            if token is not None:
+                self.token = token
+            return token
+
+    def _new_token(self) -> Optional[str]:
+        """Obtains a new token, called under the refresh lock. A fixed token cannot be refreshed."""
+        return None
+
+_transports = weakref.WeakSet()  # Live transports, whose session state is reset in forked children
+
+def _reset_transports_after_fork():
+    for transport in list(_transports):
+        transport._after_fork()
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_reset_transports_after_fork)
+
+class Transport:
+    """
+    Sends the API requests of the managers with the current token of a CredentialProvider.
+
+    A request answered with 401 Unauthorized is retried once after the token was refreshed, which the
+    server accepts for every endpoint since a rejected request was never processed. Transient failures are
+    retried according to the transport's RetryPolicy, and every attempt waits for its RateLimiter if one is set.
+
+    The transport is thread-safe and meant to be shared: requests go through one pooled session per process.
+    The session is created on first use, and again in a child process after os.fork, since a forked
+    connection pool would share its sockets with the parent.
+    """
+
+    def __init__(
+            self,
+            credentials: CredentialProvider,
+            session: requests.Session = None,
+            pool_maxsize: int = 32,
+            retry_policy: RetryPolicy = None,
+            rate_limiter: RateLimiter = None,
+            instrumentation: Instrumentation = None
+        ):
+        """
+        :param credentials: Provider of the bearer token, shared with the other managers of the client.
+        :param session: Optional session used for the requests instead of the transport's own pooled one.
+        :param pool_maxsize: Maximum number of connections the transport's own session keeps open per host.
+        :param retry_policy: Retry policy of the requests, defaults to RetryPolicy(). Its metrics count the retries.
+        :param rate_limiter: Optional client-side rate limits by endpoint class, which may be shared with other transports.
+        :param instrumentation: Optional receiver of the measurements of every request, also used by the managers
+            to report their pipeline stages.
+        """
+        self.credentials = credentials
+        self.retry_policy = retry_policy if retry_policy is not None else RetryPolicy()
+        self.rate_limiter = rate_limiter
+        self.instrumentation = instrumentation if instrumentation is not None else NULL_INSTRUMENTATION
+        self.pool_maxsize = pool_maxsize
+        self._user_session = session
+        self._session = None
+        self._session_pid = None
+        self._session_lock = threading.Lock()
+        _transports.add(self)
+
+    @property
+    def session(self) -> requests.Session:
+        """The session of the current process."""
+        if self._user_session is not None:
+            return self._user_session
+        if self._session is None or self._session_pid != os.getpid():
+            with self._session_lock:
+                if self._session is None or self._session_pid != os.getpid():
+                    session = requests.Session()
+                    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.pool_maxsize)
+                    session.mount('https://', adapter)
+                    session.mount('http://', adapter)
+                    self._session, self._session_pid = session, os.getpid()
+        return self._session
+
+    def close(self):
+        """Closes the connections of the transport's own session."""
+        with self._session_lock:
+            if self._session is not None and self._session_pid == os.getpid():
+                self._session.close()
+            self._session = None
+
+    @property
+    def base_url(self) -> str:
+        """Root of the API the requests go to, the one of the credentials."""
+        return getattr(self.credentials, 'base_url', None) or config.base_url
+
+    def _after_fork(self):
+        # A lock held by another thread of the parent at fork time would never be released in the child
+        self._session_lock = threading.Lock()
+        self._session = None
+
+    def request(self, method: str, url: str, session: requests.Session = None, **kwargs) -> requests.Response:
+        """
+        Sends an authenticated request, taking the same keyword arguments as requests.request.
+
+        Raises the last connection error if the request could not be sent after all retries.
+
+        :param session: Session to send this request with, instead of the transport's one.
+        """
+        endpoint = endpoint_class(method, url)
+        policy = self.retry_policy
+        measured = self.instrumentation.enabled
+        start = time.perf_counter() if measured else None
+        queue_wait = 0.0
+        attempt = 0
+        while True:
+            attempt += 1
+            if self.rate_limiter is not None:
+                queue_wait += self.rate_limiter.acquire(endpoint)
+            policy.metrics.increment('attempts', endpoint)
+            try:
+                response = self._send(method, url, session, **kwargs)
+            except requests.RequestException as e:
+                reason = policy.retry_reason(endpoint, attempt, error=e)
+                if reason is None:
+                    policy.metrics.increment('giveups', endpoint, type(e).__name__)
+                    if measured:
+                        self._record(endpoint, method, start, attempt, queue_wait, error=type(e).__name__)
+                    raise
+                delay = policy.delay(attempt)
+            else:
+                reason = policy.retry_reason(endpoint, attempt, response=response)
+                if reason is None:
+                    if response.status_code in RETRY_STATUSES:
+                        policy.metrics.increment('giveups', endpoint, f"status_{response.status_code}")
+                    if measured:
+                        self._record(endpoint, method, start, attempt, queue_wait, response=response)
+                    return response
+                delay = policy.delay(attempt, response)
+                response.close()
+            policy.metrics.increment('retries', endpoint, reason)
+            logger.warning("%s %s failed (%s), retrying in %.1fs (attempt %d/%d)", method, url, reason, delay, attempt + 1, policy.max_attempts)
+            policy.sleep(delay)
+
+    def _record(self, endpoint: str, method: str, start: float, attempt: int, queue_wait: float, response: requests.Response = None, error: str = None):
+        bytes_sent = bytes_received = 0
+        if response is not None:
+            body = response.request.body if response.request is not None else None
+            if isinstance(body, str):
+                body = body.encode('utf-8')
+            bytes_sent = len(body) if isinstance(body, bytes) else 0
+            bytes_received = int(response.headers.get('Content-Length') or 0)
+        self.instrumentation.record_request(
+            endpoint, method, response.status_code if response is not None else None, time.perf_counter() - start,
+            bytes_sent=bytes_sent, bytes_received=bytes_received, retries=attempt - 1, queue_wait=queue_wait, error=error
+        )
+
+    def _send(self, method: str, url: str, session: requests.Session = None, **kwargs) -> requests.Response:
+        """Sends a request once, refreshing the token and sending it again if it is rejected with 401."""
+        send = (session or self.session).request
+        headers = kwargs.pop('headers', None) or {}
+
+        token = self.credentials.token
+        response = send(method, url, headers={**headers, 'Authorization': f'Bearer {token}'}, **kwargs)
+        if response.status_code == 401:
+            new_token = self.credentials.refresh(token)
+            if new_token is not None and new_token != token:
+                response.close()
+                response = send(method, url, headers={**headers, 'Authorization': f'Bearer {new_token}'}, **kwargs)
+        return response
+
+    def get(self, url: str, **kwargs) -> requests.Response:
+        return self.request('GET', url, **kwargs)
+
+    def post(self, url: str, **kwargs) -> requests.Response:
+        return self.request('POST', url, **kwargs)
+
+def resolve_transport(token: str = None, transport: Transport = None) -> Transport:
+    """Returns the given transport, or one sending the given fixed token, as managers accept either."""
+    if transport is not None:
+        return transport
+    if token is None:
+        raise ValueError("Either a token or a transport is required")
+    return Transport(CredentialProvider(token))
@@ -0,0 +1,113 @@
+# src.catalog_search.py
+import re
+import bisect
+import threading
+from typing import List, NamedTuple, Optional
+
+from .models import get_catalog_records
+
+TOKEN_PATTERN = re.compile(r'[a-z0-9]+(?:\.[0-9]+)?')
+WAVELENGTH_PATTERN = re.compile(r'Wavelength:\s*([\d.]+)\s*nm(?:,\s*FWHM:\s*([\d.]+)\s*nm)?')
+
+class SearchHit(NamedTuple):
+    product_id: str
+    band_name: Optional[str]  # None when the product itself matched
+    description: str
+
+class WavelengthHit(NamedTuple):
+    wavelength: float
+    fwhm: Optional[float]
+    product_id: str
+    band_name: str
+
+def tokenize(text: str) -> List[str]:
+    """Splits text into lowercase search tokens, keeping decimals such as '2441.218' whole."""
+    return TOKEN_PATTERN.findall(text.lower())
+
+class CatalogIndex:
+    """
+    In-memory search index over the product catalog.
+
+    Holds an inverted index from description tokens to products and bands, and a sorted index of the
+    band center wavelengths parsed from descriptions such as 'Wavelength: 2441.218 nm, FWHM: 8.799 nm'.
+    """
+
+    def __init__(self, records: dict = None):
+        """
+        :param records: Raw catalog records keyed by product_id, defaults to the packaged catalog.
+        """
+        records = get_catalog_records() if records is None else records
+        self._postings = {}
+        self._descriptions = {}
+        wavelengths = []
+
+        for product_id, record in records.items():
+            self._add((product_id, None), record['description'], f"{product_id} {record['description']}")
+            for band_name, description, *_ in record['bands']:
+                self._add((product_id, band_name), description, f"{band_name} {description}")
+                match = WAVELENGTH_PATTERN.search(description)
+                if match:
+                    fwhm = float(match.group(2)) if match.group(2) else None
+                    wavelengths.append(WavelengthHit(float(match.group(1)), fwhm, product_id, band_name))
+
+        # fwhm is optional, so hits are ordered without it
+        wavelengths.sort(key=lambda hit: (hit.wavelength, hit.product_id, hit.band_name))
+        self._wavelengths = wavelengths
+        self._wavelength_keys = [hit.wavelength for hit in wavelengths]
+
+    def _add(self, key: tuple, description: str, text: str):
+        self._descriptions[key] = description
+        for token in set(tokenize(text)):
+            self._postings.setdefault(token, set()).add(key)
+
+    def search(self, query: str, product_id: str = None, bands_only: bool = False) -> List[SearchHit]:
+        """
+        Returns the products and bands whose id, name or description contain every token of the query.
+
+        :param query: Free text, e.g. 'surface temperature day'.
+        :param product_id: Restricts the search to the bands of one product.
+        :param bands_only: Excludes product-level matches.
+        """
+        tokens = tokenize(query)
+        if not tokens:
+            return []
+        # Intersect starting from the rarest token to keep the working set small
+        postings = sorted((self._postings.get(token, set()) for token in tokens), key=len)
+        keys = set(postings[0])
+        for posting in postings[1:]:
+            keys &= posting
+            if not keys:
+                return []
+        hits = [
+            SearchHit(key[0], key[1], self._descriptions[key]) for key in keys
+            if (product_id is None or key[0] == product_id) and not (bands_only and key[1] is None)
+        ]
+        return sorted(hits, key=lambda hit: (hit.product_id, hit.band_name or ''))
+
+    def bands_in_wavelength_range(self, min_nm: float, max_nm: float, product_id: str = None) -> List[WavelengthHit]:
+        """
+        Returns the bands whose center wavelength lies in [min_nm, max_nm], sorted by wavelength.
+
+        :param product_id: Restricts the result to the bands of one product.
+        """
+        start = bisect.bisect_left(self._wavelength_keys, min_nm)
+        end = bisect.bisect_right(self._wavelength_keys, max_nm)
+        hits = self._wavelengths[start:end]
+        if product_id is not None:
+            hits = [hit for hit in hits if hit.product_id == product_id]
+        return hits
+
+_index = None
+_index_records = None  # Catalog the index was built from, to rebuild it after the catalog is reloaded
+_index_lock = threading.Lock()
+
+def get_catalog_index() -> CatalogIndex:
+    """Returns the index of the packaged catalog, building it on first use and after the catalog is reloaded."""
+    global _index, _index_records
+    records = get_catalog_records()
+    if _index is None or _index_records is not records:
+        with _index_lock:
+            if _index is None or _index_records is not records:
+                _index = CatalogIndex(records=records)
+                _index_records = records
+    return _index
@@ -0,0 +1,279 @@
+# src.catalog_sync.py
+import os
+import re
+import sys
+import json
+import logging
+import argparse
+import threading
+from datetime import date
+from typing import NamedTuple
+from concurrent.futures import ThreadPoolExecutor
+
+from .models import CATALOG_PATH, BAND_METADATA_FIELDS, reload_catalog
+
+logger = logging.getLogger(__name__)
+
+# AppEEARS /product/{id} layer keys and the catalog metadata field each one fills
+LAYER_FIELDS = {
+    'DataType': 'data_type',
+    'FillValue': 'fill_value',
+    'ScaleFactor': 'scale_factor',
+    'AddOffset': 'add_offset',
+    'Units': 'units',
+    'ValidMin': 'valid_min',
+    'ValidMax': 'valid_max',
+    'IsQA': 'is_qa',
+}
+
+# Catalog record keys, in the order they are written
+RECORD_KEYS = ('product_id', 'description', 'temporal_granularity', 'pixel_size', 'start_date', 'end_date', 'bbox', 'bands')
+
+# Catalog record keys refreshed from the /product listing, the others are only maintained locally
+LISTING_KEYS = ('description', 'temporal_granularity', 'pixel_size', 'start_date', 'end_date')
+
+METERS_PER_DEGREE = 111320.0
+RESOLUTION_PATTERN = re.compile(r'([\d.]+)\s*(km|m|deg|degrees?|arc ?sec(?:onds?)?)\b', re.IGNORECASE)
+
+_write_lock = threading.Lock()
+
+class CatalogDiff(NamedTuple):
+    added: list           # product_ids listed by the API but missing from the catalog
+    removed: list         # product_ids of the catalog no longer listed by the API
+    changed: dict         # product_id -> names of the record keys that changed
+    layers_added: dict    # product_id -> names of the new layers
+    layers_removed: dict  # product_id -> names of the layers gone
+
+    @property
+    def has_changes(self) -> bool:
+        return any(self)
+
+def _clean(value):
+    # The API reports missing values in several ways
+    if value is None or (isinstance(value, str) and value.strip().upper() in ('', 'N/A', 'NA')):
+        return None
+    return value
+
+def layer_metadata(layer: dict) -> dict:
+    """
+    Converts the description of a layer returned by /product/{id} into catalog band metadata.
+
+    Only the fields the API actually reports are returned, so that missing ones keep falling back to the product.
+    """
+    metadata = {}
+    for api_key, field in LAYER_FIELDS.items():
+        value = _clean(layer.get(api_key))
+        if value is not None:
+            metadata[field] = value
+    return {field: metadata[field] for field in BAND_METADATA_FIELDS if field in metadata}
+
+def read_catalog(path: str = CATALOG_PATH) -> list:
+    """Returns the list of product records of a catalog file."""
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)['products']
+
+def write_catalog(records: list, path: str = CATALOG_PATH):
+    """Writes product records to a catalog file atomically, one compact record per line."""
+    lines = ',\n'.join(json.dumps(record, separators=(',', ':'), ensure_ascii=False) for record in records)
+    temp_path = f"{path}.{os.getpid()}.tmp"
+    with open(temp_path, 'w', encoding='utf-8') as f:
+        f.write('{"products": [\n' + lines + '\n]}\n')
+    os.replace(temp_path, path)
+    if os.path.abspath(path) == os.path.abspath(CATALOG_PATH):
+        reload_catalog()
+
+def apply_layer_metadata(record: dict, layers: dict) -> int:
+    """
+    Stores the metadata of the layers of a /product/{id} response in the bands of a catalog record.
+
+    :return: Number of bands whose metadata changed.
+    """
+    changed = 0
+    bands = []
+    for entry in record['bands']:
+        name, description = entry[0], entry[1]
+        current = entry[2] if len(entry) > 2 else {}
+        metadata = layer_metadata(layers[name]) if name in layers else current
+        if metadata != current:
+            changed += 1
+        bands.append([name, description, metadata] if metadata else [name, description])
+    record['bands'] = bands
+    return changed
+
+def sync_band_metadata(product_manager, product_ids: list = None, path: str = CATALOG_PATH, max_workers: int = 8) -> dict:
+    """
+    Fetches /product/{id} for catalog products and stores the per-layer metadata in the catalog file.
+
+    Products that cannot be fetched are logged and left unchanged.
+
+    :param product_manager: A ProductManagement instance, its cache is used when it has one.
+    :param product_ids: Products to sync, defaults to the whole catalog.
+    :param path: Catalog file to update.
+    :param max_workers: Maximum number of concurrent requests.
+    :return: A {product_id: number of bands changed} mapping of the products synced.
+    """
+    with _write_lock:
+        records = read_catalog(path)
+        by_id = {record['product_id']: record for record in records}
+        product_ids = list(by_id) if product_ids is None else [product_id for product_id in product_ids if product_id in by_id]
+
+        def fetch(product_id: str):
+            try:
+                return product_id, product_manager.get_product_layers(product_id, validate=False)
+            except Exception as e:
+                logger.warning("Could not sync metadata of product %s: %s", product_id, e)
+                return product_id, None
+
+        changes = {}
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            for product_id, layers in executor.map(fetch, product_ids):
+                if layers is not None:
+                    changes[product_id] = apply_layer_metadata(by_id[product_id], layers)
+
+        if any(changes.values()):
+            write_catalog(records, path)
+        return changes
+
+def _pixel_size(resolution: str):
+    """Converts an AppEEARS resolution such as '500m', '1 km' or '0.05 deg' into meters, or returns None."""
+    match = RESOLUTION_PATTERN.search(resolution or '')
+    if not match:
+        return None
+    value, unit = float(match.group(1)), match.group(2).lower()
+    if unit == 'km':
+        value *= 1000
+    elif unit.startswith('deg'):
+        value *= METERS_PER_DEGREE
+    elif unit.startswith('arc'):
+        value *= METERS_PER_DEGREE / 3600
+    return int(value) if value == int(value) else round(value, 3)
+
+def _iso_date(value):
+    try:
+        return date.fromisoformat(str(value)[:10]).isoformat()
+    except ValueError:
+        return None  # e.g. 'Present'
+
+def record_from_listing(product: dict, record: dict = None) -> dict:
+    """
+    Builds a catalog record from an entry of the /product listing.
+
+    :param product: The listing entry.
+    :param record: The current record of the product, whose bands, bbox and values the listing lacks are kept.
+    """
+    record = record or {'product_id': product['ProductAndVersion'], 'bands': []}
+    listed = {
+        'description': product.get('Description') or record.get('description', ''),
+        'temporal_granularity': product.get('TemporalGranularity') or record.get('temporal_granularity'),
+        'pixel_size': _pixel_size(product.get('Resolution')) or record.get('pixel_size'),
+        'start_date': _iso_date(product.get('TemporalExtentStart')) or record.get('start_date'),
+        'end_date': _iso_date(product.get('TemporalExtentEnd')),
+    }
+    merged = {**record, **listed}
+    return {key: merged[key] for key in RECORD_KEYS if merged.get(key) is not None}
+
+def apply_layers(record: dict, layers: dict):
+    """
+    Replaces the bands of a catalog record with the layers of a /product/{id} response.
+
+    Existing bands keep their position, new ones are appended in the order of the response.
+
+    :return: An (added, removed) pair of layer name lists.
+    """
+    current = {entry[0]: entry for entry in record['bands']}
+    names = [name for name in current if name in layers] + [name for name in layers if name not in current]
+    bands = []
+    for name in names:
+        layer = layers[name]
+        description = layer.get('Description', current[name][1] if name in current else '')
+        metadata = layer_metadata(layer)
+        bands.append([name, description, metadata] if metadata else [name, description])
+    record['bands'] = bands
+    return [name for name in layers if name not in current], [name for name in current if name not in layers]
+
+def sync_catalog(
+        product_manager,
+        path: str = CATALOG_PATH,
+        check_layers: bool = False,
+        dry_run: bool = False,
+        max_workers: int = 8
+    ) -> CatalogDiff:
+    """
+    Diffs the catalog file against the live /product listing and regenerates it incrementally.
+
+    Layers are only fetched for new products and products whose listing changed, unless check_layers is set.
+    Products whose layers cannot be fetched are logged and left as they are (new ones are not added).
+
+    :param product_manager: A ProductManagement instance, its cache is used when it has one.
+    :param path: Catalog file to update.
+    :param check_layers: Whether to fetch the layers of every product, to detect layer-only changes.
+    :param dry_run: Whether to only report the differences, without writing the catalog.
+    :param max_workers: Maximum number of concurrent layer requests.
+    """
+    with _write_lock:
+        listing = {product['ProductAndVersion']: product for product in product_manager.list_products()}
+        records = read_catalog(path)
+
+        updated, changed = {}, {}
+        for record in records:
+            if record['product_id'] in listing:
+                new_record = record_from_listing(listing[record['product_id']], record)
+                keys = [key for key in LISTING_KEYS if record.get(key) != new_record.get(key)]
+                if keys:
+                    changed[record['product_id']] = keys
+                updated[record['product_id']] = new_record
+        removed = [record['product_id'] for record in records if record['product_id'] not in listing]
+        added = [product_id for product_id in listing if product_id not in updated]
+        for product_id in added:
+            updated[product_id] = record_from_listing(listing[product_id])
+
+        to_fetch = list(updated) if check_layers else added + list(changed)
+
+        def fetch(product_id: str):
+            try:
+                return product_id, product_manager.get_product_layers(product_id, validate=False)
+            except Exception as e:
+                logger.warning("Could not fetch the layers of product %s: %s", product_id, e)
+                return product_id, None
+
+        layers_added, layers_removed = {}, {}
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            for product_id, layers in executor.map(fetch, to_fetch):
+                if layers is None:
+                    if product_id in added:
+                        added.remove(product_id)
+                        del updated[product_id]
+                    continue
+                new_layers, old_layers = apply_layers(updated[product_id], layers)
+                if new_layers:
+                    layers_added[product_id] = new_layers
+                if old_layers:
+                    layers_removed[product_id] = old_layers
+
+        diff = CatalogDiff(added=added, removed=removed, changed=changed, layers_added=layers_added, layers_removed=layers_removed)
+        if diff.has_changes and not dry_run:
+            write_catalog(list(updated.values()), path)
+        return diff
+
+def main(argv: list = None):
+    """Command line entry point, reading the Earthdata credentials from APPEEARS_USER and APPEEARS_PASS."""
+    from dotenv import load_dotenv
+    from .appeears import APIClient
+
+    parser = argparse.ArgumentParser(description="Sync the product catalog with the AppEEARS /product listing.")
+    parser.add_argument('--path', default=CATALOG_PATH, help="Catalog file to update.")
+    parser.add_argument('--check-layers', action='store_true', help="Fetch the layers of every product.")
+    parser.add_argument('--dry-run', action='store_true', help="Only report the differences.")
+    args = parser.parse_args(argv)
+
+    load_dotenv()
+    client = APIClient(username=os.getenv("APPEEARS_USER"), password=os.getenv("APPEEARS_PASS"))
+    try:
+        diff = sync_catalog(client.product_manager, path=args.path, check_layers=args.check_layers, dry_run=args.dry_run)
+    finally:
+        client.logout()
+    json.dump(diff._asdict(), sys.stdout, indent=2)
+    print()
+
+if __name__ == '__main__':
+    main()
@@ -13,3 +13,7 @@ class LoginError(AppEEARSError):
 class RequestError(AppEEARSError):
     """Exception raised for errors during API requests."""
     pass
+
+class TaskFailedError(AppEEARSError):
+    """Exception raised when a task failed on the AppEEARS server or is no longer known to it."""
+    pass
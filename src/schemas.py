@@ -0,0 +1,24 @@
+# src.schemas.py
+from typing import List, Optional, Union
+from pydantic import BaseModel
+
+class Band(BaseModel):
+    name: str
+    description: str
+    data_type: Optional[str] = None
+    fill_value: Optional[Union[int, float]] = None
+    scale_factor: Optional[float] = None
+    add_offset: Optional[float] = None
+    units: Optional[str] = None
+    valid_min: Optional[Union[int, float]] = None
+    valid_max: Optional[Union[int, float]] = None
+    is_qa: Optional[bool] = None
+    pixel_size: Optional[float] = None
+    temporal_granularity: Optional[str] = None
+
+class Product(BaseModel):
+    product_id: str
+    description: str
+    temporal_granularity: Optional[str] = None
+    pixel_size: Optional[float] = None
+    bands: List[Band]
@@ -0,0 +1,23 @@
+# tests.test_benchmarks.py
+from benchmarks import run_all
+from benchmarks.compare import compare
+
+def test_quick_run_against_the_mock_server():
+    """The benchmarks run end to end offline, and only their measurements are compared across runs."""
+    results = run_all.run(quick=True, only=['submit', 'poll', 'download'])
+    assert set(results) == {'meta', 'submit', 'poll', 'download'}
+    assert results['poll']['completed'] == results['poll']['tasks']
+    assert all(entry['failed'] == 0 for entry in results['submit']['results'])
+
+    rows = compare(results, results)
+    metrics = {metric for metric, *_ in rows}
+    assert 'download.workers=4.mb_per_s' in metrics and 'poll.requests_per_task' in metrics
+    assert not {'poll.tasks', 'poll.completed', 'poll.poll_interval_s', 'download.bandwidth_bytes_per_s'} & metrics
+    assert all(improved is None for *_, improved in rows)
+
+def test_throughputs_are_better_when_higher():
+    baseline = {'submit': {'tasks': 30, 'results': [{'workers': 8, 'seconds': 1.0, 'tasks_per_s': 30.0}]}}
+    current = {'submit': {'tasks': 60, 'results': [{'workers': 8, 'seconds': 0.5, 'tasks_per_s': 120.0}]}}
+    assert [(metric, improved) for metric, _, _, _, improved in compare(baseline, current)] == [
+        ('submit.workers=8.seconds', True), ('submit.workers=8.tasks_per_s', True)
+    ]
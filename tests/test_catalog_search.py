@@ -0,0 +1,46 @@
+# tests.test_catalog_search.py
+from src.catalog_search import CatalogIndex, get_catalog_index
+
+RECORDS = {
+    "EMIT_L2A_RFL.001": {
+        "description": "EMIT L2A Estimated Surface Reflectance",
+        "bands": [
+            ["B058", "Reflectance for Wavelength: 805.362 nm, FWHM: 8.491 nm"],
+            ["B070", "Reflectance for Wavelength: 894.682 nm, FWHM: 8.555 nm"],
+            ["B071", "Reflectance for Wavelength: 902.125 nm, FWHM: 8.560 nm"],
+            ["elev", "Elevation"],
+        ],
+    },
+    "MOD11A1.061": {
+        "description": "Land Surface Temperature & Emissivity Daily Global 1km",
+        "bands": [["LST_Day_1km", "Day Land Surface Temperature"], ["LST_Night_1km", "Night Land Surface Temperature"]],
+    },
+}
+
+def test_search_requires_every_token():
+    index = CatalogIndex(records=RECORDS)
+    hits = index.search("night surface temperature")
+    assert [(hit.product_id, hit.band_name) for hit in hits] == [("MOD11A1.061", "LST_Night_1km")]
+    assert index.search("temperature", bands_only=True, product_id="EMIT_L2A_RFL.001") == []
+    assert index.search("temperature")[0].band_name is None  # The product itself matches too
+
+def test_search_by_exact_wavelength():
+    hits = CatalogIndex(records=RECORDS).search("894.682")
+    assert [hit.band_name for hit in hits] == ["B070"]
+
+def test_wavelength_range_query():
+    index = CatalogIndex(records=RECORDS)
+    hits = index.bands_in_wavelength_range(800, 900)
+    assert [(hit.band_name, hit.wavelength, hit.fwhm) for hit in hits] == [("B058", 805.362, 8.491), ("B070", 894.682, 8.555)]
+    assert index.bands_in_wavelength_range(800, 900, product_id="MOD11A1.061") == []
+
+def test_packaged_catalog_index():
+    hits = get_catalog_index().bands_in_wavelength_range(2441.0, 2441.5, product_id="EMIT_L2A_RFL.001")
+    assert "B278" in {hit.band_name for hit in hits}
+
+def test_same_wavelength_with_and_without_fwhm():
+    records = {"X.001": {"description": "", "bands": [
+        ["B1", "Wavelength: 550 nm, FWHM: 10 nm"], ["B2", "Wavelength: 550 nm"],
+    ]}}
+    hits = CatalogIndex(records=records).bands_in_wavelength_range(549, 551)
+    assert [(hit.band_name, hit.fwhm) for hit in hits] == [("B1", 10.0), ("B2", None)]
@@ -0,0 +1,104 @@
+# tests.test_catalog_sync.py
+import os
+import shutil
+
+import numpy as np
+import requests_mock
+
+from src import models
+from src.catalog_sync import read_catalog, write_catalog, sync_band_metadata, sync_catalog
+from src.appeears_client.config import base_url
+from src.appeears_client.file_management import FileManager
+from src.appeears_client.product_management import ProductManagement
+
+LST_LAYERS = {
+    "LST_Day_1km": {
+        "DataType": "uint16", "FillValue": 0, "ScaleFactor": 0.02, "AddOffset": 0.0, "Units": "Kelvin",
+        "ValidMin": 7500, "ValidMax": 65535, "IsQA": False, "Description": "Day Land Surface Temperature"
+    },
+    "QC_Day": {"DataType": "uint8", "FillValue": "N/A", "ScaleFactor": None, "Units": "none", "IsQA": True},
+}
+
+def test_band_metadata_falls_back_to_the_product():
+    metadata = models.get_band_metadata('MOD11A1.061', 'LST_Night_1km')
+    assert metadata['pixel_size'] == models.get_pixel_size('MOD11A1.061')
+    assert metadata['temporal_granularity'] == 'Daily'
+    assert set(metadata) == set(models.BAND_METADATA_FIELDS)
+
+def test_sync_stores_layer_metadata(tmp_path):
+    """Synced layer metadata is written to the catalog file, and only the bands the API describes change."""
+    path = os.path.join(tmp_path, 'products.json')
+    shutil.copy(models.CATALOG_PATH, path)
+
+    with requests_mock.Mocker() as mocker:
+        mocker.get(f"{base_url}/product/MOD11A1.061", json=LST_LAYERS)
+        changes = sync_band_metadata(ProductManagement(token='token'), product_ids=['MOD11A1.061'], path=path)
+
+    assert changes == {'MOD11A1.061': 2}
+    bands = {entry[0]: entry for entry in next(r for r in read_catalog(path) if r['product_id'] == 'MOD11A1.061')['bands']}
+    assert bands['LST_Day_1km'][2] == {
+        "data_type": "uint16", "fill_value": 0, "scale_factor": 0.02, "add_offset": 0.0, "units": "Kelvin",
+        "valid_min": 7500, "valid_max": 65535, "is_qa": False
+    }
+    assert bands['QC_Day'][2] == {"data_type": "uint8", "units": "none", "is_qa": True}
+    assert len(bands['LST_Night_1km']) == 2
+
+def test_decode_band_values(monkeypatch):
+    record = {**models._get_record('MOD11A1.061')}
+    record['bands'] = [["LST_Day_1km", "", {"fill_value": 0, "scale_factor": 0.02}]]
+    monkeypatch.setitem(models._load_catalog(), 'MOD11A1.061', record)
+    # Records are indexed as Band objects on first use, so the patched record needs fresh indexes
+    monkeypatch.setattr(models, '_products', {})
+    monkeypatch.setattr(models, '_bands', {})
+
+    decoded = FileManager(token='token').decode_band_values(np.array([[0, 15000]], dtype=np.uint16), 'MOD11A1.061', 'LST_Day_1km')
+    assert np.isnan(decoded[0, 0]) and decoded[0, 1] == 300.0
+
+def _write_small_catalog(path):
+    write_catalog([
+        {"product_id": "KEEP.001", "description": "Kept", "temporal_granularity": "Daily", "pixel_size": 500,
+         "start_date": "2000-02-24", "bands": [["a", "A"], ["b", "B"]]},
+        {"product_id": "CHANGED.001", "description": "Old", "temporal_granularity": "8 day", "pixel_size": 500,
+         "bbox": [-10, -10, 10, 10], "bands": [["x", "X"], ["y", "Y"]]},
+        {"product_id": "GONE.001", "description": "Gone", "temporal_granularity": "Daily", "pixel_size": 500, "bands": []},
+    ], path)
+
+def test_sync_catalog_diffs_and_regenerates_incrementally(tmp_path):
+    """Only new and changed products have their layers fetched, and the catalog file is rewritten accordingly."""
+    path = os.path.join(tmp_path, 'products.json')
+    _write_small_catalog(path)
+    listing = [
+        {"ProductAndVersion": "KEEP.001", "Description": "Kept", "TemporalGranularity": "Daily", "Resolution": "500m",
+         "TemporalExtentStart": "2000-02-24", "TemporalExtentEnd": "Present"},
+        {"ProductAndVersion": "CHANGED.001", "Description": "New", "TemporalGranularity": "8 day", "Resolution": "500m",
+         "TemporalExtentStart": "2000-02-18", "TemporalExtentEnd": "Present"},
+        {"ProductAndVersion": "NEW.001", "Description": "Added", "TemporalGranularity": "16 day", "Resolution": "1 km",
+         "TemporalExtentStart": "2012-01-17", "TemporalExtentEnd": "2020-12-31"},
+    ]
+
+    with requests_mock.Mocker() as mocker:
+        mocker.get(f"{base_url}/product", json=listing)
+        keep = mocker.get(f"{base_url}/product/KEEP.001", json={})
+        mocker.get(f"{base_url}/product/CHANGED.001", json={"y": {"Description": "Y"}, "z": {"Description": "Z", "DataType": "int16"}})
+        mocker.get(f"{base_url}/product/NEW.001", json={"n": {"Description": "N"}})
+        product_manager = ProductManagement(token='token')
+
+        preview = sync_catalog(product_manager, path=path, dry_run=True)
+        assert read_catalog(path)[1]['description'] == 'Old'
+        diff = sync_catalog(product_manager, path=path)
+
+    assert diff == preview
+    assert diff.added == ['NEW.001'] and diff.removed == ['GONE.001']
+    assert diff.changed == {'CHANGED.001': ['description', 'start_date']}
+    assert diff.layers_added == {'CHANGED.001': ['z'], 'NEW.001': ['n']}
+    assert diff.layers_removed == {'CHANGED.001': ['x']}
+    assert keep.call_count == 0
+
+    records = {record['product_id']: record for record in read_catalog(path)}
+    assert list(records) == ['KEEP.001', 'CHANGED.001', 'NEW.001']
+    assert records['CHANGED.001']['bbox'] == [-10, -10, 10, 10]
+    assert records['CHANGED.001']['bands'] == [["y", "Y"], ["z", "Z", {"data_type": "int16"}]]
+    assert records['NEW.001'] == {
+        "product_id": "NEW.001", "description": "Added", "temporal_granularity": "16 day", "pixel_size": 1000,
+        "start_date": "2012-01-17", "end_date": "2020-12-31", "bands": [["n", "N"]]
+    }
@@ -0,0 +1,106 @@
+# tests.test_credential_pool.py
+import re
+import threading
+from datetime import datetime
+
+import pytest
+import requests_mock
+
+from src.appeears_client.config import base_url
+from src.appeears_client.transport import CredentialProvider
+from src.appeears_client.credential_pool import CredentialPool
+from src.appeears_client.task_orchestrator import TaskOrchestrator
+from src.appeears_client.task_registry import TaskRegistry, fingerprint_task
+
+def _provider(name: str) -> CredentialProvider:
+    provider = CredentialProvider(token=f"token-{name}")
+    provider.username = name
+    return provider
+
+def test_acquire_picks_the_account_with_most_free_capacity():
+    pool = CredentialPool([_provider('a'), _provider('b')], max_tasks_per_account=2)
+    first = pool.acquire()
+    pool.assign(first, 'task-1')
+    second = pool.acquire()
+    assert second is not first
+    pool.assign(second, 'task-2')
+    pool.assign(pool.acquire(), 'task-3')
+    pool.assign(pool.acquire(), 'task-4')
+
+    with pytest.raises(TimeoutError):
+        pool.acquire(timeout=0.01)
+    threading.Timer(0.05, pool.release, args=('task-1',)).start()
+    assert pool.acquire(timeout=5) is first
+    assert pool.owner('task-1') is first
+
+def test_tasks_are_polled_and_downloaded_with_their_owner(tmp_path):
+    """Every request about a task carries the token of the account that submitted it."""
+    pool = CredentialPool([_provider('a'), _provider('b')], max_tasks_per_account=1)
+    orchestrator = TaskOrchestrator(credential_pool=pool)
+    owners, mismatches = {}, []
+
+    def submit_callback(request, context):
+        context.status_code = 202
+        task_id = f"task-{request.json()['params']['coordinates'][0]['latitude']:.0f}"
+        owners[task_id] = request.headers['Authorization']
+        return {"task_id": task_id}
+
+    def owned_callback(request, context):
+        task_id = re.search(r'task-\d+', request.path).group(0)
+        if owners.get(task_id) != request.headers['Authorization']:
+            mismatches.append(request.path)
+        if '/bundle/' in request.path:
+            return {"files": [{"file_id": "1", "file_name": "a.tif"}]}
+        return {"status": "done"}
+
+    with requests_mock.Mocker() as mocker:
+        mocker.post(f"{base_url}/task", json=submit_callback)
+        mocker.get(re.compile(f"{base_url}/(status|bundle)/.*"), json=owned_callback)
+
+        futures = [
+            orchestrator.submit_point_task(
+                latitude=latitude, longitude=0.0, product_id='MOD11A1.061', band_names=['LST_Day_1km'],
+                start_date=datetime(2023, 1, 1), end_date=datetime(2023, 1, 31)
+            )
+            for latitude in (10.0, 20.0, 30.0)
+        ]
+        results = [future.result(timeout=10) for future in futures]
+
+    orchestrator.shutdown()
+    assert all(results) and not mismatches
+    assert set(owners.values()) == {"Bearer token-a", "Bearer token-b"}
+    assert all(account.free_capacity == 1 for account in pool.accounts)
+
+def test_registered_task_is_reused_with_the_account_that_submitted_it(tmp_path):
+    """The registry is shared by the accounts, a task found in it is polled and downloaded with its owner only."""
+    pool = CredentialPool([_provider('a'), _provider('b')], max_tasks_per_account=1)
+    registry = TaskRegistry(str(tmp_path / 'registry.json'))
+    orchestrator = TaskOrchestrator(credential_pool=pool, registry=registry)
+    arguments = dict(
+        latitude=10.0, longitude=0.0, product_id='MOD11A1.061', band_names=['LST_Day_1km'],
+        start_date=datetime(2023, 1, 1), end_date=datetime(2023, 1, 31)
+    )
+    fingerprint = fingerprint_task(orchestrator.task_manager.build_point_task_params(**arguments))
+    registry.record(fingerprint, 'task-b', owner='b')
+    tokens = []
+
+    def owned_callback(request, context):
+        tokens.append(request.headers['Authorization'])
+        if request.headers['Authorization'] != "Bearer token-b":
+            context.status_code = 404  # Other users' tasks are unknown to the server
+            return {}
+        if '/bundle/' in request.path:
+            return {"files": [{"file_id": "1", "file_name": "a.csv"}]}
+        return {"status": "done", "task_id": "task-b"}
+
+    with requests_mock.Mocker() as mocker:
+        post = mocker.post(f"{base_url}/task", status_code=202, json={"task_id": "task-new"})
+        mocker.get(re.compile(f"{base_url}/(task|status|bundle)/task-b"), json=owned_callback)
+        assert orchestrator.execute_and_retrieve_point_task(**arguments) == [{"file_id": "1", "file_name": "a.csv"}]
+
+    orchestrator.shutdown()
+    assert post.call_count == 0
+    assert tokens and set(tokens) == {"Bearer token-b"}
+    assert pool.owner('task-b') is pool.account('b')
+    assert registry.lookup(fingerprint)['owner'] == 'b'
+    assert all(account.free_capacity == 1 for account in pool.accounts)
@@ -0,0 +1,112 @@
+# tests.test_date_splitting.py
+import re
+from datetime import datetime
+
+import requests_mock
+
+from src.appeears_client.config import base_url
+from src.appeears_client.date_splitting import split_date_range, merge_file_listings
+from src.appeears_client.task_orchestrator import TaskOrchestrator
+
+def test_split_is_contiguous_and_covers_range():
+    """Slices should cover the full range without gaps or overlaps."""
+    start, end = datetime(2001, 3, 5), datetime(2020, 12, 31)
+    slices = split_date_range(start, end, num_slices=8, product_id='MOD09A1.061')
+    assert len(slices) == 8
+    assert slices[0][0] == start and slices[-1][1] == end
+    for (_, previous_end), (next_start, _) in zip(slices, slices[1:]):
+        assert (next_start - previous_end).days == 1
+
+def test_split_aligns_to_compositing_period():
+    """Boundaries should fall on the 8-day grid, the first of a month or January 1st."""
+    for product_id, aligned in [
+        ('MOD09A1.061', lambda d: (d.timetuple().tm_yday - 1) % 8 == 0),
+        ('MOD13A3.061', lambda d: d.day == 1),
+        ('MCD12Q1.061', lambda d: d.month == 1 and d.day == 1),
+    ]:
+        slices = split_date_range(datetime(2003, 3, 5), datetime(2010, 2, 1), num_slices=4, product_id=product_id)
+        assert all(aligned(slice_start) for slice_start, _ in slices[1:]), product_id
+
+def test_split_never_exceeds_available_periods():
+    """A range shorter than the requested slice count yields one slice per composite period at most."""
+    slices = split_date_range(datetime(2020, 1, 1), datetime(2020, 1, 20), num_slices=10, product_id='MOD09A1.061')
+    assert len(slices) == 3
+
+def test_merge_file_listings_orders_by_date():
+    """Merged listings should be time-ordered and keep the task_id of each file."""
+    merged = merge_file_listings([
+        ('task-b', [{'file_id': '2', 'file_name': 'MOD09A1.061_sur_refl_b01_doy2020009_aid0001.tif'}]),
+        ('task-a', [
+            {'file_id': '3', 'file_name': 'MOD09A1-061-Statistics.csv'},
+            {'file_id': '1', 'file_name': 'MOD09A1.061_sur_refl_b01_doy2020001_aid0001.tif'},
+        ]),
+    ])
+    assert [f['file_id'] for f in merged] == ['1', '2', '3']
+    assert [f['task_id'] for f in merged] == ['task-a', 'task-b', 'task-a']
+
+def test_sliced_area_task_merges_parallel_results():
+    """Each slice is submitted as its own task and a failed slice does not discard the others."""
+    orchestrator = TaskOrchestrator(token='token')
+    submitted = []
+
+    def submit_callback(request, context):
+        body = request.json()
+        task_id = f"task-{body['params']['dates'][0]['startDate']}"
+        submitted.append(task_id)
+        context.status_code = 202
+        return {'task_id': task_id}
+
+    def bundle_callback(request, context):
+        task_id = request.path.rsplit('/', 1)[-1]
+        if task_id.endswith('01-01-2020'):
+            context.status_code = 404
+            return {}
+        start = datetime.strptime(task_id[len('task-'):], '%m-%d-%Y')
+        return {'files': [{'file_id': task_id, 'file_name': f"MOD09A1.061_b01_doy{start:%Y%j}_aid0001.tif"}]}
+
+    with requests_mock.Mocker() as mocker:
+        mocker.post(f"{base_url}/task", json=submit_callback)
+        mocker.get(re.compile(f"{base_url}/status/.*"), json={'status': 'done'})
+        mocker.get(re.compile(f"{base_url}/bundle/.*"), json=bundle_callback)
+        files = orchestrator.execute_and_retrieve_area_task(
+            geo_json={}, product_id='MOD09A1.061', band_names=['sur_refl_b01'],
+            start_date=datetime(2020, 1, 1), end_date=datetime(2020, 12, 31),
+            num_slices=4, slice_retries=0
+        )
+
+    assert len(submitted) == 4
+    assert len(files) == 3
+    assert files == sorted(files, key=lambda f: f['file_name'])
+
+def test_slice_failed_on_the_server_is_resubmitted():
+    """A slice whose task ends in 'error' is resubmitted instead of being polled forever."""
+    orchestrator = TaskOrchestrator(token='token')
+    submitted = []
+
+    def submit_callback(request, context):
+        task_id = f"task-{request.json()['params']['dates'][0]['startDate']}-{len(submitted)}"
+        submitted.append(task_id)
+        context.status_code = 202
+        return {'task_id': task_id}
+
+    def status_callback(request, context):
+        task_id = request.path.rsplit('/', 1)[-1]
+        # The first task of the first slice fails on the server, its resubmission succeeds
+        return {'status': 'error' if task_id == submitted[0] else 'done'}
+
+    def bundle_callback(request, context):
+        task_id = request.path.rsplit('/', 1)[-1]
+        return {'files': [{'file_id': task_id, 'file_name': f"{task_id}.tif"}]}
+
+    with requests_mock.Mocker() as mocker:
+        mocker.post(f"{base_url}/task", json=submit_callback)
+        mocker.get(re.compile(f"{base_url}/status/.*"), json=status_callback)
+        mocker.get(re.compile(f"{base_url}/bundle/.*"), json=bundle_callback)
+        files = orchestrator.execute_and_retrieve_area_task(
+            geo_json={}, product_id='MOD09A1.061', band_names=['sur_refl_b01'],
+            start_date=datetime(2020, 1, 1), end_date=datetime(2020, 1, 31),
+            num_slices=2, slice_retries=1
+        )
+
+    assert len(submitted) == 3
+    assert len(files) == 2 and submitted[0] not in {f['task_id'] for f in files}
@@ -0,0 +1,56 @@
+# tests.test_estimation.py
+import re
+from datetime import datetime
+
+import requests_mock
+
+from src import models
+from src.appeears_client.config import base_url
+from src.appeears_client.estimation import estimate_area_task, estimate_point_task
+from src.appeears_client.task_orchestrator import TaskOrchestrator
+
+# About 1 x 1 degree at the equator, i.e. 112 x 112 pixels of 1 km
+GEO_JSON = {"type": "Polygon", "coordinates": [[[0, 0], [1, 0], [1, 1], [0, 1], [0, 0]]]}
+
+def test_area_estimate_uses_pixel_size_cadence_and_data_type(monkeypatch):
+    record = {**models._get_record('MOD11A1.061')}
+    record['bands'] = [["LST_Day_1km", "", {"data_type": "uint16"}], ["QC_Day", ""]]
+    monkeypatch.setitem(models._load_catalog(), 'MOD11A1.061', record)
+    # Records are indexed as Band objects on first use, so the patched record needs fresh indexes
+    monkeypatch.setattr(models, '_products', {})
+    monkeypatch.setattr(models, '_bands', {})
+
+    estimate = estimate_area_task(GEO_JSON, 'MOD11A1.061', ['LST_Day_1km', 'QC_Day'], datetime(2023, 1, 1), datetime(2023, 1, 31))
+    pixels = 112 * 112
+    assert estimate.file_count == 62
+    assert estimate.periods == 31
+    assert estimate.pixel_count == 2 * 31 * pixels
+    assert estimate.bytes == 31 * pixels * 2 + 31 * pixels * 4
+
+def test_composite_products_have_fewer_files():
+    estimate = estimate_area_task(GEO_JSON, 'MOD13Q1.061', ['_250m_16_days_NDVI'], datetime(2023, 1, 1), datetime(2023, 12, 31))
+    assert estimate.file_count == 23
+
+def test_point_estimate_is_a_single_file():
+    estimate = estimate_point_task(10.0, 0.0, 'MOD11A1.061', ['LST_Day_1km'], datetime(2023, 1, 1), datetime(2023, 1, 10))
+    assert (estimate.file_count, estimate.pixel_count) == (1, 10)
+
+def test_orchestrator_rejects_or_splits_oversized_requests():
+    arguments = dict(
+        geo_json=GEO_JSON, product_id='MOD11A1.061', band_names=['LST_Day_1km'],
+        start_date=datetime(2023, 1, 1), end_date=datetime(2023, 1, 31)
+    )
+    size = estimate_area_task(**arguments).bytes
+
+    with requests_mock.Mocker() as mocker:
+        post = mocker.post(f"{base_url}/task", status_code=202, json={"task_id": "task-1"})
+        mocker.get(re.compile(f"{base_url}/status/.*"), json={"status": "done"})
+        mocker.get(f"{base_url}/bundle/task-1", json={"files": [{"file_id": "1", "file_name": "a.tif"}]})
+
+        rejecting = TaskOrchestrator(token='token', max_task_bytes=size // 4)
+        assert rejecting.execute_and_retrieve_area_task(**arguments) is None
+        assert post.call_count == 0
+
+        splitting = TaskOrchestrator(token='token', max_task_bytes=size // 4, oversize="split")
+        assert splitting.execute_and_retrieve_area_task(**arguments)
+        assert post.call_count == 4
@@ -0,0 +1,159 @@
+# tests.test_futures.py
+import re
+import time
+import threading
+from datetime import datetime
+
+import pytest
+import requests_mock
+
+from src.appeears_client.config import base_url
+from src.appeears_client.futures import TaskFuture, as_completed, wait
+from src.appeears_client.task_orchestrator import TaskOrchestrator
+
+GEO_JSON = {"type": "Polygon", "coordinates": [[[0, 0], [1, 0], [1, 1], [0, 0]]]}
+
+def test_submit_returns_before_the_task_is_done():
+    """submit_area_task returns a pending handle while the task is still being polled."""
+    orchestrator = TaskOrchestrator(token='token')
+    release = threading.Event()
+
+    def status_callback(request, context):
+        release.wait(timeout=5)
+        return {"status": "done"}
+
+    with requests_mock.Mocker() as mocker:
+        mocker.post(f"{base_url}/task", status_code=202, json={"task_id": "task-1"})
+        mocker.get(re.compile(f"{base_url}/status/.*"), json=status_callback)
+        mocker.get(f"{base_url}/bundle/task-1", json={"files": [{"file_id": "1", "file_name": "a.tif"}]})
+
+        future = orchestrator.submit_area_task(
+            geo_json=GEO_JSON, product_id='MOD11A1.061', band_names=['LST_Day_1km'],
+            start_date=datetime(2023, 1, 1), end_date=datetime(2023, 1, 31)
+        )
+        callbacks = []
+        future.add_done_callback(callbacks.append)
+        assert isinstance(future, TaskFuture)
+        assert not future.done()
+
+        release.set()
+        assert future.result(timeout=5) == [{"file_id": "1", "file_name": "a.tif"}]
+
+    assert future.task_id == 'task-1'
+    assert callbacks == [future]
+    orchestrator.shutdown()
+
+def test_as_completed_yields_in_completion_order():
+    """Results are consumed in the order tasks finish, not the order they were submitted."""
+    orchestrator = TaskOrchestrator(token='token', poll_interval=0.01)
+    finished = {"slow": threading.Event(), "fast": threading.Event()}
+
+    def submit_callback(request, context):
+        context.status_code = 202
+        return {"task_id": request.json()['params']['coordinates'][0]['latitude'] and "slow" or "fast"}
+
+    def status_callback(request, context):
+        task_id = request.path.rsplit('/', 1)[-1]
+        return {"status": "done" if finished[task_id].is_set() else "processing"}
+
+    with requests_mock.Mocker() as mocker:
+        mocker.post(f"{base_url}/task", json=submit_callback)
+        mocker.get(re.compile(f"{base_url}/status/.*"), json=status_callback)
+        mocker.get(re.compile(f"{base_url}/bundle/.*"), json=lambda request, context: {
+            "files": [{"file_id": request.path.rsplit('/', 1)[-1], "file_name": "a.tif"}]
+        })
+
+        futures = [
+            orchestrator.submit_point_task(
+                latitude=latitude, longitude=0.0, product_id='MOD11A1.061', band_names=['LST_Day_1km'],
+                start_date=datetime(2023, 1, 1), end_date=datetime(2023, 1, 31)
+            )
+            for latitude in (10.0, 0.0)
+        ]
+        finished["fast"].set()
+        iterator = as_completed(futures, timeout=5)
+        assert next(iterator).task_id == "fast"
+        finished["slow"].set()
+        assert next(iterator).task_id == "slow"
+
+        done, not_done = wait(futures, timeout=5)
+        assert len(done) == 2 and not not_done
+
+    orchestrator.shutdown()
+
+def test_failed_request_raises_from_its_future():
+    """A future settles with the request's error, where execute_and_retrieve_* returns None."""
+    orchestrator = TaskOrchestrator(token='token')
+    arguments = dict(
+        latitude=10.0, longitude=0.0, product_id='NOPE', band_names=['LST_Day_1km'],
+        start_date=datetime(2023, 1, 1), end_date=datetime(2023, 1, 31)
+    )
+    future = orchestrator.submit_point_task(**arguments)
+    assert isinstance(future.exception(timeout=5), ValueError)
+    with pytest.raises(ValueError):
+        future.result()
+    assert orchestrator.execute_and_retrieve_point_task(**arguments) is None
+    orchestrator.shutdown()
+
+def test_handles_beyond_max_workers_are_submitted_right_away():
+    """Waiting holds no worker thread: every request is submitted at once and one thread polls them all."""
+    orchestrator = TaskOrchestrator(token='token', max_workers=2, poll_interval=0.01)
+    release = threading.Event()
+    polled = set()
+
+    def submit_callback(request, context):
+        context.status_code = 202
+        return {"task_id": f"task-{request.json()['params']['coordinates'][0]['latitude']:.0f}"}
+
+    def status_callback(request, context):
+        polled.add(threading.current_thread().name)
+        return {"status": "done" if release.is_set() else "processing"}
+
+    with requests_mock.Mocker() as mocker:
+        post = mocker.post(f"{base_url}/task", json=submit_callback)
+        mocker.get(re.compile(f"{base_url}/status/.*"), json=status_callback)
+        mocker.get(re.compile(f"{base_url}/bundle/.*"), json={"files": [{"file_id": "1", "file_name": "a.csv"}]})
+
+        futures = [
+            orchestrator.submit_point_task(
+                latitude=float(latitude), longitude=0.0, product_id='MOD11A1.061', band_names=['LST_Day_1km'],
+                start_date=datetime(2023, 1, 1), end_date=datetime(2023, 1, 31)
+            )
+            for latitude in range(10)
+        ]
+        for _ in range(500):
+            if post.call_count == 10:
+                break
+            time.sleep(0.01)
+        assert post.call_count == 10 and not any(future.done() for future in futures)
+
+        release.set()
+        done, not_done = wait(futures, timeout=5)
+        assert len(done) == 10 and not not_done
+
+    assert polled == {"appeears-poller"}
+    orchestrator.shutdown()
+
+def test_shutdown_without_waiting_fails_pending_handles():
+    """Handles of requests still waiting for their tasks, or not started yet, resolve instead of blocking forever."""
+    orchestrator = TaskOrchestrator(token='token', max_workers=1, poll_interval=0.01)
+    arguments = dict(
+        geo_json=GEO_JSON, product_id='MOD11A1.061', band_names=['LST_Day_1km'],
+        start_date=datetime(2023, 1, 1), end_date=datetime(2023, 1, 31)
+    )
+    with requests_mock.Mocker() as mocker:
+        mocker.post(f"{base_url}/task", status_code=202, json={"task_id": "task-1"})
+        status = mocker.get(re.compile(f"{base_url}/status/.*"), json={"status": "processing"})
+
+        polled = orchestrator.submit_area_task(**arguments)
+        deadline = time.monotonic() + 5
+        while not status.called and time.monotonic() < deadline:
+            time.sleep(0.01)
+        queued = [orchestrator.submit_area_task(**arguments) for _ in range(3)]
+        orchestrator.shutdown(wait=False)
+
+        with pytest.raises(RuntimeError):
+            polled.result(timeout=5)
+        done, not_done = wait(queued, timeout=5)
+    assert not not_done
+    assert all(future.cancelled() or isinstance(future.exception(), RuntimeError) for future in queued)
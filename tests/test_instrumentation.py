@@ -0,0 +1,99 @@
+# tests.test_instrumentation.py
+from datetime import datetime
+
+import requests_mock
+
+from src.appeears import APIClient
+from src.appeears_client.config import base_url
+from src.appeears_client.file_management import FileManager
+from src.appeears_client.instrumentation import NULL_INSTRUMENTATION, NULL_STAGE, HistogramInstrumentation, Instrumentation
+from src.appeears_client.mock_server import MockAppEEARSServer
+from src.appeears_client.rate_limit import RateLimiter
+from src.appeears_client.retry import RetryPolicy
+from src.appeears_client.transport import CredentialProvider, Transport
+
+def test_disabled_instrumentation_is_a_no_op():
+    transport = Transport(CredentialProvider('token'))
+    assert transport.instrumentation is NULL_INSTRUMENTATION
+    with transport.instrumentation.stage('download') as stage:
+        stage.add(bytes=10)
+    assert stage is NULL_STAGE
+
+def test_requests_report_status_retries_and_queue_wait():
+    instrumentation = HistogramInstrumentation()
+    transport = Transport(
+        CredentialProvider('token'),
+        retry_policy=RetryPolicy(sleep=lambda seconds: None),
+        rate_limiter=RateLimiter({'status': (1.0, 1)}, sleep=lambda seconds: None),
+        instrumentation=instrumentation
+    )
+    url = f"{base_url}/status/task-1"
+    with requests_mock.Mocker() as mocker:
+        mocker.get(url, [{'status_code': 503}, {'json': {"status": "done"}, 'headers': {'Content-Length': '18'}}])
+        transport.get(url)
+        mocker.get(f"{base_url}/product", status_code=404)
+        transport.get(f"{base_url}/product")
+
+    snapshot = instrumentation.snapshot()['requests']
+    assert snapshot['status']['count'] == 1
+    assert snapshot['status']['retries'] == 1
+    assert snapshot['status']['statuses'] == {'200': 1}
+    assert snapshot['status']['bytes_received'] == 18
+    assert 0.9 < snapshot['status']['queue_wait'] <= 1.0
+    assert snapshot['product']['errors'] == 1
+
+def test_failed_downloads_and_text_bodies_are_measured(tmp_path):
+    """A download returning its error counts as a failed stage, and text bodies are measured in encoded bytes."""
+    instrumentation = HistogramInstrumentation()
+    transport = Transport(CredentialProvider('token'), instrumentation=instrumentation)
+    with requests_mock.Mocker() as mocker:
+        mocker.get(f"{base_url}/bundle/task-1/file-1", status_code=404)
+        result = FileManager(transport=transport).download_and_process_file('task-1', 'file-1', 'a.tif', destination_dir=str(tmp_path))
+        mocker.post(f"{base_url}/task", status_code=202)
+        transport.post(f"{base_url}/task", data='{"task_name": "Météo"}')
+
+    assert "error" in result
+    snapshot = instrumentation.snapshot()
+    assert snapshot['stages']['download']['errors'] == 1
+    assert snapshot['requests']['submit']['bytes_sent'] == len('{"task_name": "Météo"}'.encode('utf-8')) == 24
+
+def test_histogram_percentiles():
+    instrumentation = HistogramInstrumentation()
+    for duration in [0.002] * 90 + [0.2] * 10:
+        instrumentation.record_stage('extract', duration, pixels=100)
+    summary = instrumentation.snapshot()['stages']['extract']
+    assert summary['count'] == 100 and summary['pixels'] == 10000
+    assert summary['duration']['p50'] == 0.0025
+    assert summary['duration']['p99'] == 0.2
+    assert 'extract' in instrumentation.report()
+
+def test_pipeline_stages_are_reported_to_a_custom_backend(tmp_path):
+    """A backend only needs to subclass Instrumentation; every stage of an orchestrated task reaches it."""
+    class Backend(Instrumentation):
+        enabled = True
+
+        def __init__(self):
+            self.stages = []
+            self.endpoints = set()
+
+        def record_request(self, endpoint, method, status, duration, **kwargs):
+            self.endpoints.add(endpoint)
+
+        def record_stage(self, stage, duration, error=None, **values):
+            self.stages.append((stage, values))
+
+    backend = Backend()
+    with MockAppEEARSServer() as server:
+        client = APIClient('user', 'password', base_url=server.base_url, poll_interval=0.01, instrumentation=backend)
+        geo_json = {"type": "Polygon", "coordinates": [[[-50.0, -10.0], [-49.9, -10.0], [-49.9, -9.9], [-50.0, -9.9], [-50.0, -10.0]]]}
+        files = client.task_orchestrator.execute_and_retrieve_area_task(
+            geo_json=geo_json, product_id='MOD11A1.061', band_names=['LST_Day_1km'],
+            start_date=datetime(2020, 1, 1), end_date=datetime(2020, 1, 1)
+        )
+        task_id = next(iter(server.tasks))
+        client.file_manager.download_and_process_file(task_id, files[0]['file_id'], files[0]['file_name'], destination_dir=str(tmp_path))
+        client.close()
+
+    assert [stage for stage, _ in backend.stages] == ['submit', 'wait', 'download']
+    assert backend.stages[-1][1]['bytes'] > 0
+    assert {'submit', 'status', 'bundle', 'download'} <= backend.endpoints
@@ -0,0 +1,96 @@
+# tests.test_mock_server.py
+import os
+import csv
+from datetime import datetime
+
+import pytest
+import rasterio
+import requests
+
+from src.appeears import APIClient
+from src.appeears_client.estimation import estimate_area_task
+from src.appeears_client.mock_server import MockAppEEARSServer
+from src.appeears_client.spatial_tiling import split_area
+from src.appeears_client.product_management import ProductManagement
+from src.catalog_sync import sync_catalog
+
+GEO_JSON = {
+    "type": "FeatureCollection",
+    "features": [{
+        "type": "Feature",
+        "properties": {},
+        "geometry": {"type": "Polygon", "coordinates": [[[-50.0, -10.0], [-49.9, -10.0], [-49.9, -9.9], [-50.0, -9.9], [-50.0, -10.0]]]}
+    }]
+}
+
+@pytest.fixture
+def server():
+    with MockAppEEARSServer(queue_time=0.05, processing_time=0.05, users={'user': 'password'}) as server:
+        yield server
+
+def test_area_task_runs_end_to_end_offline(server, tmp_path):
+    """Submission, polling, listing and download all go to the configured base URL, and the GeoTIFFs are readable."""
+    client = APIClient('user', 'password', base_url=server.base_url, poll_interval=0.01)
+    files = client.task_orchestrator.execute_and_retrieve_area_task(
+        geo_json=GEO_JSON, product_id='MOD11A1.061', band_names=['LST_Day_1km'],
+        start_date=datetime(2020, 1, 1), end_date=datetime(2020, 1, 3)
+    )
+    tifs = [file for file in files if file['file_name'].endswith('.tif')]
+    assert [file['file_name'] for file in tifs] == [
+        f"MOD11A1.061_LST_Day_1km_doy202000{day}_aid0001.tif" for day in (1, 2, 3)
+    ]
+
+    task_id = next(iter(server.tasks))
+    result = client.file_manager.download_and_process_file(task_id, tifs[0]['file_id'], tifs[0]['file_name'], destination_dir=str(tmp_path))
+    assert "message" in result
+    with rasterio.open(os.path.join(tmp_path, tifs[0]['file_name'])) as dataset:
+        assert dataset.crs.to_epsg() == 4326
+        assert dataset.width == dataset.height == 12
+    assert server.request_counts['submit'] == 1 and server.request_counts['download'] == 1
+    client.close()
+
+def test_tiled_task_checks_every_tile_against_the_size_limit(server, tmp_path):
+    """Tiles above max_task_bytes are split by date with oversize="split", and reject the request otherwise."""
+    arguments = dict(
+        geo_json=GEO_JSON, product_id='MOD11A1.061', band_names=['LST_Day_1km'],
+        start_date=datetime(2020, 1, 1), end_date=datetime(2020, 1, 3), target_pixels=50
+    )
+    tiles = split_area(GEO_JSON, product_id='MOD11A1.061', target_pixels=50)
+    largest = max(estimate_area_task(tile, 'MOD11A1.061', ['LST_Day_1km'], datetime(2020, 1, 1), datetime(2020, 1, 3)).bytes for tile in tiles)
+
+    rejecting = APIClient('user', 'password', base_url=server.base_url, poll_interval=0.01, max_task_bytes=largest // 3)
+    assert rejecting.task_orchestrator.execute_and_retrieve_tiled_area_task(destination_dir=str(tmp_path), **arguments) is None
+    assert server.request_counts['submit'] == 0
+    rejecting.close()
+
+    splitting = APIClient('user', 'password', base_url=server.base_url, poll_interval=0.01, max_task_bytes=largest // 3, oversize="split")
+    mosaics = splitting.task_orchestrator.execute_and_retrieve_tiled_area_task(destination_dir=str(tmp_path), **arguments)
+    assert [os.path.basename(path) for path in mosaics] == [
+        f"MOD11A1.061_LST_Day_1km_doy202000{day}_aid0001.tif" for day in (1, 2, 3)
+    ]
+    assert server.request_counts['submit'] == 3 * len(tiles) > 3
+    splitting.close()
+
+def test_point_task_produces_a_csv_per_product(server):
+    client = APIClient('user', 'password', base_url=server.base_url, poll_interval=0.01)
+    files = client.task_orchestrator.execute_and_retrieve_point_task(
+        latitude=-9.95, longitude=-49.95, product_id='MOD11A1.061', band_names=['LST_Day_1km', 'LST_Night_1km'],
+        start_date=datetime(2020, 1, 1), end_date=datetime(2020, 1, 5)
+    )
+    csv_file = next(file for file in files if file['file_type'] == 'csv')
+    response = client.transport.get(f"{server.base_url}/bundle/{next(iter(server.tasks))}/{csv_file['file_id']}")
+    rows = list(csv.DictReader(response.text.splitlines()))
+    assert len(rows) == 5
+    assert {'MOD11A1_061_LST_Day_1km', 'MOD11A1_061_LST_Night_1km'} <= set(rows[0])
+    client.close()
+
+def test_requests_need_a_valid_login(server):
+    assert requests.post(f"{server.base_url}/login", auth=('user', 'wrong')).status_code == 401
+    assert requests.get(f"{server.base_url}/product", headers={'Authorization': 'Bearer forged'}).status_code == 401
+
+def test_catalog_listing_round_trips_through_sync(server):
+    """The mock serves the local catalog, so syncing against it finds no product added or removed."""
+    client = APIClient('user', 'password', base_url=server.base_url)
+    diff = sync_catalog(ProductManagement(transport=client.transport), dry_run=True)
+    assert diff.added == [] and diff.removed == []
+    client.close()
@@ -0,0 +1,94 @@
+# tests.test_models.py
+import sys
+import subprocess
+from datetime import datetime
+
+import pytest
+import requests_mock
+
+from src import models
+
+def test_get_product_by_id():
+    """Products are built from the catalog file with all their bands."""
+    product = models.get_product_by_id('EMIT_L2A_RFL.001')
+    assert product.product_id == 'EMIT_L2A_RFL.001'
+    assert 'B285' in {band.name for band in product.bands}
+    assert models.get_product_by_id('EMIT_L2A_RFL.001') is product
+
+def test_unknown_product_raises_value_error():
+    with pytest.raises(ValueError):
+        models.get_product_by_id('NOT_A_PRODUCT.001')
+
+def test_products_list_is_still_available():
+    """PRODUCTS keeps exposing the full catalog as a list of Product models."""
+    products = models.PRODUCTS
+    assert len(products) == 152
+    assert all(isinstance(product, models.Product) for product in products)
+
+def test_import_does_not_load_the_catalog():
+    """Importing the module neither reads the catalog file nor imports pydantic."""
+    probe = "import sys, src.models as m; print(m._catalog is None, 'pydantic' in sys.modules)"
+    output = subprocess.run([sys.executable, '-c', probe], capture_output=True, text=True, check=True).stdout
+    assert output.split() == ['True', 'False']
+
+def test_get_band():
+    band = models.get_band('EMIT_L2A_RFL.001', 'B278')
+    assert band.name == 'B278' and 'Wavelength: 2441.218 nm' in band.description
+    with pytest.raises(ValueError):
+        models.get_band('EMIT_L2A_RFL.001', 'B999')
+
+def test_validate_bands_keeps_request_order_and_drops_unknown():
+    assert models.validate_bands('MOD11A1.061', ['LST_Night_1km', 'nope', 'LST_Day_1km', 'LST_Night_1km']) == [
+        'LST_Night_1km', 'LST_Day_1km'
+    ]
+    with pytest.raises(ValueError):
+        models.validate_bands('MOD11A1.061', ['nope'])
+
+def test_validate_layers_reports_every_invalid_layer():
+    models.validate_layers([{"product": "MOD11A1.061", "layer": "LST_Day_1km"}])
+    with pytest.raises(ValueError) as error:
+        models.validate_layers([
+            {"product": "MOD11A1.061", "layer": "LST_Day_1km"},
+            {"product": "MOD11A1.061", "layer": "nope"},
+            {"product": "NOT_A_PRODUCT.001", "layer": "x"},
+        ])
+    assert 'MOD11A1.061/nope' in str(error.value)
+    assert 'NOT_A_PRODUCT.001' in str(error.value)
+
+def test_catalog_records_are_immutable():
+    """Products and bands are frozen records, with tuples of bands and interned band names."""
+    product = models.get_product_by_id('MOD11A1.061')
+    assert isinstance(product.bands, tuple)
+    with pytest.raises(AttributeError):
+        product.description = 'changed'
+    with pytest.raises(AttributeError):
+        product.bands[0].__dict__
+    name = ''.join(['Clear_', 'day_cov'])
+    assert product.bands[0].name == name and product.bands[0].name is sys.intern(name)
+
+def test_to_schema_returns_a_validated_pydantic_model():
+    from src import schemas
+    model = models.get_product_by_id('MOD11A1.061').to_schema()
+    assert isinstance(model, schemas.Product)
+    assert model.bands[0].name == 'Clear_day_cov' and model.pixel_size == 1000
+
+def test_check_coverage_rejects_requests_outside_the_product_extent():
+    models.check_coverage('MOD09A1.061', datetime(1999, 6, 1), datetime(2000, 6, 1))
+    with pytest.raises(ValueError, match='available from 2000'):
+        models.check_coverage('MOD09A1.061', datetime(1999, 1, 1), datetime(1999, 12, 31))
+    with pytest.raises(ValueError, match='available until'):
+        models.check_coverage('L04.002', datetime(2000, 1, 1), datetime(2000, 2, 1))
+    with pytest.raises(ValueError, match='outside the coverage'):
+        models.check_coverage('DAYMET.004', datetime(2020, 1, 1), datetime(2020, 2, 1), bounds=(2.0, 48.0, 2.5, 48.5))
+    # Static products have no temporal extent
+    models.check_coverage('SRTMGL1_NC.003', datetime(1990, 1, 1), datetime(1990, 1, 1), bounds=(2.0, 48.0, 2.0, 48.0))
+
+def test_out_of_range_tasks_fail_before_any_request():
+    from src.appeears_client.task_management import TaskManagement
+    with requests_mock.Mocker() as mocker:
+        response = TaskManagement(token='token').submit_point_task(
+            latitude=10.0, longitude=0.0, product_id='EMIT_L2A_RFL.001', band_names=['B001'],
+            start_date=datetime(2021, 1, 1), end_date=datetime(2021, 12, 31)
+        )
+    assert 'available from 2022' in response['error']
+    assert mocker.call_count == 0
@@ -0,0 +1,60 @@
+# tests.test_product_management.py
+import re
+import threading
+
+import requests_mock
+
+from src.appeears_client.config import base_url
+from src.appeears_client.product_management import ProductManagement
+from src.appeears_client.response_cache import ResponseCache
+from src.appeears_client.retry import RetryPolicy
+from src.appeears_client.transport import CredentialProvider, Transport
+
+def test_catalog_crawl_is_concurrent_and_collects_failures():
+    """Layer requests run on several threads, and products failing or unknown locally are reported instead of aborting."""
+    products = [{"ProductAndVersion": f"P{i}.001"} for i in range(20)] + [{"ProductAndVersion": "NEW_PRODUCT.001"}]
+    threads = set()
+
+    def layers_callback(request, context):
+        threads.add(threading.get_ident())
+        if request.path.endswith('p3.001'):
+            context.status_code = 500
+            return {}
+        return {"Layer": {}}
+
+    with requests_mock.Mocker() as mocker:
+        mocker.get(f"{base_url}/product", json=products)
+        mocker.get(re.compile(f"{base_url}/product/.+"), json=layers_callback)
+        transport = Transport(CredentialProvider('token'), retry_policy=RetryPolicy(sleep=lambda seconds: None))
+        all_products = ProductManagement(transport=transport).get_all_products_and_layers(max_workers=8)
+
+    assert set(all_products) == {product["ProductAndVersion"] for product in products}
+    assert len(threads) > 1
+    assert all_products["P3.001"]["layers"] is None and "error" in all_products["P3.001"]
+    assert all_products["NEW_PRODUCT.001"]["layers"] == {"Layer": {}}
+
+def test_cached_product_is_served_without_a_request(tmp_path):
+    """A fresh entry is served from the cache, and shared with other instances using the same directory."""
+    url = f"{base_url}/product/MOD11A1.061"
+    with requests_mock.Mocker() as mocker:
+        mocker.get(url, json={"LST_Day_1km": {}}, headers={"ETag": '"v1"'})
+        first = ProductManagement(token='token', cache=ResponseCache(cache_dir=str(tmp_path)))
+        assert first.get_product('MOD11A1.061') == {"LST_Day_1km": {}}
+        assert first.get_product_layers('MOD11A1.061') == {"LST_Day_1km": {}}
+
+        other_process = ProductManagement(token='token', cache=ResponseCache(cache_dir=str(tmp_path)))
+        assert other_process.get_product('MOD11A1.061') == {"LST_Day_1km": {}}
+        assert mocker.call_count == 1
+
+def test_stale_entry_is_revalidated_with_etag(tmp_path):
+    """Once the TTL expires, the entry is revalidated with If-None-Match and a 304 keeps the cached body."""
+    url = f"{base_url}/product/MOD11A1.061"
+    cache = ResponseCache(cache_dir=str(tmp_path), ttl=0)
+    product_manager = ProductManagement(token='token', cache=cache)
+    with requests_mock.Mocker() as mocker:
+        mocker.get(url, json={"LST_Day_1km": {}}, headers={"ETag": '"v1"'})
+        product_manager.get_product('MOD11A1.061')
+
+        mocker.get(url, status_code=304)
+        assert product_manager.get_product('MOD11A1.061') == {"LST_Day_1km": {}}
+        assert mocker.last_request.headers['If-None-Match'] == '"v1"'
@@ -0,0 +1,60 @@
+# tests.test_progress.py
+import logging
+
+import requests_mock
+
+from src.appeears_client.config import base_url
+from src.appeears_client.progress import NULL_PROGRESS, ProgressReporter, default_progress
+from src.appeears_client.task_management import TaskManagement
+
+class RecordingProgress(ProgressReporter):
+    def __init__(self):
+        self.updates = []
+        self.closed = []
+
+    def update(self, task_id, status, percent):
+        self.updates.append((status, percent))
+
+    def close(self, task_id):
+        self.closed.append(task_id)
+
+def test_headless_runs_are_silent_by_default(capsys):
+    """Outside a terminal nothing is drawn, and listings go to the logger instead of stdout."""
+    assert default_progress() is NULL_PROGRESS  # pytest captures stderr, so it is not a terminal
+
+    files = [{"file_id": str(index), "file_name": f"file_{index}.tif"} for index in range(1000)]
+    with requests_mock.Mocker() as mocker:
+        mocker.get(f"{base_url}/bundle/task-1", json={"files": files})
+        assert TaskManagement(token='token').list_task_files('task-1') == files
+
+    captured = capsys.readouterr()
+    assert captured.out == "" and captured.err == ""
+
+def test_listing_is_logged_with_levels(caplog):
+    files = [{"file_id": "1", "file_name": "a.tif"}]
+    with requests_mock.Mocker() as mocker:
+        mocker.get(f"{base_url}/bundle/task-1", json={"files": files})
+        with caplog.at_level(logging.INFO, logger='src.appeears_client.task_management'):
+            TaskManagement(token='token').list_task_files('task-1')
+        assert [record.getMessage() for record in caplog.records] == ["Files found for the task task-1: 1 listed files"]
+        assert caplog.records[0].task_id == 'task-1'
+
+        caplog.clear()
+        with caplog.at_level(logging.DEBUG, logger='src.appeears_client.task_management'):
+            TaskManagement(token='token').list_task_files('task-1')
+        assert "a.tif" in caplog.records[-1].getMessage()
+
+def test_status_polling_reports_to_the_progress_reporter():
+    progress = RecordingProgress()
+    url = f"{base_url}/status/task-1"
+    with requests_mock.Mocker() as mocker:
+        mocker.get(url, [
+            {'json': {"status": "queued"}},
+            {'json': {"status": "processing", "progress": {"summary": 40}}},
+            {'json': {"status": "done"}},
+        ])
+        task_manager = TaskManagement(token='token', poll_interval=0, progress=progress)
+        assert task_manager.check_task_status('task-1') is True
+
+    assert progress.updates == [("queued", 0), ("processing", 40), ("done", 100)]
+    assert progress.closed == ['task-1']
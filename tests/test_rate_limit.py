@@ -0,0 +1,70 @@
+# tests.test_rate_limit.py
+import threading
+import time
+
+import pytest
+import requests_mock
+
+from src.appeears_client.config import base_url
+from src.appeears_client.rate_limit import RateLimiter, TokenBucket
+from src.appeears_client.transport import CredentialProvider, Transport
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+def test_bucket_allows_a_burst_then_spaces_requests():
+    """Once the burst is spent, reservations queue up 1/rate apart instead of all waiting for the same token."""
+    clock = FakeClock()
+    bucket = TokenBucket(rate=2.0, capacity=3, clock=clock)
+
+    assert [bucket.reserve() for _ in range(3)] == [0.0, 0.0, 0.0]
+    assert [bucket.reserve() for _ in range(3)] == [0.5, 1.0, 1.5]
+
+    clock.now = 10.0
+    assert bucket.reserve() == 0.0  # refilled, but never above its capacity
+    assert [bucket.reserve() for _ in range(3)] == [0.0, 0.0, 0.5]
+
+def test_invalid_limits_are_rejected():
+    with pytest.raises(ValueError):
+        TokenBucket(rate=0, capacity=1)
+
+def test_endpoint_classes_have_separate_buckets():
+    waits = []
+    limiter = RateLimiter({'status': (1.0, 1), 'download': (1.0, 1)}, sleep=waits.append)
+    transport = Transport(CredentialProvider('token'), rate_limiter=limiter)
+    with requests_mock.Mocker() as mocker:
+        mocker.get(f"{base_url}/status/task-1", json={})
+        mocker.get(f"{base_url}/bundle/task-1/file-1", content=b"")
+        mocker.get(f"{base_url}/product", json=[])
+        transport.get(f"{base_url}/status/task-1")
+        transport.get(f"{base_url}/bundle/task-1/file-1")
+        transport.get(f"{base_url}/product")  # not limited
+        assert waits == []
+
+        transport.get(f"{base_url}/status/task-1")
+        assert len(waits) == 1 and waits[0] == pytest.approx(1.0, abs=0.05)
+
+def test_throughput_across_threads_stays_at_the_limit():
+    """Concurrent threads share a bucket, and their combined rate converges to the configured one."""
+    limiter = RateLimiter({'status': (200.0, 5)})
+    sent = []
+
+    def worker():
+        for _ in range(20):
+            limiter.acquire('status')
+            sent.append(time.monotonic())
+
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    start = time.monotonic()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    # 160 requests with a burst of 5 take at least 155 / 200 seconds
+    assert len(sent) == 160
+    assert max(sent) - start >= 0.75
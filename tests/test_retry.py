@@ -0,0 +1,132 @@
+# tests.test_retry.py
+from datetime import datetime
+
+import pytest
+import requests
+import requests_mock
+
+from src.appeears_client.config import base_url
+from src.appeears_client.file_management import FileManager
+from src.appeears_client.retry import RetryPolicy
+from src.appeears_client.task_orchestrator import TaskOrchestrator
+from src.appeears_client.transport import CredentialProvider, Transport, endpoint_class
+
+def _transport(**kwargs):
+    sleeps = []
+    policy = RetryPolicy(sleep=sleeps.append, **kwargs)
+    return Transport(CredentialProvider('token'), retry_policy=policy), sleeps
+
+def test_endpoint_classes():
+    assert endpoint_class('POST', f"{base_url}/task") == 'submit'
+    assert endpoint_class('GET', f"{base_url}/task/task-1") == 'task'
+    assert endpoint_class('GET', f"{base_url}/status/task-1") == 'status'
+    assert endpoint_class('GET', f"{base_url}/bundle/task-1") == 'bundle'
+    assert endpoint_class('GET', f"{base_url}/bundle/task-1/file-1") == 'download'
+    assert endpoint_class('GET', f"{base_url}/product/MOD11A1.061") == 'product'
+    assert endpoint_class('POST', f"{base_url}/login") == 'auth'
+
+def test_transient_failures_are_retried_with_backoff():
+    """Idempotent requests are retried on 5xx and connection errors, with exponentially growing delays."""
+    transport, sleeps = _transport(jitter=False)
+    url = f"{base_url}/status/task-1"
+    with requests_mock.Mocker() as mocker:
+        mocker.get(url, [
+            {'status_code': 502},
+            {'exc': requests.ConnectionError},
+            {'status_code': 503},
+            {'json': {"status": "done"}},
+        ])
+        response = transport.get(url)
+
+    assert response.json() == {"status": "done"}
+    assert sleeps == [1.0, 2.0, 4.0]
+    metrics = transport.retry_policy.metrics.snapshot()
+    assert metrics['attempts'] == {'status': 4}
+    assert metrics['retries'] == {'status:status_502': 1, 'status:ConnectionError': 1, 'status:status_503': 1}
+    assert metrics['giveups'] == {}
+
+def test_retry_after_is_honoured_and_attempts_are_bounded():
+    transport, sleeps = _transport(max_attempts=3, max_retry_after=10)
+    url = f"{base_url}/bundle/task-1"
+    with requests_mock.Mocker() as mocker:
+        mocker.get(url, status_code=429, headers={'Retry-After': '30'})
+        response = transport.get(url)
+        assert mocker.call_count == 3
+
+    assert response.status_code == 429
+    assert sleeps == [10, 10]
+    assert transport.retry_policy.metrics.snapshot()['giveups'] == {'bundle:status_429': 1}
+
+def test_submissions_are_only_retried_when_refused():
+    """A 500 on POST /task may have queued the task, so only throttling and unavailability are retried."""
+    transport, sleeps = _transport()
+    url = f"{base_url}/task"
+    with requests_mock.Mocker() as mocker:
+        mocker.post(url, [{'status_code': 500}, {'json': {"task_id": "task-1"}}])
+        assert transport.post(url, json={}).status_code == 500
+
+        mocker.post(url, [{'status_code': 503}, {'json': {"task_id": "task-1"}}])
+        assert transport.post(url, json={}).json() == {"task_id": "task-1"}
+
+        mocker.post(url, exc=requests.ReadTimeout)
+        with pytest.raises(requests.ReadTimeout):
+            transport.post(url, json={})
+    assert len(sleeps) == 1
+
+def test_interrupted_download_is_resumed_from_scratch(tmp_path, monkeypatch):
+    """A connection dropped mid-stream is retried, and no partial file is left behind."""
+    transport, sleeps = _transport()
+    url = "https://appeears.earthdatacloud.nasa.gov/api/bundle/task-1/file-1"
+    chunks = iter([requests.exceptions.ChunkedEncodingError("dropped"), None])
+
+    def iter_content(self, chunk_size=1):
+        error = next(chunks)
+        yield b"partial"
+        if error is not None:
+            raise error
+        yield b" and complete"
+
+    monkeypatch.setattr(requests.Response, 'iter_content', iter_content)
+    with requests_mock.Mocker() as mocker:
+        mocker.get(url, content=b"")
+        result = FileManager(transport=transport).download_and_process_file('task-1', 'file-1', 'a.tif', destination_dir=str(tmp_path))
+
+    assert "message" in result
+    assert (tmp_path / 'a.tif').read_bytes() == b"partial and complete"
+    assert not (tmp_path / 'a.tif.part').exists()
+    assert len(sleeps) == 1
+
+def _point_task(orchestrator):
+    return orchestrator.execute_and_retrieve_point_task(
+        latitude=10.0, longitude=0.0, product_id='MOD11A1.061', band_names=['LST_Day_1km'],
+        start_date=datetime(2023, 1, 1), end_date=datetime(2023, 1, 31)
+    )
+
+def test_orchestrator_keeps_polling_after_the_transport_gives_up():
+    """A status or listing the transport could not get is polled again, the task is neither lost nor resubmitted."""
+    transport, _ = _transport(max_attempts=1)
+    orchestrator = TaskOrchestrator(transport=transport, poll_interval=0)
+    files = [{"file_id": "1", "file_name": "a.csv"}]
+    with requests_mock.Mocker() as mocker:
+        post = mocker.post(f"{base_url}/task", status_code=202, json={"task_id": "task-1"})
+        status = mocker.get(f"{base_url}/status/task-1", [
+            {'status_code': 503},
+            {'exc': requests.ConnectionError},
+            {'json': {"status": "processing"}},
+            {'json': {"status": "done"}},
+        ])
+        mocker.get(f"{base_url}/bundle/task-1", [{'exc': requests.ConnectionError}, {'json': {"files": files}}])
+        assert _point_task(orchestrator) == files
+
+    assert post.call_count == 1 and status.call_count == 4
+
+def test_orchestrator_tells_failed_tasks_from_running_ones():
+    """A task the server no longer knows is failed, not running: the request ends instead of polling forever."""
+    transport, _ = _transport(max_attempts=1)
+    orchestrator = TaskOrchestrator(transport=transport, poll_interval=0)
+    with requests_mock.Mocker() as mocker:
+        mocker.post(f"{base_url}/task", status_code=202, json={"task_id": "task-1"})
+        status = mocker.get(f"{base_url}/status/task-1", [{'status_code': 503}, {'status_code': 404}])
+        assert _point_task(orchestrator) is None
+
+    assert status.call_count == 2
@@ -0,0 +1,74 @@
+# tests.test_spatial_tiling.py
+import os
+
+import numpy as np
+import pytest
+import rasterio
+from rasterio.transform import from_origin
+
+from src.appeears_client.file_management import FileManager
+from src.appeears_client.spatial_tiling import geojson_bounds, split_area, tile_geojson, estimate_pixel_count
+
+def _polygon(min_lon, min_lat, max_lon, max_lat):
+    return {
+        "type": "FeatureCollection",
+        "features": [{
+            "type": "Feature",
+            "properties": {},
+            "geometry": {"type": "Polygon", "coordinates": [[
+                [min_lon, min_lat], [max_lon, min_lat], [max_lon, max_lat], [min_lon, max_lat], [min_lon, min_lat]
+            ]]}
+        }]
+    }
+
+def test_small_area_is_not_tiled():
+    """An area below the target pixel count is submitted as is."""
+    geo_json = _polygon(-78.5, 17.5, -78.0, 18.0)
+    assert tile_geojson(geo_json, product_id='MOD09A1.061') == [geo_json]
+
+def test_tiles_respect_target_and_cover_area():
+    """Every tile should stay under the target and the tiles should span the original bounding box."""
+    geo_json = _polygon(-80.0, 10.0, -60.0, 30.0)
+    target = 1_000_000
+    tiles = tile_geojson(geo_json, product_id='MOD09A1.061', target_pixels=target)
+    assert len(tiles) > 1
+    assert all(estimate_pixel_count(tile, 500) <= target * 1.01 for tile in tiles)
+
+    bounds = [geojson_bounds(tile) for tile in tiles]
+    assert min(b[0] for b in bounds) == pytest.approx(-80.0)
+    assert min(b[1] for b in bounds) == pytest.approx(10.0)
+    assert max(b[2] for b in bounds) == pytest.approx(-60.0)
+    assert max(b[3] for b in bounds) == pytest.approx(30.0)
+
+def test_tiles_outside_a_triangle_are_dropped():
+    """Grid cells that do not intersect the polygon produce no task."""
+    triangle = {"type": "Polygon", "coordinates": [[[0, 0], [20, 0], [0, 20], [0, 0]]]}
+    tiles = tile_geojson(triangle, product_id='MOD13Q1.061', target_pixels=2_000_000)
+    grid_cells = estimate_pixel_count(triangle, 250) / 2_000_000
+    assert 1 < len(tiles) < grid_cells
+
+def test_split_by_features():
+    """The 'features' strategy yields at least one tile per feature."""
+    first, second = _polygon(0, 0, 1, 1), _polygon(5, 5, 6, 6)
+    collection = {"type": "FeatureCollection", "features": first['features'] + second['features']}
+    assert len(split_area(collection, product_id='MOD09A1.061', strategy='features')) == 2
+    with pytest.raises(ValueError):
+        split_area(collection, product_id='MOD09A1.061', strategy='hexagons')
+
+def test_mosaic_files(tmp_path):
+    """Adjacent tiles are merged into a single raster covering both."""
+    paths = []
+    for index, west in enumerate([0.0, 1.0]):
+        path = os.path.join(tmp_path, f"tile{index}.tif")
+        with rasterio.open(
+            path, 'w', driver='GTiff', height=10, width=10, count=1, dtype='int16',
+            crs='EPSG:4326', transform=from_origin(west, 1.0, 0.1, 0.1)
+        ) as dst:
+            dst.write(np.full((1, 10, 10), index + 1, dtype='int16'))
+        paths.append(path)
+
+    output = FileManager(token='token').mosaic_files(paths, os.path.join(tmp_path, 'mosaic.tif'))
+    with rasterio.open(output) as src:
+        data = src.read(1)
+    assert data.shape == (10, 20)
+    assert (data[:, :10] == 1).all() and (data[:, 10:] == 2).all()
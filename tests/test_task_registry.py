@@ -0,0 +1,111 @@
+# tests.test_task_registry.py
+import os
+import threading
+from datetime import datetime
+
+import requests_mock
+
+from src.appeears_client.config import base_url
+from src.appeears_client.task_management import TaskManagement
+from src.appeears_client.task_registry import TaskRegistry, fingerprint_task
+
+LAYERS = [{"product": "MOD11A1.061", "layer": "LST_Day_1km"}, {"product": "MOD11A1.061", "layer": "LST_Night_1km"}]
+
+def _area_params(task_manager, layers=LAYERS):
+    return task_manager.build_area_task_params(
+        geo_json={"type": "Polygon", "coordinates": [[[0, 0], [1, 0], [1, 1], [0, 0]]]},
+        start_date="01-01-2023", end_date="01-31-2023", layers=layers
+    )
+
+def test_fingerprint_ignores_task_name_and_layer_order():
+    """Two requests for the same data hash the same even with different names and layer order."""
+    task_manager = TaskManagement(token='token')
+    first = _area_params(task_manager)
+    second = _area_params(task_manager, layers=list(reversed(LAYERS)))
+    second['task_name'] = 'Another name'
+    assert fingerprint_task(first) == fingerprint_task(second)
+
+    third = _area_params(task_manager)
+    third['params']['dates'][0]['endDate'] = "02-28-2023"
+    assert fingerprint_task(first) != fingerprint_task(third)
+
+def test_registry_hit_skips_submission(tmp_path):
+    """A task recorded in the local registry is reused while it is still available."""
+    registry = TaskRegistry(path=os.path.join(tmp_path, 'registry.json'))
+    task_manager = TaskManagement(token='token', registry=registry)
+    registry.record(fingerprint_task(_area_params(task_manager)), 'known-task')
+
+    with requests_mock.Mocker() as mocker:
+        mocker.get(f"{base_url}/task/known-task", json={"task_id": "known-task", "status": "done"})
+        post = mocker.post(f"{base_url}/task", status_code=202, json={"task_id": "new-task"})
+        response = task_manager.submit_area_task(
+            geo_json=_area_params(task_manager)['params']['geo'],
+            start_date="01-01-2023", end_date="01-31-2023", layers=LAYERS
+        )
+
+    assert response['task_id'] == 'known-task' and response['reused']
+    assert not post.called
+
+def test_remote_listing_hit_is_recorded(tmp_path):
+    """A matching completed task from the /task listing is reused and recorded locally."""
+    registry = TaskRegistry(path=os.path.join(tmp_path, 'registry.json'))
+    task_manager = TaskManagement(token='token', registry=registry)
+    listed = {**_area_params(task_manager), "task_id": "remote-task", "status": "done"}
+
+    with requests_mock.Mocker() as mocker:
+        mocker.get(f"{base_url}/task", json=[{"task_id": "failed", "status": "error", **_area_params(task_manager)}, listed])
+        response = task_manager.submit_task(_area_params(task_manager), search_listing=True)
+
+    assert response['task_id'] == 'remote-task'
+    assert registry.get(fingerprint_task(listed)) == 'remote-task'
+
+def test_new_request_is_submitted_and_recorded(tmp_path):
+    """Without a match the task is submitted and its fingerprint recorded."""
+    registry = TaskRegistry(path=os.path.join(tmp_path, 'registry.json'))
+    task_manager = TaskManagement(token='token', registry=registry)
+
+    with requests_mock.Mocker() as mocker:
+        mocker.post(f"{base_url}/task", status_code=202, json={"task_id": "new-task"})
+        response = task_manager.submit_point_task(
+            latitude=40.7, longitude=-74.0, product_id='MOD11A1.061', band_names=['LST_Day_1km'],
+            start_date=datetime(2023, 1, 1), end_date=datetime(2023, 1, 31)
+        )
+        task_params = mocker.last_request.json()
+
+    assert response['task_id'] == 'new-task' and 'reused' not in response
+    assert registry.get(fingerprint_task(task_params)) == 'new-task'
+    # Only the registry is looked up by default: the submission is the only request
+    assert mocker.call_count == 1
+
+def test_tasks_of_another_account_are_not_reused(tmp_path):
+    """A registry shared by several accounts only hands each manager the tasks its own account submitted."""
+    registry = TaskRegistry(path=os.path.join(tmp_path, 'registry.json'))
+    task_manager = TaskManagement(token='token', registry=registry, owner='a')
+    fingerprint = fingerprint_task(_area_params(task_manager))
+    registry.record(fingerprint, 'task-of-b', owner='b')
+
+    with requests_mock.Mocker() as mocker:
+        post = mocker.post(f"{base_url}/task", status_code=202, json={"task_id": "task-of-a"})
+        response = task_manager.submit_task(_area_params(task_manager))
+
+    assert response['task_id'] == 'task-of-a' and post.call_count == 1
+    assert registry.lookup(fingerprint)['owner'] == 'a'
+
+def test_concurrent_writers_keep_every_entry(tmp_path):
+    """Registries sharing a file, as in separate processes, never lose each other's updates."""
+    path = os.path.join(tmp_path, 'registry.json')
+    barrier = threading.Barrier(8)
+
+    def worker(index):
+        registry = TaskRegistry(path=path)
+        barrier.wait()
+        for entry in range(10):
+            registry.record(f"fingerprint-{index}-{entry}", f"task-{index}-{entry}")
+
+    threads = [threading.Thread(target=worker, args=(index,)) for index in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    registry = TaskRegistry(path=path)
+    assert all(registry.get(f"fingerprint-{index}-{entry}") == f"task-{index}-{entry}" for index in range(8) for entry in range(10))
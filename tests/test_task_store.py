@@ -0,0 +1,111 @@
+# tests.test_task_store.py
+import os
+import re
+import threading
+from datetime import datetime
+
+import requests_mock
+
+from src.appeears_client.config import base_url
+from src.appeears_client.task_store import TaskStore
+from src.appeears_client.task_registry import fingerprint_task
+from src.appeears_client.task_orchestrator import TaskOrchestrator
+
+GEO_JSON = {"type": "Polygon", "coordinates": [[[0, 0], [1, 0], [1, 1], [0, 0]]]}
+
+def _run_area_task(orchestrator):
+    return orchestrator.execute_and_retrieve_area_task(
+        geo_json=GEO_JSON, product_id='MOD11A1.061', band_names=['LST_Day_1km'],
+        start_date=datetime(2023, 1, 1), end_date=datetime(2023, 1, 31)
+    )
+
+def test_orchestrator_reattaches_after_restart(tmp_path):
+    """A new orchestrator sharing the store polls the stored task instead of submitting again."""
+    store_path = os.path.join(tmp_path, 'tasks.sqlite3')
+    files = [{"file_id": "1", "file_name": "MOD11A1.061_LST_Day_1km_doy2023001_aid0001.tif"}]
+
+    with requests_mock.Mocker() as mocker:
+        post = mocker.post(f"{base_url}/task", status_code=202, json={"task_id": "stored-task"})
+        mocker.get(re.compile(f"{base_url}/status/.*"), json={"status": "done"})
+        mocker.get(f"{base_url}/task/stored-task", json={"task_id": "stored-task", "status": "processing"})
+        mocker.get(f"{base_url}/bundle/stored-task", json={"files": files})
+
+        # Simulate a crash right after submission: the job is in flight in the store
+        first = TaskOrchestrator(token='token', task_store=TaskStore(path=store_path))
+        first._submit(first.task_manager.build_area_task_params(
+            geo_json=GEO_JSON, start_date="01-01-2023", end_date="01-31-2023",
+            layers=[{"product": "MOD11A1.061", "layer": "LST_Day_1km"}]
+        ))
+        assert [job['task_id'] for job in TaskStore(path=store_path).in_flight_jobs()] == ['stored-task']
+
+        restarted = TaskOrchestrator(token='token', task_store=TaskStore(path=store_path))
+        assert _run_area_task(restarted) == files
+
+    assert post.call_count == 1
+    store = TaskStore(path=store_path)
+    assert store.in_flight_jobs() == []
+
+def test_purged_task_is_resubmitted_and_polled_statuses_are_stored(tmp_path):
+    """A stored task the server no longer knows is submitted again, and its replacement's progress is persisted."""
+    store = TaskStore(path=os.path.join(tmp_path, 'tasks.sqlite3'))
+    orchestrator = TaskOrchestrator(token='token', task_store=store, poll_interval=0)
+    task_params = orchestrator.task_manager.build_area_task_params(
+        geo_json=GEO_JSON, start_date="01-01-2023", end_date="01-31-2023",
+        layers=[{"product": "MOD11A1.061", "layer": "LST_Day_1km"}]
+    )
+    job_key = fingerprint_task(task_params)
+    store.claim(job_key, task_params['params'])
+    store.set_task_id(job_key, 'purged-task')
+    store.update_task('purged-task', status='done', bundle=[])
+    stored_statuses = []
+
+    def status_callback(request, context):
+        stored_statuses.append(store.get_job(job_key)['status'])
+        return {"status": ["queued", "processing", "done"][len(stored_statuses) - 1]}
+
+    files = [{"file_id": "1", "file_name": "MOD11A1.061_LST_Day_1km_doy2023001_aid0001.tif"}]
+    with requests_mock.Mocker() as mocker:
+        mocker.get(f"{base_url}/task/purged-task", status_code=404)
+        post = mocker.post(f"{base_url}/task", status_code=202, json={"task_id": "new-task"})
+        mocker.get(f"{base_url}/status/new-task", json=status_callback)
+        mocker.get(f"{base_url}/bundle/new-task", json={"files": files})
+        assert _run_area_task(orchestrator) == files
+
+    assert post.call_count == 1
+    assert stored_statuses == ['submitted', 'queued', 'processing']
+    job = store.get_job(job_key)
+    assert (job['task_id'], job['status'], job['bundle']) == ('new-task', 'done', files)
+
+def test_concurrent_workers_submit_a_job_once(tmp_path):
+    """Only one of several workers racing on the same job submits it, the others reuse its task_id."""
+    store_path = os.path.join(tmp_path, 'tasks.sqlite3')
+    TaskStore(path=store_path)
+    results, barrier = [], threading.Barrier(5)
+
+    def worker():
+        store = TaskStore(path=store_path)
+        barrier.wait()
+        job = store.claim('job-key', {"dates": []}, poll_interval=0.01)
+        if job['claimed']:
+            store.set_task_id('job-key', f"task-{threading.get_ident()}")
+        results.append((job['claimed'], store.get_job('job-key')['task_id']))
+
+    threads = [threading.Thread(target=worker) for _ in range(5)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert sum(claimed for claimed, _ in results) == 1
+    assert len({task_id for _, task_id in results}) == 1
+
+def test_download_progress_is_recorded(tmp_path):
+    """Downloaded files are tracked per task so a resumed run can skip them."""
+    store = TaskStore(path=os.path.join(tmp_path, 'tasks.sqlite3'))
+    store.claim('job-key', {})
+    store.set_task_id('job-key', 'task-1')
+    store.mark_downloaded('task-1', 'file-1', 'a.tif', '/data/a.tif')
+    assert store.downloaded_files('task-1') == {'file-1': '/data/a.tif'}
+
+    store.release('job-key')
+    assert store.claim('job-key', {})['claimed']
@@ -0,0 +1,52 @@
+# tests.test_token_cache.py
+import os
+import time
+import stat
+import threading
+
+import requests_mock
+
+from src.appeears_client.auth import AppEEARSClient
+from src.appeears_client.config import base_url
+from src.appeears_client.token_cache import TokenCache
+
+def test_clients_reuse_a_cached_token(tmp_path):
+    """Clients sharing a cache log in once, and the token is stored with owner-only permissions."""
+    cache = TokenCache(path=os.path.join(tmp_path, 'tokens.json'))
+    with requests_mock.Mocker() as mocker:
+        login = mocker.post(f"{base_url}/login", json={"token": "token-1", "expiration": "2999-01-01T00:00:00Z"})
+        clients = [AppEEARSClient('user', 'password', token_cache=cache) for _ in range(3)]
+
+    assert login.call_count == 1
+    assert {client.token for client in clients} == {"token-1"}
+    assert stat.S_IMODE(os.stat(cache.path).st_mode) == 0o600
+
+def test_concurrent_workers_log_in_once(tmp_path):
+    path = os.path.join(tmp_path, 'tokens.json')
+    tokens, barrier = [], threading.Barrier(8)
+
+    def worker():
+        barrier.wait()
+        tokens.append(TokenCache(path=path).get_or_login('user', lambda: (f"token-{threading.get_ident()}", time.time() + 7200)))
+
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert len(tokens) == 8 and len(set(tokens)) == 1
+
+def test_expiring_tokens_are_refreshed(tmp_path):
+    cache = TokenCache(path=os.path.join(tmp_path, 'tokens.json'), refresh_margin=3600)
+    cache.put('user', 'old-token', time.time() + 600)
+    assert cache.get('user') is None
+    assert cache.get_or_login('user', lambda: ('new-token', time.time() + 7200)) == 'new-token'
+    assert cache.get('user') == 'new-token'
+
+def test_logout_removes_the_token(tmp_path):
+    cache = TokenCache(path=os.path.join(tmp_path, 'tokens.json'))
+    with requests_mock.Mocker() as mocker:
+        mocker.post(f"{base_url}/login", json={"token": "token-1", "expiration": "2999-01-01T00:00:00Z"})
+        mocker.post(f"{base_url}/logout", status_code=204)
+        AppEEARSClient('user', 'password', token_cache=cache).logout()
+    assert cache.get('user') is None
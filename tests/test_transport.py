@@ -0,0 +1,93 @@
+# tests.test_transport.py
+import os
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import requests_mock
+
+from src.appeears import APIClient
+from src.appeears_client.auth import AppEEARSClient
+from src.appeears_client.config import base_url
+from src.appeears_client.transport import CredentialProvider, Transport
+from src.appeears_client.task_management import TaskManagement
+from src.appeears_client.product_management import ProductManagement
+
+def _status_callback(request, context):
+    if request.headers['Authorization'] != 'Bearer fresh-token':
+        context.status_code = 401
+        return {"message": "Unauthorized"}
+    return {"status": "done"}
+
+def test_expired_token_is_refreshed_once_for_all_managers():
+    """Concurrent calls failing with 401 trigger a single login, and every manager uses the new token."""
+    with requests_mock.Mocker() as mocker:
+        logins = iter(["stale-token", "fresh-token", "unexpected-token"])
+        login = mocker.post(f"{base_url}/login", json=lambda request, context: {"token": next(logins)})
+        mocker.get(f"{base_url}/status/task-1", json=_status_callback)
+        mocker.get(f"{base_url}/product/MOD11A1.061", json=_status_callback)
+
+        client = AppEEARSClient('user', 'password')
+        transport = Transport(client)
+        task_manager = TaskManagement(transport=transport)
+        product_manager = ProductManagement(transport=transport)
+
+        barrier = threading.Barrier(8)
+        statuses = []
+
+        def worker():
+            barrier.wait()
+            statuses.append(transport.get(f"{base_url}/status/task-1").status_code)
+
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert statuses == [200] * 8
+        assert login.call_count == 2
+        assert task_manager.token == product_manager.token == client.token == 'fresh-token'
+        assert product_manager.get_product('MOD11A1.061') == {"status": "done"}
+
+def test_fixed_token_is_not_retried():
+    with requests_mock.Mocker() as mocker:
+        status = mocker.get(f"{base_url}/status/task-1", status_code=401, json={})
+        assert TaskManagement(token='token').transport.get(f"{base_url}/status/task-1").status_code == 401
+    assert status.call_count == 1
+
+def test_session_is_shared_by_threads_and_recreated_after_fork():
+    transport = Transport(CredentialProvider(token='token'))
+    sessions = set()
+    threads = [threading.Thread(target=lambda: sessions.add(id(transport.session))) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert sessions == {id(transport.session)}
+
+    read_end, write_end = os.pipe()
+    parent_session = transport.session
+    pid = os.fork()
+    if pid == 0:
+        os.write(write_end, b'1' if transport.session is not parent_session else b'0')
+        os._exit(0)
+    os.waitpid(pid, 0)
+    assert os.read(read_end, 1) == b'1'
+    assert transport.session is parent_session
+
+def test_api_client_is_shared_by_threads():
+    """One client serves many threads with a single login and the same managers."""
+    with requests_mock.Mocker() as mocker:
+        login = mocker.post(f"{base_url}/login", json={"token": "token-1"})
+        mocker.get(re.compile(f"{base_url}/product/.+"), json={"Layer": {}})
+        client = APIClient(username='user', password='password')
+        managers = client.product_manager
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = list(executor.map(lambda _: client.get_product_info('MOD11A1.061'), range(32)))
+
+    assert results == [{"Layer": {}}] * 32
+    assert login.call_count == 1
+    client.refresh_clients()
+    assert client.product_manager is managers